@@ -0,0 +1,339 @@
+"""
+Benchmarks for the hot paths of the library.
+
+Every scenario runs headless using synthetic poses, so no webcam
+or display is required. Results are written as json so runs from
+different versions of the library can be compared:
+
+> python ./bin/benchmarks/benchmark.py --output new.json --compare old.json
+"""
+import argparse
+from importlib import metadata
+import json
+import os
+from pathlib import Path
+import platform
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+import multiprocessing as mp
+
+# Must be set before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import cvgui  # noqa: E402
+
+WINDOW_WIDTH = 1280
+WINDOW_HEIGHT = 720
+
+
+class SyntheticPoses:
+    """Pose queue that always has a new pose available."""
+
+    def __init__(self, count: int = 256, seed: int = 0) -> None:
+        rng = np.random.default_rng(seed)
+        self.poses = rng.uniform(-1, 1, (count, 33, 4))
+        self.index = 0
+
+    def empty(self) -> bool:
+        return False
+
+    def get(self) -> np.ndarray:
+        self.index += 1
+        return self.poses[self.index % len(self.poses)].copy()
+
+
+def make_ui(backend: str) -> Any:
+    """Create a user interface that does not need a display."""
+    if backend == "opencv":
+        return cvgui.OpenCVUI(height=WINDOW_HEIGHT, width=WINDOW_WIDTH,
+                              show=False)
+    return cvgui.HeadlessPyGameUI(height=WINDOW_HEIGHT, width=WINDOW_WIDTH)
+
+
+def run_frames(ui: Any, components: List[Any],
+               frames: int) -> cvgui.FrameProfiler:
+    """Render the given components and profile each frame."""
+    # Stop after the requested number of frames
+    scene_frames = [0]
+
+    def frame_callback() -> None:
+        scene_frames[0] += 1
+        if scene_frames[0] >= frames:
+            ui.running = False
+
+    profiler = cvgui.FrameProfiler(window=frames)
+    activity = cvgui.Activity(pose_input=None, frontend=ui,
+                              profiler=profiler)
+    scene = cvgui.Scene()
+    scene.frame_callback = frame_callback
+    for component in components:
+        scene.add_component(component)
+    activity.add_scene(scene)
+    activity.update_ui(SyntheticPoses())
+    return profiler
+
+
+def stage_metrics(profiler: cvgui.FrameProfiler,
+                  stages: List[str]) -> Dict[str, float]:
+    """Flatten the percentiles of the given stages."""
+    percentiles = profiler.percentiles()
+    return {f"{stage}_{name}_ms": value for stage in stages
+            for name, value in percentiles[stage].items()}
+
+
+def bench_render(backend: str, skeletons: int,
+                 frames: int) -> Dict[str, float]:
+    """Render N skeletons per frame."""
+    ui = make_ui(backend)
+    components = [cvgui.skeleton(gui=ui, pos=(WINDOW_WIDTH // 2,
+                                              WINDOW_HEIGHT // 2),
+                                 scale=cvgui.BlazePose.DEFAULT_SCALE)
+                  for _ in range(skeletons)]
+    return stage_metrics(run_frames(ui, components, frames),
+                         ["render", "total"])
+
+
+def bench_hit_test(buttons: int, frames: int) -> Dict[str, float]:
+    """Hit-test M buttons against every landmark per frame."""
+    ui = make_ui("pygame")
+    rng = np.random.default_rng(1)
+    components: List[Any] = [cvgui.skeleton(
+        gui=ui, pos=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2),
+        scale=cvgui.BlazePose.DEFAULT_SCALE)]
+    for _ in range(buttons):
+        button = cvgui.button(gui=ui, pos=(rng.uniform(0, WINDOW_WIDTH),
+                                           rng.uniform(0, WINDOW_HEIGHT)),
+                              activation_distance=50, radius=50)
+        button.targets = list(range(33))
+        button.callback = lambda: None
+        components.append(button)
+    return stage_metrics(run_frames(ui, components, frames),
+                         ["hit_test", "total"])
+
+
+def _produce(queues: List[Any], poses: int) -> None:
+    pose = np.zeros((33, 4))
+    for _ in range(poses):
+        for queue in queues:
+            queue.put(pose)
+
+
+def _consume(queue: Any, poses: int) -> None:
+    for _ in range(poses):
+        queue.get()
+
+
+def bench_ipc(consumers: int, queue_type: str,
+              poses: int) -> Dict[str, float]:
+    """Send poses from one process to K consumer processes."""
+    make_queue: Callable[[], Any] = mp.Queue if queue_type == "mp.Queue" \
+        else lambda: cvgui.Channel(capacity=1024,
+                                   policy=cvgui.ChannelPolicy.BLOCK)
+    queues = [make_queue() for _ in range(consumers)]
+    processes = [mp.Process(target=_consume, args=(queue, poses))
+                 for queue in queues]
+    processes.append(mp.Process(target=_produce, args=(queues, poses)))
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+    return {"poses_per_s": poses / elapsed,
+            "deliveries_per_s": poses * consumers / elapsed}
+
+
+def bench_csv_logger(streaming: bool, session_seconds: float, fps: int,
+                     time_limit: float) -> Dict[str, float]:
+    """Send a session's worth of poses to a CSVPoseLogger's process."""
+    rows = int(session_seconds * fps)
+    poses = SyntheticPoses()
+    metrics: Dict[str, float] = {"rows_target": rows}
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = Path(directory) / "bench.csv"
+        logger = cvgui.CSVPoseLogger(filepath, streaming=streaming)
+        # Lossless like a pipeline's logger channels, so once the
+        # channel fills up poses are sent as fast as they are logged
+        channel = cvgui.Channel(capacity=1024,
+                                policy=cvgui.ChannelPolicy.BLOCK)
+        process, = logger.start(channel)
+        # Time the ingest rate at each tenth of the session to show
+        # whether ingest slows down as the session goes on.
+        checkpoint = max(rows // 10, 1)
+        start = segment_start = time.perf_counter()
+        sent = 0
+        while sent < rows:
+            channel.put(poses.get())
+            sent += 1
+            if sent % checkpoint == 0:
+                now = time.perf_counter()
+                decile = sent // checkpoint
+                metrics[f"rows_per_s_decile_{decile:02d}"] = \
+                    checkpoint / (now - segment_start)
+                segment_start = now
+                if now - start > time_limit:
+                    break
+        # Poses still in the channel when the logger is closed
+        # are not logged
+        while channel.depth > 0:
+            time.sleep(0.001)
+        metrics["ingest_s"] = time.perf_counter() - start
+        save_start = time.perf_counter()
+        logger.close()
+        process.join()
+        metrics["save_s"] = time.perf_counter() - save_start
+        with open(filepath, encoding="utf-8") as file:
+            metrics["rows_ingested"] = sum(1 for _ in file) - 1
+    return metrics
+
+
+def _contend(settings: cvgui.ProcessSettings, seconds: float) -> None:
+    """Keep the cpu busy like an inference process would."""
+    settings.apply()
+    import cv2
+    rng = np.random.default_rng(2)
+    matrix = rng.uniform(size=(256, 256))
+    image = rng.integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        matrix @ matrix
+        cv2.GaussianBlur(image, (15, 15), 0)
+
+
+def bench_affinity(pinned: bool, workers: int,
+                   frames: int) -> Dict[str, float]:
+    """Render frames while worker processes compete for the cpu.
+
+    Pinned runs keep the user interface on the first core, and give
+    the workers the other cores, a lower priority, and one thread
+    each. On a machine with a single core every process shares it.
+    """
+    cpus = sorted(os.sched_getaffinity(0)) \
+        if hasattr(os, "sched_getaffinity") else []
+    if pinned:
+        ui_settings = cvgui.ProcessSettings(cpus=cpus[:1] or None)
+        worker_settings = cvgui.ProcessSettings(
+            cpus=cpus[1:] or cpus or None, nice=10, threads=1)
+    else:
+        ui_settings = worker_settings = cvgui.ProcessSettings()
+    processes = [mp.Process(target=_contend,
+                            args=(worker_settings, 3600), daemon=True)
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+    ui = make_ui("pygame")
+    components = [cvgui.skeleton(gui=ui, pos=(WINDOW_WIDTH // 2,
+                                              WINDOW_HEIGHT // 2),
+                                 scale=cvgui.BlazePose.DEFAULT_SCALE)
+                  for _ in range(4)]
+    try:
+        ui_settings.apply()
+        profiler = run_frames(ui, components, frames)
+    finally:
+        for process in processes:
+            process.kill()
+            process.join()
+        if cpus:
+            os.sched_setaffinity(0, cpus)
+    metrics = stage_metrics(profiler, ["total"])
+    metrics["total_jitter_ms"] = \
+        metrics["total_p99_ms"] - metrics["total_p50_ms"]
+    return metrics
+
+
+def scenarios(quick: bool) -> Dict[str, List[Dict[str, Any]]]:
+    """The parameters each benchmark is run with."""
+    frames = 60 if quick else 600
+    return {
+        "render": [{"backend": backend, "skeletons": n, "frames": frames}
+                   for backend in ("pygame", "opencv")
+                   for n in (1, 4, 16)],
+        "hit_test": [{"buttons": m, "frames": frames}
+                     for m in (1, 10, 100)],
+        "ipc": [{"consumers": k, "queue_type": queue_type,
+                 "poses": 2000 if quick else 20000}
+                for queue_type in ("mp.Queue", "Channel")
+                for k in (1, 2, 4)],
+        "csv_logger": [{"streaming": streaming,
+                        "session_seconds": 60 if quick else 3600,
+                        "fps": 30,
+                        "time_limit": 10 if quick else 300}
+                       for streaming in (False, True)],
+        "affinity": [{"pinned": pinned, "workers": workers,
+                      "frames": frames}
+                     for workers in (0, 4)
+                     for pinned in (False, True)],
+    }
+
+
+BENCHMARKS: Dict[str, Callable[..., Dict[str, float]]] = {
+    "render": bench_render,
+    "hit_test": bench_hit_test,
+    "ipc": bench_ipc,
+    "csv_logger": bench_csv_logger,
+    "affinity": bench_affinity,
+}
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: Path) -> None:
+    """Print each metric next to the same metric from a previous run."""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = {json.dumps([result["name"], result["params"]]):
+                    result["metrics"] for result in json.load(file)["results"]}
+    for result in results:
+        key = json.dumps([result["name"], result["params"]])
+        if key not in baseline:
+            continue
+        for metric, value in result["metrics"].items():
+            old = baseline[key].get(metric)
+            if not old:
+                continue
+            print(f"{result['name']} {result['params']} {metric}: "
+                  f"{old:.4g} -> {value:.4g} ({value / old:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--output", type=Path,
+                        default=Path("bench_output.json"))
+    parser.add_argument("--quick", action="store_true",
+                        help="Run smaller scenarios")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS),
+                        default=list(BENCHMARKS))
+    parser.add_argument("--compare", type=Path,
+                        help="Previous results to compare against")
+    args = parser.parse_args()
+
+    try:
+        version = metadata.version("cvgui")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    results: List[Dict[str, Any]] = []
+    for name, param_sets in scenarios(args.quick).items():
+        if name not in args.only:
+            continue
+        for params in param_sets:
+            print(f"Running {name} {params}...")
+            metrics = BENCHMARKS[name](**params)
+            results.append({"name": name, "params": params,
+                            "metrics": metrics})
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"cvgui_version": version,
+                   "python": platform.python_version(),
+                   "platform": platform.platform(),
+                   "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                   "results": results}, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+# Everything must be run under "__name__ == __main__"
+# for windows multiprocessing
+if __name__ == "__main__":
+    main()
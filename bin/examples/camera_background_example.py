@@ -0,0 +1,51 @@
+"""
+Example program that shows the camera feed behind the
+activity instead of in a separate window. Frames are shared
+with the user interface through shared memory and downscaled
+before they are handed over.
+"""
+import cvgui
+
+WINDOW_WIDTH = 1280
+WINDOW_HEIGHT = 720
+WINDOW_FPS = 60
+
+
+def main():
+    # Frames are resized to half the window size as they are
+    # captured, which keeps the cost of drawing them low.
+    frame_buffer = cvgui.FrameBuffer(height=WINDOW_HEIGHT // 2,
+                                     width=WINDOW_WIDTH // 2)
+
+    # Specify input as a webcam and computer vision model as blazepose
+    frame_input = cvgui.Webcam(device_num=0, fps=30)
+    cv_model = cvgui.BlazePose()
+
+    # Write captured frames to the frame buffer instead of
+    # showing them in their own window
+    pose_input = cvgui.ComputerVisionPose(
+        frame_input=frame_input, model=cv_model,
+        frame_buffer=frame_buffer, show_video=False)
+
+    # Draw the latest frame behind the components every frame
+    ui = cvgui.PyGameUI(width=WINDOW_WIDTH, height=WINDOW_HEIGHT,
+                        fps=WINDOW_FPS, background=frame_buffer)
+
+    activity = cvgui.Activity(pose_input=pose_input, frontend=ui)
+
+    scene_1 = cvgui.Scene()
+    activity.add_scene(scene_1)
+
+    skeleton = cvgui.skeleton(gui=ui, pos=(WINDOW_WIDTH//2,
+                                           WINDOW_HEIGHT//2),
+                              scale=cv_model.DEFAULT_SCALE)
+    scene_1.add_component(skeleton)
+
+    try:
+        activity.run()
+    finally:
+        frame_buffer.close()
+
+
+if __name__ == "__main__":
+    main()
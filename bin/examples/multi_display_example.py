@@ -0,0 +1,61 @@
+"""
+Example program that runs an operator console and a participant
+display side by side from a single webcam and model. Each activity
+gets its own window and process, and both read the poses of one
+shared pipeline, so the second window costs no extra inference.
+"""
+import cvgui
+
+WINDOW_WIDTH = 1280
+WINDOW_HEIGHT = 720
+WINDOW_FPS = 60
+
+
+def participant_display() -> cvgui.Activity:
+    """A full size skeleton for the participant to follow."""
+    ui = cvgui.PyGameUI(width=WINDOW_WIDTH,
+                        height=WINDOW_HEIGHT, fps=WINDOW_FPS)
+    activity = cvgui.Activity(pose_input=None, frontend=ui)
+    scene = cvgui.Scene()
+    activity.add_scene(scene)
+    scene.add_component(cvgui.skeleton(
+        gui=ui, pos=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2),
+        scale=cvgui.BlazePose.DEFAULT_SCALE))
+    return activity
+
+
+def operator_console() -> cvgui.Activity:
+    """A small skeleton and the participant's recent movement."""
+    ui = cvgui.PyGameUI(width=WINDOW_WIDTH//2,
+                        height=WINDOW_HEIGHT//2, fps=WINDOW_FPS)
+    activity = cvgui.Activity(pose_input=None, frontend=ui)
+    scene = cvgui.Scene()
+    activity.add_scene(scene)
+    scene.add_component(cvgui.skeleton(
+        gui=ui, pos=(WINDOW_WIDTH//4, WINDOW_HEIGHT//4),
+        scale=cvgui.BlazePose.DEFAULT_SCALE//2))
+
+    def report_motion() -> None:
+        _, poses = activity.pose_history.since(1.0)
+        if len(poses) > 1:
+            hand = poses[:, cvgui.BlazePose.LEFT_HAND, :2]
+            print(f"Left hand moved {abs(hand[-1] - hand[0]).sum():.2f}"
+                  " in the last second", end="\r")
+    scene.frame_callback = report_motion
+    return activity
+
+
+def main():
+    pose_input = cvgui.ComputerVisionPose(
+        frame_input=cvgui.Webcam(device_num=0, fps=30),
+        model=cvgui.BlazePose(), show_video=False)
+    pipeline = cvgui.PosePipeline(pose_input)
+
+    group = cvgui.ActivityGroup(pipeline, [participant_display,
+                                           operator_console])
+    group.run()
+    pipeline.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Example program that shows how to drive an activity with poses
+sent over the network. A synthetic sender stands in for a
+motion capture system or a dedicated inference box, and sends
+a pose waving its left hand over UDP with uneven delays.
+"""
+import multiprocessing as mp
+import random
+import time
+import numpy as np
+import cvgui
+
+WINDOW_WIDTH = 1280
+WINDOW_HEIGHT = 720
+WINDOW_FPS = 60
+PORT = 9870
+
+
+def send_poses() -> None:
+    """Send a waving pose 30 times a second with network jitter."""
+    sender = cvgui.PoseSender(port=PORT)
+    pose = np.random.default_rng(0).uniform(-0.5, 0.5, (33, 4))
+    while True:
+        captured = time.monotonic()
+        pose[cvgui.BlazePose.LEFT_HAND, 1] = -0.5 + 0.3 * np.sin(captured)
+        # Pretend the network delays some packets
+        time.sleep(random.uniform(0, 0.02))
+        sender.send(pose, timestamp=captured)
+        time.sleep(1 / 30)
+
+
+def main():
+    mp.Process(target=send_poses, daemon=True).start()
+
+    # Receive poses from the network instead of a webcam
+    pose_input = cvgui.NetworkPose(port=PORT)
+
+    ui = cvgui.PyGameUI(width=WINDOW_WIDTH,
+                        height=WINDOW_HEIGHT, fps=WINDOW_FPS)
+    activity = cvgui.Activity(pose_input=pose_input, frontend=ui)
+
+    scene = cvgui.Scene()
+    activity.add_scene(scene)
+    scene.add_component(cvgui.skeleton(
+        gui=ui, pos=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2),
+        scale=cvgui.BlazePose.DEFAULT_SCALE))
+
+    activity.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 
 from .outputs import *  # noqa
 from .core import *  # noqa
+from .pipeline import *  # noqa
 from .inputs.computer_vision import *  # noqa
+from .inputs.network import *  # noqa
 from .user_interface import *  # noqa
 from .activity import *  # noqa
@@ -11,3 +11,8 @@ those interfaces.
 """
 from .activity import Activity  # noqa
 from .scene import Scene  # noqa
+from .group import ActivityGroup  # noqa
+from .executor import CallbackExecutor  # noqa
+from .gestures import GestureEngine, GestureEvent, GestureType  # noqa
+from .profiler import FrameProfiler  # noqa
+from .features import Limb, PoseFeatures  # noqa
@@ -6,34 +6,62 @@ to run concurrently and create a coherent flow of information.
 """
 import sys
 import time
-from typing import List
-import multiprocessing as mp
+from typing import Any, Callable, List, Optional, Set
 import multiprocessing.queues as mpq
 import numpy as np
+from cvgui.activity.executor import CallbackExecutor
+from cvgui.activity.features import PoseFeatures
+from cvgui.activity.gestures import GestureEngine, GestureEvent, \
+    GestureType, visible_points
+from cvgui.activity.profiler import FrameProfiler
 from cvgui.activity.scene import Scene
 from cvgui.core.displaying import UserInterface
-from cvgui.core.displaying.components import Button, Skeleton, TrackingBubble
-from cvgui.core.receiving import PoseGenerator
-from cvgui.core.logging import PoseLogger
+from cvgui.core.displaying.components import Skeleton
+from cvgui.core.receiving import BLAZEPOSE_LANDMARKS, CVModel, \
+    PoseGenerator, detected
+from cvgui.core.logging import PoseLogger, PoseSink
+from cvgui.pipeline import PoseHistory, PosePipeline, ProcessSettings
 
 X = 0
 Y = 1
 
 
+# pylint: disable-next=too-many-instance-attributes
 class Activity:
     """A collection of scenes and the abstract logic \
     for their interaction."""
 
-    # Private variables
-    _scenes: List[Scene] = []
+    ui_channel_capacity: int = 1
+    """How many poses can wait for the user interface. The \
+        user interface always renders the newest pose, so \
+            older poses are discarded."""
 
-    _active_scene: int = 0
-    """The index of the scene to render."""
+    logger_channel_capacity: int = 1024
+    """How many poses can wait for each pose logger before \
+        the pose input blocks. Logging is lossless, so poses \
+            are never discarded."""
 
-    pose_loggers: List[PoseLogger] = []
+    pose_history_capacity: int = 300
+    """How many of the most recent poses to keep in the \
+        activity's pose history."""
 
+    ui_settings: Optional[ProcessSettings] = None
+    """The cores, priority, and thread caps of the process that \
+        runs the user interface. Applied once the pipeline's \
+            processes have started, so they do not inherit them."""
+
+    hub_settings: Optional[ProcessSettings] = None
+    """The cores, priority, and thread caps of the logging hub's \
+        process when the activity starts its own pipeline."""
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
     def __init__(self, pose_input: PoseGenerator,
-                 frontend: UserInterface) -> None:
+                 frontend: UserInterface,
+                 callback_executor: Optional[CallbackExecutor] = None,
+                 profiler: Optional[FrameProfiler] = None,
+                 pipeline: Optional[PosePipeline] = None,
+                 model: Optional[CVModel] = None
+                 ) -> None:
         """
         Create a new activity.
 
@@ -41,9 +69,54 @@ class Activity:
             pose_input (PoseGenerator): An object that can generate poses.
             frontend (UserInterface): An object that can create a
                 user interface.
+            callback_executor (Optional[CallbackExecutor], optional): \
+                Runs button and frame callbacks off of the render \
+                    loop. Defaults to None, meaning callbacks run \
+                        during the frame.
+            profiler (Optional[FrameProfiler], optional): Records \
+                how long each stage of a frame takes. Defaults to \
+                    None, meaning frames are not profiled.
+            pipeline (Optional[PosePipeline], optional): A pipeline \
+                to attach to when the activity runs instead of starting \
+                    and stopping one for every run. Its pose input is \
+                        used instead of `pose_input`. Defaults to None.
+            model (Optional[CVModel], optional): The model whose \
+                landmark constants describe poses, used to compute \
+                    `features`. Defaults to None, meaning the model of \
+                        the pose input is used if it has one.
         """
         self.pose_input: PoseGenerator = pose_input
         self.frontend: UserInterface = frontend
+        self.callback_executor: Optional[CallbackExecutor] = \
+            callback_executor
+        self.profiler: Optional[FrameProfiler] = profiler
+        self.pipeline: Optional[PosePipeline] = pipeline
+        if model is None:
+            source: Optional[PoseGenerator] = pose_input \
+                if pipeline is None else pipeline.pose_input
+            model = getattr(source, "model", None)
+        self.model: Optional[CVModel] = model
+        self.pose_history: Optional[PoseHistory] = None
+        """The most recent poses and when they were recieved. \
+            Available to callbacks and components while the \
+                activity is running."""
+        self.features: Optional[PoseFeatures] = None
+        """Joint angles, limb lengths, velocities, and more of the \
+            current pose, computed once per pose when first used. \
+                Available to callbacks and components while the \
+                    activity is running if it has a model."""
+        self.gestures: GestureEngine = GestureEngine()
+        """Recognizes gestures made on the active scene's buttons. \
+            Subscribe to it to react to gestures other than clicks."""
+        self.sinks: List[PoseSink] = []
+        """Sinks that recieve poses while the activity runs. They \
+            all share the pipeline's logging hub process."""
+        self.pose_loggers: List[PoseLogger] = []
+        """Loggers that each run in their own process while the \
+            activity runs."""
+        self._scenes: List[Scene] = []
+        self._active_scene: int = 0
+        """The index of the scene to render."""
 
     def add_scene(self, scene: Scene) -> None:
         """Add a scene to the activity.
@@ -63,6 +136,16 @@ class Activity:
         """
         self.pose_loggers.append(logger)
 
+    def add_sink(self, sink: PoseSink) -> None:
+        """Add a pose sink to the activity. Every sink is run by \
+        the pipeline's logging hub, so unlike a pose logger, \
+        each sink does not need its own process or pose queue.
+
+        Args:
+            sink (PoseSink): The sink to add to the activity.
+        """
+        self.sinks.append(sink)
+
     def next_scene(self) -> None:
         """Set the active scene to the next scene in the scene array. \
         Circle back to the first scene if current active scene is the \
@@ -94,95 +177,284 @@ class Activity:
         return True
 
     def run(self) -> None:
-        """Infinitely retrieve pose data and \
-        render the components of added scenes."""
-        processes: List[mp.Process] = []
-
-        # Create a queue to allow the UI to
-        # recieve pose data.
-        ui_pose_queue: mpq.Queue = mp.Queue()
-        pose_queues: List[mpq.Queue] = [ui_pose_queue]
-
-        # Create a queue for each of the pose loggers
-        # to recieve pose data.
-        for logger in self.pose_loggers:
-            queue: mpq.Queue = mp.Queue()
-            pose_queues.append(queue)
-            processes += logger.start(queue)
-
-        # Start the pose input process. This will start sending pose data
-        # to all the queues specified above.
-        processes += self.pose_input.start(pose_queues)
+        """Retrieve pose data and render the components of added \
+        scenes until the user interface stops running.
+
+        Without a pipeline, a new one is started for the run and \
+        stopped afterwards. With a pipeline, the activity attaches \
+        to it and detaches from it, leaving it running.
+
+        Raises:
+            ValueError: If pose loggers were added to an activity \
+                with a pipeline. Add them to the pipeline instead.
+        """
+        owned: bool = self.pipeline is None
+        if not owned and self.pose_loggers:
+            raise ValueError("Pose loggers of an activity with a pipeline "
+                             "must be added to the pipeline")
+        pipeline: PosePipeline = self.pipeline or PosePipeline(
+            self.pose_input, self.pose_loggers,
+            ui_channel_capacity=self.ui_channel_capacity,
+            logger_channel_capacity=self.logger_channel_capacity,
+            pose_history_capacity=self.pose_history_capacity,
+            hub_settings=self.hub_settings)
+        pipeline.attach(self.sinks)
+        self.pose_history = pipeline.pose_history
+        if self.ui_settings is not None:
+            self.ui_settings.apply()
 
         try:
-            self.update_ui(ui_pose_queue)
+            self.update_ui(pipeline.ui_queue)
         except KeyboardInterrupt:
             print("Ctrl-C pressed. Exiting...")
-            for logger in self.pose_loggers:
-                logger.save()
-            # Give some time for files to be saved
-            time.sleep(5)
-            for process in processes:
-                process.kill()
+            self._shutdown(pipeline, owned)
+            if not owned:
+                raise
             sys.exit(0)
         except Exception as excpt:
-            for logger in self.pose_loggers:
-                logger.save()
-            # Give some time for files to be saved
-            time.sleep(5)
-            for process in processes:
-                process.kill()
+            self._shutdown(pipeline, owned)
             raise excpt
 
-        print("Pygame closed. Exiting...")
-        for logger in self.pose_loggers:
-            logger.save()
-        # Give some time for files to be saved
-        time.sleep(5)
-        for process in processes:
-            process.kill()
+        if owned:
+            print("Pygame closed. Exiting...")
+        self._shutdown(pipeline, owned)
+
+    def run_shared(self, history: PoseHistory) -> None:
+        """Render poses from a pose history shared by a pipeline in \
+        another process until the user interface stops running.
+
+        This is how each activity of a `cvgui.ActivityGroup` runs. \
+        The activity only reads the history, so any number of \
+        activities can share one pipeline's pose input.
+
+        Args:
+            history (PoseHistory): The pipeline's pose history.
+        """
+        self.pose_history = history
+        if self.ui_settings is not None:
+            self.ui_settings.apply()
+        try:
+            self.update_ui(history.reader())
+        finally:
+            self._release()
+
+    def _shutdown(self, pipeline: PosePipeline, owned: bool) -> None:
+        """Detach from the pipeline, stopping it if it was started \
+        just for this run.
+
+        Args:
+            pipeline (PosePipeline): The pipeline the activity ran on.
+            owned (bool): Whether the pipeline was started by `run`.
+        """
+        self._release()
+        pipeline.detach()
+        if owned:
+            pipeline.close()
+
+    def _release(self) -> None:
+        """Stop running callbacks and forget the poses of a run, \
+        leaving the activity ready to run again."""
+        if self.callback_executor is not None:
+            self.callback_executor.shutdown()
+        self.pose_history = None
+        self.features = None
 
     def update_ui(self, pose_queue: mpq.Queue) -> None:
         """Infinitely render the active scene \
             of the user interface.
 
         Args:
-            frontend (UserInterface): The user interface to update.
-            scenes (List[Scene]): The scenes for the activity being rendered.
+            pose_queue (mpq.Queue): The queue of poses to render.
         """
         self.frontend.new_gui()
-        pose_points: np.ndarray = np.zeros((33, 4))
+        pose: np.ndarray = np.zeros((
+            BLAZEPOSE_LANDMARKS if self.model is None
+            else self.model.NUM_LANDMARKS, 4))
+        self.features = None if self.model is None else \
+            PoseFeatures(pose, self.model, time.monotonic())
+        # Nobody is shown until a pose with a person arrives
+        present: bool = False
         while self.frontend.running:
+            if self.profiler is not None:
+                self.profiler.start_frame()
+
+            # Apply changes made by callbacks that finished
+            # running since the last frame.
+            if self.callback_executor is not None:
+                self.callback_executor.apply_mutations()
+            self._lap(FrameProfiler.CALLBACKS)
+
             self.frontend.clear()
+            self._lap(FrameProfiler.CLEAR)
+
+            scene: Scene = self._scenes[self._active_scene]
 
-            # Make sure the skeleton is updated first if it exists.
-            # That way button clicks aren't a frame late
-            for component in self._scenes[self._active_scene].components:
-                if isinstance(component, Skeleton):
-                    if pose_queue.empty():
-                        continue
-                    pose_points = pose_queue.get()
-                    # Scale the skeleton points and offset them
-                    pose_points[:, X] = pose_points[:, X] * \
-                        component.scale + component.pos[X]
-                    pose_points[:, Y] = pose_points[:, Y] * \
-                        component.scale + component.pos[Y]
-                    component.skeleton_points = pose_points
-                    break
-
-            for component in self._scenes[self._active_scene].components:
-                if isinstance(component, Button):
-                    for target in component.targets:
-                        if component.is_clicked(
-                                pos=(pose_points[target][X],
-                                     pose_points[target][Y])):
-                            component.callback()
-                if isinstance(component, TrackingBubble):
-                    component.pos = (pose_points[component.target][X],
-                                     pose_points[component.target][Y])
-
-                component.render(self.frontend.window)
-
-            self._scenes[self._active_scene].frame_callback()
+            # Only the newest pose is needed. It is never modified
+            # so that each skeleton can transform it differently.
+            received: Optional[float] = None
+            if not pose_queue.empty():
+                pose = pose_queue.get()
+                received = time.monotonic()
+                present = self._detect(pose, received)
+            default_view: Optional[Skeleton] = \
+                self._update_skeletons(scene, pose, present)
+            self._lap(FrameProfiler.POSE)
+
+            # Gestures only change when a new pose arrives.
+            if received is not None:
+                self._run_gesture_callbacks(self._update_gestures(
+                    scene, default_view, received, present))
+            hidden: Set[int] = \
+                self._place_tracking_bubbles(scene, default_view, present)
+            self._lap(FrameProfiler.HIT_TEST)
+
+            self._render(scene, hidden)
+            self._lap(FrameProfiler.RENDER)
+
+            self._run_callback(
+                self._scenes[self._active_scene].frame_callback)
+            self._lap(FrameProfiler.FRAME_CALLBACK)
 
             self.frontend.update()
+            self._lap(FrameProfiler.UPDATE)
+            if self.profiler is not None:
+                self.profiler.end_frame()
+
+    def _lap(self, stage: int) -> None:
+        """End a stage of the frame if frames are profiled.
+
+        Args:
+            stage (int): The `FrameProfiler` stage that ended.
+        """
+        if self.profiler is not None:
+            self.profiler.lap(stage)
+
+    def _detect(self, pose: np.ndarray, received: float) -> bool:
+        """Check if a new pose has a person in it, computing its \
+        features if the activity has a model.
+
+        Args:
+            pose (np.ndarray): The pose that arrived.
+            received (float): When the pose arrived.
+
+        Returns:
+            bool: True if a person was detected in the pose.
+        """
+        if self.features is None:
+            return detected(pose)
+        self.features = self.features.next(pose, received)
+        return self.features.detected
+
+    @staticmethod
+    def _update_skeletons(scene: Scene, pose: np.ndarray,
+                          present: bool) -> Optional[Skeleton]:
+        """Move the skeletons of the scene to the newest pose. \
+        This is done before anything else so that button clicks \
+        aren't a frame late.
+
+        Args:
+            scene (Scene): The scene being rendered.
+            pose (np.ndarray): The newest pose.
+            present (bool): Whether a person is in the pose.
+
+        Returns:
+            Optional[Skeleton]: The skeleton whose screen space \
+                components without a view of their own use, or \
+                    None if the scene has no skeletons.
+        """
+        if present:
+            for skeleton in scene.skeletons:
+                skeleton.update(pose)
+        return scene.skeletons[0] if scene.skeletons else None
+
+    def _update_gestures(self, scene: Scene,
+                         default_view: Optional[Skeleton],
+                         received: float,
+                         present: bool) -> List[GestureEvent]:
+        """Step the gesture engine with a new pose.
+
+        Args:
+            scene (Scene): The scene being rendered.
+            default_view (Optional[Skeleton]): The skeleton whose \
+                screen space buttons without a view are checked in.
+            received (float): When the pose arrived.
+            present (bool): Whether a person is in the pose.
+
+        Returns:
+            List[GestureEvent]: The gestures that were made.
+        """
+        if not present:
+            # Forget the buttons so a person who comes back
+            # clicks them afresh
+            return self.gestures.update(None, received)
+        return self.gestures.update(
+            None if default_view is None else default_view.skeleton_points,
+            received, scene.buttons, visible_points(default_view))
+
+    def _run_gesture_callbacks(self, events: List[GestureEvent]) -> None:
+        """Run the callbacks of gestures that were made. A button \
+        is clicked once when a target enters it, not on every frame \
+        the target stays inside of it.
+
+        Args:
+            events (List[GestureEvent]): The gestures that were made.
+        """
+        for event in events:
+            if event.type == GestureType.ENTER:
+                self._run_callback(event.component.callback)
+            for callback in self.gestures.callbacks(event):
+                self._run_callback(callback, event)
+
+    @staticmethod
+    def _place_tracking_bubbles(scene: Scene,
+                                default_view: Optional[Skeleton],
+                                present: bool) -> Set[int]:
+        """Move the tracking bubbles of the scene to their targets.
+
+        Args:
+            scene (Scene): The scene being rendered.
+            default_view (Optional[Skeleton]): The skeleton whose \
+                screen space bubbles without a view follow.
+            present (bool): Whether a person is in the pose.
+
+        Returns:
+            Set[int]: The ids of components that should not be \
+                drawn. Skeletons and bubbles of missing people, and \
+                    bubbles following occluded landmarks, are hidden.
+        """
+        hidden: Set[int] = set()
+        if not present:
+            hidden.update(map(id, scene.skeletons))
+            hidden.update(map(id, scene.tracking_bubbles))
+            return hidden
+        for bubble in scene.tracking_bubbles:
+            view: Optional[Skeleton] = bubble.view or default_view
+            if view is None:
+                continue
+            shown: Optional[np.ndarray] = visible_points(view)
+            if shown is not None and not shown[bubble.target]:
+                hidden.add(id(bubble))
+                continue
+            bubble.pos = (view.skeleton_points[bubble.target][X],
+                          view.skeleton_points[bubble.target][Y])
+        return hidden
+
+    def _render(self, scene: Scene, hidden: Set[int]) -> None:
+        """Draw the components of the scene that aren't hidden.
+
+        Args:
+            scene (Scene): The scene being rendered.
+            hidden (Set[int]): The ids of components not to draw.
+        """
+        for component in scene.components:
+            if hidden and id(component) in hidden:
+                continue
+            component.render(self.frontend.window)
+
+    def _run_callback(self, callback: Callable, *args: Any) -> None:
+        """Run a callback with the callback executor if one \
+        was given, otherwise run it immediately."""
+        if self.callback_executor is None:
+            callback(*args)
+        else:
+            self.callback_executor.submit(callback, *args)
@@ -0,0 +1,130 @@
+"""The executor module runs activity callbacks off of the \
+render loop so slow callbacks do not drop frames."""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Optional, Set, Tuple
+
+
+class CallbackExecutor:
+    """Runs button and frame callbacks on a pool of worker threads.
+
+    Callbacks should not modify components directly since they \
+    run while the user interface is rendering. Instead, they can \
+    either return a function that performs the modification or \
+    pass one to `CallbackExecutor.defer`. These modifications are \
+    applied on the render thread at the start of the next frame.
+    """
+
+    def __init__(self, max_workers: int = 4,
+                 frame_budget: float = 1/60) -> None:
+        """Create a new callback executor.
+
+        Args:
+            max_workers (int, optional): How many callbacks can run \
+                at the same time. Defaults to 4.
+            frame_budget (float, optional): Time in seconds that \
+                modifications may take at the start of a frame. \
+                    Callbacks that take longer than this are reported \
+                        with a warning. Defaults to 1/60.
+        """
+        self.frame_budget: float = frame_budget
+        self._max_workers: int = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        """The worker threads, created when the first callback \
+            is submitted after the executor starts or shuts down."""
+        self._mutations: Deque[Callable] = deque()
+        self._in_flight: Set[Callable] = set()
+        self._lock: threading.Lock = threading.Lock()
+
+    def submit(self, callback: Callable, *args: Any) -> bool:
+        """Run a callback on a worker thread.
+
+        A callback that is still running from a previous frame is \
+        not submitted again, even with different arguments.
+
+        Args:
+            callback (Callable): The callback to run.
+            *args (Any): The arguments to call the callback with, \
+                such as a gesture event.
+
+        Returns:
+            bool: True if the callback was submitted, False if it \
+                was already running.
+        """
+        with self._lock:
+            if callback in self._in_flight:
+                return False
+            self._in_flight.add(callback)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="cvgui-callback")
+            pool: ThreadPoolExecutor = self._pool
+        pool.submit(self._run, callback, args)
+        return True
+
+    def defer(self, mutation: Callable) -> None:
+        """Schedule a modification of the user interface for the \
+        start of the next frame.
+
+        Args:
+            mutation (Callable): A function taking no arguments \
+                that modifies components.
+        """
+        self._mutations.append(mutation)
+
+    def apply_mutations(self) -> None:
+        """Apply scheduled modifications on the calling thread.
+
+        Modifications that do not fit in the frame budget are left \
+        for the next frame. Exceptions raised by a modification are \
+        reported without stopping the others.
+        """
+        deadline: float = time.perf_counter() + self.frame_budget
+        while self._mutations:
+            mutation: Callable = self._mutations.popleft()
+            try:
+                mutation()
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Modification %r raised an exception",
+                                  mutation)
+            if time.perf_counter() > deadline:
+                break
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, discarding callbacks that have \
+        not started yet.
+
+        The executor can still be used afterwards, such as by the \
+        next run of an activity. New worker threads are started when \
+        the next callback is submitted, and discarded callbacks can \
+        be submitted again.
+        """
+        with self._lock:
+            pool: Optional[ThreadPoolExecutor] = self._pool
+            self._pool = None
+            self._in_flight.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, callback: Callable, args: Tuple[Any, ...]) -> None:
+        """Run a callback and record any modification it returns."""
+        start: float = time.perf_counter()
+        try:
+            result: Any = callback(*args)
+            if callable(result):
+                self._mutations.append(result)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception("Callback %r raised an exception", callback)
+        finally:
+            elapsed: float = time.perf_counter() - start
+            if elapsed > self.frame_budget:
+                logging.warning(
+                    "Callback %r took %.1f ms, exceeding the frame "
+                    "budget of %.1f ms", callback, elapsed * 1000,
+                    self.frame_budget * 1000)
+            with self._lock:
+                self._in_flight.discard(callback)
@@ -0,0 +1,223 @@
+"""The features module computes common measurements of a pose, \
+such as joint angles and limb lengths, once per frame for every \
+component and callback that needs them."""
+from functools import cached_property, lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+import numpy as np
+from cvgui.core.receiving import CVModel, detected
+
+Limb = Tuple[int, int]
+"""The landmark indices at either end of a limb."""
+
+# Fractions of body mass from Winter's anthropometric tables, with
+# the head and neck counted as part of the trunk
+_TRUNK_MASS = 0.578
+_UPPER_ARM_MASS = 0.028
+_FOREARM_MASS = 0.022
+_THIGH_MASS = 0.100
+_SHANK_MASS = 0.061
+
+
+class _FeatureIndex(NamedTuple):
+    """Index arrays that let features of every joint and limb of \
+    a model be computed at once."""
+
+    joints: np.ndarray
+    """The landmark before, at, and after each joint."""
+
+    limbs: np.ndarray
+    """The landmarks at either end of each limb."""
+
+    segments: np.ndarray
+    """The landmarks at either end of each arm and leg segment."""
+
+    segment_mass: np.ndarray
+    """The fraction of body mass of each segment."""
+
+
+class _Landmarks(NamedTuple):
+    """The landmark constants of a model that features use."""
+
+    LEFT_SHOULDER: int
+    RIGHT_SHOULDER: int
+    LEFT_ELBOW: int
+    RIGHT_ELBOW: int
+    LEFT_HAND: int
+    RIGHT_HAND: int
+    LEFT_HIP: int
+    RIGHT_HIP: int
+    LEFT_KNEE: int
+    RIGHT_KNEE: int
+    LEFT_FOOT: int
+    RIGHT_FOOT: int
+
+
+def _feature_index(model: CVModel) -> _FeatureIndex:
+    """Get the index arrays of a model's landmarks."""
+    return _build_feature_index(_Landmarks(
+        *(getattr(model, name) for name in _Landmarks._fields)))
+
+
+# Keyed on the landmark constants rather than the model, so models
+# sharing a layout share one entry and none are kept alive
+@lru_cache(maxsize=None)
+def _build_feature_index(m: _Landmarks) -> _FeatureIndex:
+    """Build the index arrays of a model's landmarks."""
+    joints = np.array([
+        (m.LEFT_SHOULDER, m.LEFT_ELBOW, m.LEFT_HAND),
+        (m.RIGHT_SHOULDER, m.RIGHT_ELBOW, m.RIGHT_HAND),
+        (m.LEFT_ELBOW, m.LEFT_SHOULDER, m.LEFT_HIP),
+        (m.RIGHT_ELBOW, m.RIGHT_SHOULDER, m.RIGHT_HIP),
+        (m.LEFT_SHOULDER, m.LEFT_HIP, m.LEFT_KNEE),
+        (m.RIGHT_SHOULDER, m.RIGHT_HIP, m.RIGHT_KNEE),
+        (m.LEFT_HIP, m.LEFT_KNEE, m.LEFT_FOOT),
+        (m.RIGHT_HIP, m.RIGHT_KNEE, m.RIGHT_FOOT)])
+    segments = np.array([
+        (m.LEFT_SHOULDER, m.LEFT_ELBOW), (m.RIGHT_SHOULDER, m.RIGHT_ELBOW),
+        (m.LEFT_ELBOW, m.LEFT_HAND), (m.RIGHT_ELBOW, m.RIGHT_HAND),
+        (m.LEFT_HIP, m.LEFT_KNEE), (m.RIGHT_HIP, m.RIGHT_KNEE),
+        (m.LEFT_KNEE, m.LEFT_FOOT), (m.RIGHT_KNEE, m.RIGHT_FOOT)])
+    limbs = np.concatenate([segments, [
+        (m.LEFT_SHOULDER, m.RIGHT_SHOULDER), (m.LEFT_HIP, m.RIGHT_HIP),
+        (m.LEFT_SHOULDER, m.LEFT_HIP), (m.RIGHT_SHOULDER, m.RIGHT_HIP)]])
+    segment_mass = np.repeat([_UPPER_ARM_MASS, _FOREARM_MASS,
+                              _THIGH_MASS, _SHANK_MASS], 2)
+    return _FeatureIndex(joints, limbs, segments, segment_mass)
+
+
+class PoseFeatures:
+    """Measurements of a single pose, computed the first time they \
+    are used and kept until the next pose arrives.
+
+    While an activity runs, `cvgui.Activity.features` holds the \
+    features of the current pose, so every component and callback \
+    of a frame shares one computation. Joints and limbs are looked \
+    up with the landmark constants of the model that made the pose:
+
+    ```python
+    features.angles[BlazePose.LEFT_ELBOW]
+    features.limb_lengths[(BlazePose.LEFT_HIP, BlazePose.LEFT_KNEE)]
+    features.speeds[BlazePose.RIGHT_HAND]
+    ```
+
+    Measurements use the first three columns of the pose as x, y, \
+    and z, in the units of the model.
+    """
+
+    def __init__(self, pose: np.ndarray, model: CVModel,
+                 timestamp: float = 0.0,
+                 previous_pose: Optional[np.ndarray] = None,
+                 previous_timestamp: float = 0.0) -> None:
+        """Create the features of a pose.
+
+        Args:
+            pose (np.ndarray): The pose to measure. It must not be \
+                modified while the features are in use.
+            model (CVModel): The model, or model class, whose landmark \
+                constants describe the pose.
+            timestamp (float, optional): When the pose was recieved, \
+                in seconds. Defaults to 0.0.
+            previous_pose (Optional[np.ndarray], optional): The pose \
+                before this one, used for velocities. Defaults to \
+                    None, meaning every landmark is still.
+            previous_timestamp (float, optional): When the previous \
+                pose was recieved, in seconds. Defaults to 0.0.
+        """
+        self.pose: np.ndarray = pose
+        self.model: CVModel = model
+        self.timestamp: float = timestamp
+        self._previous_pose: Optional[np.ndarray] = previous_pose
+        self._previous_timestamp: float = previous_timestamp
+        self._index: _FeatureIndex = _feature_index(model)
+
+    def next(self, pose: np.ndarray, timestamp: float) -> "PoseFeatures":
+        """Create the features of the pose that follows this one.
+
+        Args:
+            pose (np.ndarray): The next pose.
+            timestamp (float): When the next pose was recieved.
+
+        Returns:
+            PoseFeatures: The features of the next pose.
+        """
+        return PoseFeatures(pose, self.model, timestamp,
+                            self.pose, self.timestamp)
+
+    @cached_property
+    def detected(self) -> bool:
+        """Whether the pose belongs to a detected person."""
+        return detected(self.pose)
+
+    @cached_property
+    def points(self) -> np.ndarray:
+        """The x, y, and z position of every landmark."""
+        return self.pose[:, :3]
+
+    @cached_property
+    def velocities(self) -> np.ndarray:
+        """How fast every landmark moved along each axis since the \
+            previous pose, in units per second."""
+        elapsed: float = self.timestamp - self._previous_timestamp
+        if self._previous_pose is None or elapsed <= 0:
+            return np.zeros_like(self.points)
+        return (self.points - self._previous_pose[:, :3]) / elapsed
+
+    @cached_property
+    def speeds(self) -> np.ndarray:
+        """How fast every landmark moved since the previous pose, \
+            in units per second."""
+        return np.linalg.norm(self.velocities, axis=1)
+
+    @cached_property
+    def angles(self) -> Dict[int, float]:
+        """The angle in degrees at each elbow, shoulder, hip, and \
+            knee, keyed by the joint's landmark."""
+        joints: np.ndarray = self._index.joints
+        first: np.ndarray = self.points[joints[:, 0]] - \
+            self.points[joints[:, 1]]
+        second: np.ndarray = self.points[joints[:, 2]] - \
+            self.points[joints[:, 1]]
+        lengths: np.ndarray = np.linalg.norm(first, axis=1) * \
+            np.linalg.norm(second, axis=1)
+        cosines: np.ndarray = np.einsum("ij,ij->i", first, second) / \
+            np.where(lengths > 0, lengths, 1)
+        degrees: np.ndarray = np.degrees(np.arccos(np.clip(cosines, -1, 1)))
+        return dict(zip(joints[:, 1].tolist(), degrees.tolist()))
+
+    @cached_property
+    def limb_lengths(self) -> Dict[Limb, float]:
+        """The length of each arm and leg segment, and of the \
+            shoulders, hips, and sides of the torso, keyed by the \
+                landmarks at either end."""
+        limbs: np.ndarray = self._index.limbs
+        lengths: np.ndarray = np.linalg.norm(
+            self.points[limbs[:, 0]] - self.points[limbs[:, 1]], axis=1)
+        return dict(zip(map(tuple, limbs.tolist()), lengths.tolist()))
+
+    @cached_property
+    def center_of_mass(self) -> np.ndarray:
+        """An estimate of the position of the body's center of mass, \
+            weighting the middle of each segment by its share of \
+                typical body mass."""
+        segments: np.ndarray = self._index.segments
+        middles: np.ndarray = (self.points[segments[:, 0]] +
+                               self.points[segments[:, 1]]) / 2
+        m = self.model
+        trunk: np.ndarray = self.points[[
+            m.LEFT_SHOULDER, m.RIGHT_SHOULDER,
+            m.LEFT_HIP, m.RIGHT_HIP]].mean(axis=0)
+        return (self._index.segment_mass @ middles +
+                _TRUNK_MASS * trunk)
+
+    def distance(self, first: int, second: int) -> float:
+        """Get the distance between any two landmarks.
+
+        Args:
+            first (int): The index of the first landmark.
+            second (int): The index of the second landmark.
+
+        Returns:
+            float: The distance between them.
+        """
+        return float(np.linalg.norm(self.points[first] -
+                                    self.points[second]))
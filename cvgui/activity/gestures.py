@@ -0,0 +1,381 @@
+"""The gestures module turns a stream of poses into discrete, \
+edge-triggered gesture events such as a hand entering a button."""
+from enum import Enum
+from typing import (Any, Callable, Dict, Iterable, List, NamedTuple,
+                    Optional, Sequence, Tuple)
+import numpy as np
+
+X = 0
+Y = 1
+
+
+class GestureType(Enum):
+    """The kinds of gestures the gesture engine can recognize."""
+
+    ENTER = "enter"
+    """A target moved within activation distance of a button."""
+
+    DWELL = "dwell"
+    """A target stayed within activation distance of a button \
+        for the dwell time."""
+
+    EXIT = "exit"
+    """Every target left the activation distance of a button."""
+
+    SWIPE_LEFT = "swipe_left"
+    """A swipe target moved quickly to the left."""
+
+    SWIPE_RIGHT = "swipe_right"
+    """A swipe target moved quickly to the right."""
+
+    SWIPE_UP = "swipe_up"
+    """A swipe target moved quickly up."""
+
+    SWIPE_DOWN = "swipe_down"
+    """A swipe target moved quickly down."""
+
+
+class GestureEvent(NamedTuple):
+    """A single recognized gesture."""
+
+    type: GestureType
+    """The kind of gesture."""
+
+    timestamp: float
+    """When the gesture was recognized."""
+
+    component: Optional[Any] = None
+    """The button the gesture happened on, if any."""
+
+    target: Optional[int] = None
+    """The index of the pose point that made a swipe, if any."""
+
+
+def visible_points(view: Any) -> Optional[np.ndarray]:
+    """Get which points of a skeleton are visible, or None if the \
+    skeleton shows every point."""
+    if getattr(view, "visibility_threshold", None) is None:
+        return None
+    return view.visible
+
+
+class _ButtonStates:
+    """Gesture state kept for the buttons on screen, as arrays \
+    indexed like the buttons."""
+
+    def __init__(self, buttons: Sequence[Any],
+                 previous: Optional["_ButtonStates"] = None) -> None:
+        self.buttons: List[Any] = list(buttons)
+        count: int = len(self.buttons)
+        self.inside: np.ndarray = np.zeros(count, dtype=bool)
+        self.entered_at: np.ndarray = np.zeros(count)
+        self.dwelled: np.ndarray = np.zeros(count, dtype=bool)
+        self.targets: List[List[int]] = []
+        self.masks: Dict[int, np.ndarray] = {}
+        """Which landmarks each button targets, by number of \
+            landmarks."""
+        if previous is not None:
+            # Buttons still on screen keep their state
+            indices: Dict[int, int] = {
+                id(button): i for i, button in enumerate(previous.buttons)}
+            for i, button in enumerate(self.buttons):
+                j: Optional[int] = indices.get(id(button))
+                if j is not None:
+                    self.inside[i] = previous.inside[j]
+                    self.entered_at[i] = previous.entered_at[j]
+                    self.dwelled[i] = previous.dwelled[j]
+
+    def target_mask(self, landmarks: int) -> np.ndarray:
+        """Get which landmarks each button targets, rebuilding the \
+        mask only when the buttons' targets change."""
+        targets: List[List[int]] = [button.targets for button in self.buttons]
+        if targets != self.targets:
+            self.targets = [list(target) for target in targets]
+            self.masks = {}
+        mask: Optional[np.ndarray] = self.masks.get(landmarks)
+        if mask is None:
+            mask = np.zeros((len(self.buttons), landmarks), dtype=bool)
+            for i, target in enumerate(self.targets):
+                indices: np.ndarray = np.array(target, dtype=np.intp)
+                # Models with fewer landmarks may not have every target
+                mask[i, indices[(indices >= 0) & (indices < landmarks)]] = \
+                    True
+            self.masks[landmarks] = mask
+        return mask
+
+
+def _near(points: np.ndarray, visible: Optional[np.ndarray],
+          positions: np.ndarray, distances: np.ndarray,
+          mask: np.ndarray) -> np.ndarray:
+    """Check which buttons have a targeted point within their \
+    activation distance, all at once.
+
+    Args:
+        points (np.ndarray): The pose in screen coordinates.
+        visible (Optional[np.ndarray]): Whether each point is \
+            visible enough to click buttons, or None for every point.
+        positions (np.ndarray): The (buttons, 2) button positions.
+        distances (np.ndarray): The activation distance of each button.
+        mask (np.ndarray): The (buttons, points) targets of each button.
+
+    Returns:
+        np.ndarray: Whether each button has a target inside of it.
+    """
+    offsets: np.ndarray = points[np.newaxis, :, :2] - \
+        positions[:, np.newaxis, :]
+    near: np.ndarray = mask & (np.einsum("bpi,bpi->bp", offsets, offsets)
+                               <= (distances ** 2)[:, np.newaxis])
+    # Occluded targets can't click buttons
+    if visible is not None:
+        near &= visible[np.newaxis, :]
+    return near.any(axis=1)
+
+
+def _buttons_inside(state: _ButtonStates, points: Optional[np.ndarray],
+                    visible: Optional[np.ndarray]) -> np.ndarray:
+    """Check which buttons have a target inside of them, checking \
+    the buttons that share a skeleton together.
+
+    Args:
+        state (_ButtonStates): The state of the buttons on screen.
+        points (Optional[np.ndarray]): The pose in the screen \
+            coordinates of buttons without a `view`, or None.
+        visible (Optional[np.ndarray]): Whether each of `points` is \
+            visible enough to click buttons, or None for every point.
+
+    Returns:
+        np.ndarray: Whether each button has a target inside of it.
+    """
+    buttons: List[Any] = state.buttons
+    inside: np.ndarray = np.zeros(len(buttons), dtype=bool)
+    if not buttons:
+        return inside
+    positions: np.ndarray = np.array(
+        [button.pos for button in buttons], dtype=float)
+    distances: np.ndarray = np.array(
+        [button.activation_distance for button in buttons], dtype=float)
+    views: Dict[int, Tuple[Any, List[int]]] = {}
+    for i, button in enumerate(buttons):
+        views.setdefault(id(button.view), (button.view, []))[1].append(i)
+    for view, members in views.values():
+        view_points: Optional[np.ndarray] = points \
+            if view is None else view.skeleton_points
+        if view_points is None:
+            continue
+        view_visible: Optional[np.ndarray] = visible \
+            if view is None else visible_points(view)
+        mask: np.ndarray = state.target_mask(len(view_points))
+        if len(members) == len(buttons):
+            inside = _near(view_points, view_visible, positions,
+                           distances, mask)
+        else:
+            inside[members] = _near(
+                view_points, view_visible, positions[members],
+                distances[members], mask[members])
+    return inside
+
+
+class _SwipeHistory:
+    """A fixed-size ring buffer of the recent positions of the \
+    swipe targets."""
+
+    def __init__(self, window: int, targets: int) -> None:
+        self.window: int = window
+        self.positions: np.ndarray = np.zeros((window, targets, 2))
+        self.timestamps: np.ndarray = np.zeros(window)
+        self.index: int = -1
+        """The slot holding the newest positions."""
+        self.count: int = 0
+        """How many slots hold positions since the history was \
+            last cleared."""
+
+    def add(self, positions: np.ndarray, timestamp: float) -> None:
+        """Overwrite the oldest positions with the newest ones."""
+        self.index = (self.index + 1) % self.window
+        self.positions[self.index] = positions
+        self.timestamps[self.index] = timestamp
+        self.count = min(self.count + 1, self.window)
+
+    @property
+    def full(self) -> bool:
+        """Whether every slot holds positions."""
+        return self.count == self.window
+
+    @property
+    def oldest(self) -> int:
+        """The slot holding the oldest positions. Only meaningful \
+        once the history is full."""
+        # The slot after the newest pose holds the oldest pose
+        return (self.index + 1) % self.window
+
+    def clear(self) -> None:
+        """Forget every position."""
+        self.count = 0
+
+
+class GestureEngine:
+    """Recognizes gestures incrementally, one pose at a time.
+
+    Button gestures are computed for every button at once from the \
+    distance between each button and its targets, with one distance \
+    check for all of the buttons sharing a skeleton. Swipes are found \
+    by comparing the newest position of each swipe target against a \
+    fixed-size ring buffer of recent positions, so every update does \
+    the same amount of work no matter how long the activity runs.
+    """
+
+    def __init__(self, dwell_time: float = 1.0,
+                 swipe_targets: Iterable[int] = (),
+                 swipe_distance: float = 200,
+                 swipe_time: float = 0.3,
+                 window: int = 10) -> None:
+        """Create a new gesture engine.
+
+        Args:
+            dwell_time (float, optional): Seconds a target must stay \
+                on a button to dwell. Defaults to 1.0.
+            swipe_targets (Iterable[int], optional): Indices of the \
+                pose points that can swipe. Defaults to none.
+            swipe_distance (float, optional): How far a swipe target \
+                must move to be considered a swipe. Defaults to 200.
+            swipe_time (float, optional): The most time in seconds \
+                a swipe can take. Defaults to 0.3.
+            window (int, optional): How many poses to compare \
+                against when looking for a swipe. Defaults to 10.
+        """
+        self.dwell_time: float = dwell_time
+        self.swipe_targets: List[int] = list(swipe_targets)
+        self.swipe_distance: float = swipe_distance
+        self.swipe_time: float = swipe_time
+
+        self._buttons: _ButtonStates = _ButtonStates(())
+        self._subscribers: Dict[GestureType,
+                                List[Tuple[Optional[Any], Callable]]] = {
+            gesture: [] for gesture in GestureType}
+
+        self._swipes: _SwipeHistory = _SwipeHistory(
+            window, len(self.swipe_targets))
+
+    def subscribe(self, gesture: GestureType,
+                  callback: Callable[[GestureEvent], Any],
+                  component: Optional[Any] = None) -> None:
+        """Call a function whenever a gesture is recognized.
+
+        Args:
+            gesture (GestureType): The gesture to listen for.
+            callback (Callable[[GestureEvent], Any]): The function \
+                to call with the gesture event.
+            component (Optional[Any], optional): Only listen for \
+                gestures on this button. Defaults to None, meaning \
+                    gestures on any button.
+        """
+        self._subscribers[gesture].append((component, callback))
+
+    def callbacks(self, event: GestureEvent) -> List[Callable]:
+        """Get the subscribers for a gesture event.
+
+        Args:
+            event (GestureEvent): The gesture event.
+
+        Returns:
+            List[Callable]: Every function subscribed to the event.
+        """
+        return [callback for component, callback
+                in self._subscribers[event.type]
+                if component is None or component is event.component]
+
+    def update(self, points: Optional[np.ndarray], timestamp: float,
+               buttons: Sequence[Any] = (),
+               visible: Optional[np.ndarray] = None) -> List[GestureEvent]:
+        """Advance the gesture state by one pose.
+
+        Args:
+            points (Optional[np.ndarray]): The pose in the screen \
+                coordinates of the scene's first skeleton, or None if \
+                    the scene has no skeleton. Buttons with their own \
+                        `view` use that skeleton's points instead.
+            timestamp (float): When the pose was recieved, in seconds.
+            buttons (Sequence[Any], optional): The buttons currently \
+                on screen, such as `cvgui.Scene.buttons`. Defaults to \
+                    none.
+            visible (Optional[np.ndarray], optional): Whether each \
+                point is visible enough to click buttons. Buttons with \
+                    their own `view` use that skeleton's `visible` \
+                        instead. Defaults to None, meaning every point.
+
+        Returns:
+            List[GestureEvent]: The gestures that started this update.
+        """
+        events: List[GestureEvent] = self._update_buttons(
+            points, visible, timestamp, buttons)
+        if self.swipe_targets and points is not None:
+            events += self._update_swipes(points, timestamp)
+        return events
+
+    def _update_buttons(self, points: Optional[np.ndarray],
+                        visible: Optional[np.ndarray],
+                        timestamp: float,
+                        buttons: Sequence[Any]) -> List[GestureEvent]:
+        """Find buttons that were entered, dwelled on, or exited."""
+        # Forget buttons that are no longer on screen
+        if list(buttons) != self._buttons.buttons:
+            self._buttons = _ButtonStates(buttons, self._buttons)
+        state: _ButtonStates = self._buttons
+        inside: np.ndarray = _buttons_inside(state, points, visible)
+
+        entered: np.ndarray = inside & ~state.inside
+        exited: np.ndarray = ~inside & state.inside
+        state.entered_at[entered] = timestamp
+        state.dwelled[entered] = False
+        dwelled: np.ndarray = inside & ~state.dwelled & \
+            (timestamp - state.entered_at >= self.dwell_time)
+        state.dwelled |= dwelled
+        state.inside = inside
+
+        events: List[GestureEvent] = []
+        for i in np.flatnonzero(entered | exited | dwelled):
+            if entered[i]:
+                events.append(GestureEvent(
+                    GestureType.ENTER, timestamp, component=buttons[i]))
+            elif exited[i]:
+                events.append(GestureEvent(
+                    GestureType.EXIT, timestamp, component=buttons[i]))
+            if dwelled[i]:
+                events.append(GestureEvent(
+                    GestureType.DWELL, timestamp, component=buttons[i]))
+        return events
+
+    def _update_swipes(self, points: np.ndarray,
+                       timestamp: float) -> List[GestureEvent]:
+        """Add the pose to the ring buffer and look for swipes."""
+        history: _SwipeHistory = self._swipes
+        history.add(points[self.swipe_targets, :2], timestamp)
+        if not history.full:
+            return []
+
+        oldest: int = history.oldest
+        if timestamp - history.timestamps[oldest] > self.swipe_time:
+            return []
+
+        displacement: np.ndarray = \
+            history.positions[history.index] - history.positions[oldest]
+        distance: np.ndarray = np.hypot(displacement[:, X],
+                                        displacement[:, Y])
+
+        events: List[GestureEvent] = []
+        for i in np.flatnonzero(distance >= self.swipe_distance):
+            delta_x, delta_y = displacement[i]
+            if abs(delta_x) >= abs(delta_y):
+                gesture = GestureType.SWIPE_RIGHT if delta_x > 0 \
+                    else GestureType.SWIPE_LEFT
+            else:
+                # Screen coordinates grow downwards
+                gesture = GestureType.SWIPE_DOWN if delta_y > 0 \
+                    else GestureType.SWIPE_UP
+            events.append(GestureEvent(gesture, timestamp,
+                                       target=self.swipe_targets[i]))
+
+        if events:
+            # Start over so a single swipe is only reported once
+            history.clear()
+        return events
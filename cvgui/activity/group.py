@@ -0,0 +1,112 @@
+"""The group module runs several activities at once from a single \
+pose pipeline, such as an operator console next to a participant's \
+display."""
+from typing import Callable, Iterable, List, Union
+import multiprocessing as mp
+from cvgui.activity.activity import Activity
+from cvgui.pipeline import LoggingHub, PoseHistory, PosePipeline
+
+ActivitySource = Union[Activity, Callable[[], Activity]]
+"""An activity, or a function that creates one in the process \
+that will run it."""
+
+
+def _run_activity(source: ActivitySource, history: PoseHistory,
+                  hub: LoggingHub) -> None:
+    """Create an activity if needed and run it on a shared \
+    pose history.
+
+    Raises:
+        ValueError: If the activity has pose loggers.
+    """
+    activity: Activity = source if isinstance(source, Activity) \
+        else source()
+    if activity.pose_loggers:
+        raise ValueError("Pose loggers of an activity in a group must "
+                         "be added to the group's pipeline")
+    if activity.sinks:
+        hub.attach(activity.sinks)
+    try:
+        activity.run_shared(history)
+    except KeyboardInterrupt:
+        pass
+
+
+class ActivityGroup:
+    """Runs activities side by side, each in its own process with \
+    its own frontend, all reading the poses of one pipeline.
+
+    The pipeline's pose input only runs once, so adding a display \
+    costs a render loop, not another camera and model. Every \
+    activity follows the pipeline's shared pose history. Sinks added \
+    to an activity receive poses until the group stops.
+
+    Frontends and components can rarely be sent to a new process, so \
+    activities are best given as functions that create them. On \
+    platforms that spawn processes, such as Windows, those functions \
+    must be defined at the top level of a module.
+    """
+
+    def __init__(self, pipeline: PosePipeline,
+                 activities: Iterable[ActivitySource] = ()) -> None:
+        """Create a new activity group.
+
+        Args:
+            pipeline (PosePipeline): The pipeline every activity \
+                reads poses from. It is started if needed, and left \
+                    running once the group stops.
+            activities (Iterable[ActivitySource], optional): The \
+                activities to run, or functions that create them. \
+                    Defaults to ().
+        """
+        self.pipeline: PosePipeline = pipeline
+        self.activities: List[ActivitySource] = list(activities)
+        self.processes: List[mp.Process] = []
+        """The processes running the activities."""
+
+    def add_activity(self, activity: ActivitySource) -> None:
+        """Add an activity to the group. Activities must be added \
+        before the group is started.
+
+        Args:
+            activity (ActivitySource): The activity to run, or a \
+                function that creates it.
+        """
+        self.activities.append(activity)
+
+    def start(self) -> List[mp.Process]:
+        """Attach to the pipeline and start a process for each \
+        activity.
+
+        Returns:
+            List[mp.Process]: The processes running the activities.
+        """
+        self.pipeline.attach()
+        for activity in self.activities:
+            process = mp.Process(target=_run_activity, args=(
+                activity, self.pipeline.pose_history, self.pipeline.hub))
+            process.start()
+            self.processes.append(process)
+        return self.processes
+
+    def run(self) -> None:
+        """Run every activity until all of their user interfaces \
+        stop running."""
+        self.start()
+        try:
+            for process in self.processes:
+                process.join()
+        except KeyboardInterrupt:
+            print("Ctrl-C pressed. Exiting...")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop any activities still running and detach from the \
+        pipeline, finishing the activities' sinks."""
+        for process in self.processes:
+            if process.is_alive():
+                process.kill()
+            process.join()
+        self.processes = []
+        self.pipeline.detach()
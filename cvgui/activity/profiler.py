@@ -0,0 +1,119 @@
+"""The profiler module measures how long each stage of an \
+activity's frame takes to render."""
+import json
+from pathlib import Path
+import time
+from typing import Dict, List, Sequence
+import numpy as np
+
+
+class FrameProfiler:
+    """Records per-stage frame times over a rolling window of frames.
+
+    Stage times are written into a preallocated ring buffer, so \
+    profiling a frame costs one clock read per stage. Percentiles \
+    are only computed when they are asked for.
+    """
+
+    CALLBACKS: int = 0
+    """Applying changes made by callbacks on other threads."""
+    CLEAR: int = 1
+    """Clearing the user interface."""
+    POSE: int = 2
+    """Retrieving and transforming the newest pose."""
+    HIT_TEST: int = 3
+    """Checking for gestures and positioning tracking bubbles."""
+    RENDER: int = 4
+    """Rendering the scene's components."""
+    FRAME_CALLBACK: int = 5
+    """Running the scene's frame callback."""
+    UPDATE: int = 6
+    """Updating the user interface."""
+    TOTAL: int = 7
+    """The whole frame."""
+
+    STAGE_NAMES: Sequence[str] = ("callbacks", "clear", "pose", "hit_test",
+                                  "render", "frame_callback", "update",
+                                  "total")
+
+    def __init__(self, window: int = 600) -> None:
+        """Create a new frame profiler.
+
+        Args:
+            window (int, optional): How many of the most recent \
+                frames to compute percentiles over. Defaults to 600.
+        """
+        self.window: int = window
+        self.frame_count: int = 0
+        """How many frames have been profiled."""
+        self._samples: np.ndarray = np.zeros((window, len(self.STAGE_NAMES)))
+        self._frame_start: float = 0
+        self._last: float = 0
+
+    def start_frame(self) -> None:
+        """Mark the start of a new frame."""
+        self._frame_start = self._last = time.perf_counter()
+
+    def lap(self, stage: int) -> None:
+        """Record the time since the previous lap as the \
+        time taken by the given stage.
+
+        Args:
+            stage (int): The stage that just finished, \
+                such as `FrameProfiler.RENDER`.
+        """
+        now: float = time.perf_counter()
+        self._samples[self.frame_count % self.window, stage] = \
+            now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        """Mark the end of the current frame."""
+        self._samples[self.frame_count % self.window, self.TOTAL] = \
+            time.perf_counter() - self._frame_start
+        self.frame_count += 1
+
+    def percentiles(self, percents: Sequence[float] = (50, 95, 99)
+                    ) -> Dict[str, Dict[str, float]]:
+        """Compute stage time percentiles over the rolling window.
+
+        Args:
+            percents (Sequence[float], optional): The percentiles \
+                to compute. Defaults to (50, 95, 99).
+
+        Returns:
+            Dict[str, Dict[str, float]]: For each stage, a mapping \
+                of names such as "p95" to times in milliseconds.
+        """
+        frames: int = min(self.frame_count, self.window)
+        if frames == 0:
+            values: np.ndarray = np.zeros(
+                (len(percents), len(self.STAGE_NAMES)))
+        else:
+            values = np.percentile(
+                self._samples[:frames], percents, axis=0) * 1000
+        return {stage: {f"p{percent:g}": float(values[i, column])
+                        for i, percent in enumerate(percents)}
+                for column, stage in enumerate(self.STAGE_NAMES)}
+
+    def summary(self) -> List[str]:
+        """Describe the p50, p95, and p99 time of each stage.
+
+        Returns:
+            List[str]: One line of text per stage.
+        """
+        return [f"{stage:>14}: " + " ".join(
+                    f"{name} {value:6.2f}ms" for name, value in
+                    values.items())
+                for stage, values in self.percentiles().items()]
+
+    def dump(self, filepath: Path) -> None:
+        """Write the stage time percentiles to a json file.
+
+        Args:
+            filepath (Path): Where to write the file.
+        """
+        with open(filepath, "w", encoding="utf-8") as file:
+            json.dump({"frames": self.frame_count,
+                       "window": min(self.frame_count, self.window),
+                       "stages_ms": self.percentiles()}, file, indent=2)
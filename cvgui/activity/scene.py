@@ -1,7 +1,8 @@
 """The scene module contains classes and methods \
 relating to an activity scene."""
 from typing import Callable, List
-from cvgui.core.displaying.components import Component
+from cvgui.core.displaying.components import (Button, Component,
+                                              Skeleton, TrackingBubble)
 
 
 class Scene:
@@ -11,7 +12,17 @@ class Scene:
     def __init__(self) -> None:
         """Create a new scene."""
         self.components: List[Component] = []
-        """Components to be included in the scene."""
+        """Components to be included in the scene. Add them with \
+            `add_component` so they are also sorted by kind."""
+
+        self.skeletons: List[Skeleton] = []
+        """The scene's skeletons, in the order they were added."""
+
+        self.buttons: List[Button] = []
+        """The scene's buttons, in the order they were added."""
+
+        self.tracking_bubbles: List[TrackingBubble] = []
+        """The scene's tracking bubbles, in the order they were added."""
 
         self.frame_callback: Callable = lambda: True
         """Function to run every frame."""
@@ -20,7 +31,16 @@ class Scene:
         """Add a component to the list of components for \
         the scene.
 
+        Checking a component against the component protocols is \
+        slow, so it is only done here rather than every frame.
+
         Args:
             component (Component): The component to add.
         """
         self.components.append(component)
+        if isinstance(component, Skeleton):
+            self.skeletons.append(component)
+        if isinstance(component, Button):
+            self.buttons.append(component)
+        if isinstance(component, TrackingBubble):
+            self.tracking_bubbles.append(component)
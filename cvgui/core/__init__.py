@@ -20,5 +20,5 @@ from .displaying import (  # noqa
     Button,
     TrackingBubble
   )
-from .receiving import CVModel, FrameInput, PoseGenerator  # noqa
-from .logging import PoseLogger  # noqa
+from .receiving import CVModel, FrameInput, PoseGenerator, Topology  # noqa
+from .logging import PoseLogger, PoseSink  # noqa
@@ -1,7 +1,8 @@
 """This module contains interfaces for common UI objects."""
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 from typing_extensions import Protocol, runtime_checkable
 import numpy as np
+from cvgui.core.receiving.service import Topology
 
 
 class Component(Protocol):
@@ -49,6 +50,10 @@ class Button(Protocol):
     radius: int
     """The radius to make the button."""
 
+    view: Optional["Skeleton"]
+    """The skeleton whose screen space the targets are checked in. \
+        The first skeleton of the scene is used if None."""
+
     def is_clicked(self, pos: Tuple[float, float]) -> bool:  # type: ignore
         """Check whether or not the button is clicked given \
         the coordinates of an action.
@@ -113,6 +118,10 @@ class TrackingBubble(Protocol):
     pos: Tuple[float, float]
     """The position the tracking bubble should render at."""
 
+    view: Optional["Skeleton"]
+    """The skeleton whose screen space the tracking bubble \
+        follows. The first skeleton of the scene is used if None."""
+
     def render(self, window: Any) -> None:
         """Render the tracking bubble to the given window.
 
@@ -140,8 +149,27 @@ class Skeleton(Protocol):
     a Skeleton."""
 
     pos: Tuple[float, float]
+    """Where the origin of the pose should be on screen."""
+
     scale: int
+    """How much to scale the pose by."""
+
+    mirror: bool
+    """Whether to flip the pose horizontally."""
+
+    transform: np.ndarray
+    """The 2x3 affine transform from pose to screen coordinates."""
+
     skeleton_points: np.ndarray
+    """The most recent pose in screen coordinates."""
+
+    def update(self, pose: np.ndarray) -> None:
+        """Transform a raw pose into the skeleton's screen \
+        coordinates without modifying the raw pose.
+
+        Args:
+            pose (np.ndarray): The raw pose.
+        """
 
     def render(self, window: Any) -> None:
         """Render the skeleton component on the given window."""
@@ -152,13 +180,24 @@ class HasSkeleton(Protocol):
         be used in the creation of a skeleton."""
 
     def skeleton(self, pos: Tuple[float, float],
-                 scale: int) -> Skeleton:  # type: ignore
+                 scale: int, mirror: bool = False,
+                 model: Optional[Topology] = None,
+                 visibility_threshold: Optional[float] = None
+                 ) -> Skeleton:  # type: ignore
         """Create an abstract skeleton.
 
         Args:
             pos (Tuple[float, float]): The position of the skeleton \
                 as an x,y tuple
             scale (int): The scale to size the skeleton at.
+            mirror (bool, optional): Whether to flip the skeleton \
+                horizontally. Defaults to False.
+            model (Optional[Topology], optional): The model whose \
+                landmarks and limbs the skeleton shows. Defaults to \
+                    None, meaning BlazePose's.
+            visibility_threshold (Optional[float], optional): The \
+                lowest visibility a landmark can have to be shown. \
+                    Defaults to None, meaning every landmark is shown.
 
         Returns:
             Skeleton: Object that implements the Skeleton interface.
@@ -195,8 +234,11 @@ def button(gui: HasButton, pos: Tuple[float, float],
                       color=color, radius=radius)
 
 
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
 def skeleton(gui: HasSkeleton, pos: Tuple[float, float],
-             scale: int) -> Skeleton:
+             scale: int, mirror: bool = False,
+             model: Optional[Topology] = None,
+             visibility_threshold: Optional[float] = None) -> Skeleton:
     """Create a skeleton for any gui \
     that implements the HasSkeleton interface. This method is used \
     instead of instantiating concrete types of ui components to \
@@ -207,11 +249,21 @@ def skeleton(gui: HasSkeleton, pos: Tuple[float, float],
         gui (HasButton): A gui that can create a skeleton.
         pos (Tuple[float, float]): The position of the skeleton as an \
             x,y tuple
+        scale (int): The scale to size the skeleton at.
+        mirror (bool, optional): Whether to flip the skeleton \
+            horizontally. Defaults to False.
+        model (Optional[Topology], optional): The model, or model \
+            class, whose landmarks and limbs the skeleton shows. \
+                Defaults to None, meaning BlazePose's.
+        visibility_threshold (Optional[float], optional): The lowest \
+            visibility a landmark can have to be shown. Defaults to \
+                None, meaning every landmark is shown.
 
     Returns:
         Skeleton: The skeleton implementation for the respective gui.
     """
-    return gui.skeleton(pos=pos, scale=scale)
+    return gui.skeleton(pos=pos, scale=scale, mirror=mirror, model=model,
+                        visibility_threshold=visibility_threshold)
 
 
 def tracking_bubble(gui: HasTrackingBubble,
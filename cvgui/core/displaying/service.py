@@ -1,10 +1,11 @@
 """This module defines the interface for a class to be considered \
 a user interface by `cvgui`. This ensures that all user-created \
 activities work reguardless of what user interface is used."""
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 from typing_extensions import Protocol
 
 from cvgui.core.displaying.components import Button, Skeleton, TrackingBubble
+from cvgui.core.receiving.service import Topology
 
 
 class UserInterface(Protocol):
@@ -44,7 +45,10 @@ class UserInterface(Protocol):
         """
 
     def skeleton(self, pos: Tuple[float, float],
-                 scale: int) -> Skeleton:  # type: ignore
+                 scale: int, mirror: bool = False,
+                 model: Optional[Topology] = None,
+                 visibility_threshold: Optional[float] = None
+                 ) -> Skeleton:  # type: ignore
         """Create a new skeleton on the user \
         interface at the location specfied.
 
@@ -53,6 +57,14 @@ class UserInterface(Protocol):
                 to center the skeleton at.
             scale (int): How much to scale the skeleton \
                 points by.
+            mirror (bool, optional): Whether to flip the \
+                skeleton horizontally. Defaults to False.
+            model (Optional[Topology], optional): The model whose \
+                landmarks and limbs the skeleton shows. Defaults \
+                    to None, meaning BlazePose's.
+            visibility_threshold (Optional[float], optional): The \
+                lowest visibility a landmark can have to be shown. \
+                    Defaults to None, meaning every landmark is shown.
 
         Returns:
             Skeleton: Skeleton component with the specified settings.
@@ -3,4 +3,4 @@ how logging objects should behave. These loggers can \
 be used to log pose positions as well as other actions \
 that occur during an activity."""
 
-from .service import PoseLogger  # noqa
+from .service import PoseLogger, PoseSink  # noqa
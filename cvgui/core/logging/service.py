@@ -3,6 +3,7 @@
 import multiprocessing.queues as mpq
 import multiprocessing as mp
 from typing import Iterable, Protocol
+import numpy as np
 
 
 class PoseLogger(Protocol):
@@ -23,3 +24,20 @@ class PoseLogger(Protocol):
     def close(self) -> None:  # type: ignore
         """Finish logging poses and safely close any \
         files or repositories."""
+
+
+class PoseSink(Protocol):
+    """Defines the behavior of an object that records \
+        poses in the process it is called from. Sinks \
+            are driven by a logging hub, so adding one \
+                does not start another process."""
+
+    def write(self, pose_data: np.ndarray) -> None:  # type: ignore
+        """Record a single pose."""
+
+    def flush(self) -> None:  # type: ignore
+        """Save recorded poses to the disk."""
+
+    def finish(self) -> None:  # type: ignore
+        """Save any remaining poses and release any files \
+        or connections."""
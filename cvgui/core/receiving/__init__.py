@@ -7,4 +7,11 @@ by the system. Pose data can either be retrieved by
 a combination of a computer vision model and frame input
 or through a generic pose generator.
 """
-from .service import CVModel, FrameInput, PoseGenerator  # noqa
+from .service import CVModel, FrameInput, PoseGenerator, Topology  # noqa
+from .topology import (  # noqa
+    BLAZEPOSE_CONNECTIONS,
+    BLAZEPOSE_LANDMARKS,
+    COCO_CONNECTIONS,
+    COCO_LANDMARKS
+)
+from .visibility import VISIBILITY, detected, visible  # noqa
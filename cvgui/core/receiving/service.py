@@ -6,7 +6,19 @@ from typing_extensions import Protocol
 import numpy as np
 
 
-class CVModel(Protocol):
+class Topology(Protocol):
+    """Abstract description of the landmarks in a pose and \
+        the limbs that join them."""
+
+    NUM_LANDMARKS: int
+    """The number of landmarks in each pose"""
+
+    CONNECTIONS: np.ndarray
+    """An (n, 2) array of the landmark indices at either \
+    end of each limb"""
+
+
+class CVModel(Topology, Protocol):
     """Abstract object that can generate a pose given \
         an consisting of various body parts."""
 
@@ -0,0 +1,33 @@
+"""The topology module contains the landmark layouts of common \
+pose models, for models and skeletons to share."""
+import numpy as np
+
+BLAZEPOSE_LANDMARKS: int = 33
+"""The number of landmarks in a BlazePose pose."""
+
+# Refer to here
+# https://mediapipe.dev/images/mobile/pose_tracking_full_body_landmarks.png
+BLAZEPOSE_CONNECTIONS: np.ndarray = np.array([
+    [16, 14], [16, 18], [16, 20], [16, 22],
+    [18, 20], [14, 12], [12, 11], [12, 24],
+    [11, 23], [11, 13], [15, 13], [15, 17],
+    [15, 19], [15, 21], [17, 19], [24, 23],
+    [26, 24], [26, 28], [25, 23], [25, 27],
+    [10, 9], [8, 6], [5, 6], [5, 4], [0, 4],
+    [0, 1], [2, 1], [2, 3], [3, 7], [28, 32],
+    [28, 30], [27, 29], [27, 31], [32, 30],
+    [29, 31]
+])
+"""The pairs of BlazePose landmarks joined by limbs."""
+
+COCO_LANDMARKS: int = 17
+"""The number of landmarks in a COCO keypoint pose, used by \
+lighter models such as MoveNet."""
+
+COCO_CONNECTIONS: np.ndarray = np.array([
+    [0, 1], [0, 2], [1, 3], [2, 4],
+    [5, 6], [5, 7], [7, 9], [6, 8], [8, 10],
+    [5, 11], [6, 12], [11, 12],
+    [11, 13], [13, 15], [12, 14], [14, 16]
+])
+"""The pairs of COCO keypoints joined by limbs."""
@@ -0,0 +1,48 @@
+"""The visibility module reads the visibility column of poses, \
+which also tells whether a person was detected at all."""
+from typing import Optional
+import numpy as np
+
+VISIBILITY: int = 3
+"""The column of a pose holding how likely each landmark is to be \
+visible, from 0 to 1."""
+
+
+def detected(pose: np.ndarray) -> bool:
+    """Check if a pose belongs to a detected person.
+
+    Models mark poses where no person was found by setting the \
+    visibility of every landmark to 0. Poses without a visibility \
+    column are always detected.
+
+    Args:
+        pose (np.ndarray): The pose to check.
+
+    Returns:
+        bool: Whether any landmark has a visibility above 0.
+    """
+    if pose.shape[1] <= VISIBILITY:
+        return True
+    return bool(np.any(pose[:, VISIBILITY] > 0))
+
+
+def visible(pose: np.ndarray, threshold: Optional[float],
+            out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Find the landmarks of a pose that are visible enough to use.
+
+    Args:
+        pose (np.ndarray): The pose to check.
+        threshold (Optional[float]): The lowest visibility a landmark \
+            can have to be used. None uses every landmark.
+        out (Optional[np.ndarray], optional): A boolean array to write \
+            the result into instead of allocating one. Defaults to None.
+
+    Returns:
+        np.ndarray: Whether each landmark is visible.
+    """
+    if out is None:
+        out = np.empty(len(pose), dtype=bool)
+    if threshold is None or pose.shape[1] <= VISIBILITY:
+        out[:] = True
+        return out
+    return np.greater_equal(pose[:, VISIBILITY], threshold, out=out)
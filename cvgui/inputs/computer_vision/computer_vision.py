@@ -1,18 +1,42 @@
 """The computer_vision module contains the main ComputerVisionPose class \
     that dictates the interactions between frame inputs and computer \
         vision models."""
-from typing import Any, Iterable
+import queue
+import time
+from typing import Any, Iterable, List, Optional
 import multiprocessing as mp
 import multiprocessing.queues as mpq
+import multiprocessing.synchronize as mps
 import cv2
 import numpy as np
 from cvgui.core.receiving.service import CVModel, FrameInput
+from cvgui.core.receiving.visibility import detected
+from cvgui.outputs.recorders import SessionRecorder
+from cvgui.pipeline import Channel, ChannelPolicy, FrameBuffer, \
+    Heartbeat, ProcessSettings, Stage
 
 
+# pylint: disable-next=too-many-instance-attributes
 class ComputerVisionPose:
     """Generates poses based on a computer vision model and a frame input."""
 
-    def __init__(self, frame_input: FrameInput, model: CVModel) -> None:
+    poll_interval: float = 0.1
+    """The most seconds the inference process waits for a frame \
+        before beating its heartbeat to show it is still alive."""
+
+    stop_timeout: float = 2.0
+    """The most seconds a restart waits for the capture and \
+        inference processes to stop on their own before killing \
+            them."""
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, frame_input: FrameInput, model: CVModel,
+                 frame_buffer: Optional[FrameBuffer] = None,
+                 show_video: bool = True,
+                 recorder: Optional[SessionRecorder] = None,
+                 capture_settings: Optional[ProcessSettings] = None,
+                 inference_settings: Optional[ProcessSettings] = None
+                 ) -> None:
         """Create a new pose generator based on a computer vision \
         model.
 
@@ -21,9 +45,42 @@ class ComputerVisionPose:
             to the computer vision model.
             model (CVModel): The model use to interpret the images \
             from the frame input.
+            frame_buffer (Optional[FrameBuffer], optional): Shared \
+                buffer to write each captured frame to, such as the \
+                    background of a user interface. Defaults to None.
+            show_video (bool, optional): Whether to display captured \
+                frames in their own window. Defaults to True.
+            recorder (Optional[SessionRecorder], optional): Records \
+                captured frames to a video file, linking each frame \
+                    to the pose made from it. Defaults to None.
+            capture_settings (Optional[ProcessSettings], optional): \
+                The cores, priority, and thread caps of the capture \
+                    process. Defaults to None.
+            inference_settings (Optional[ProcessSettings], optional): \
+                The cores, priority, and thread caps of the inference \
+                    process. Defaults to None.
         """
         self.frame_input: FrameInput = frame_input
         self.model: CVModel = model
+        self.frame_buffer: Optional[FrameBuffer] = frame_buffer
+        self.show_video: bool = show_video
+        self.recorder: Optional[SessionRecorder] = recorder
+        self.capture_settings: Optional[ProcessSettings] = capture_settings
+        self.inference_settings: Optional[ProcessSettings] = \
+            inference_settings
+        self.capture_heartbeat: Heartbeat = Heartbeat()
+        """Beats for every frame captured."""
+        self.inference_heartbeat: Heartbeat = Heartbeat()
+        """Beats for every pose made, and while waiting for frames."""
+        # Shared so that restarted stages keep counting where
+        # the stages they replaced left off
+        self._frame_index: Any = mp.RawValue("Q", 0)
+        self._pose_row: Any = mp.RawValue("Q", 0)
+        self._image_queue: mpq.Queue
+        self._pose_queues: Iterable[mpq.Queue]
+        self._capture: Optional[mp.Process] = None
+        self._inference: Optional[mp.Process] = None
+        self._stop: Optional[mps.Event] = None
 
     def start(self, pose_queues: Iterable[mpq.Queue]) -> Iterable[mp.Process]:
         """Start two processes, one for \
@@ -45,37 +102,149 @@ class ComputerVisionPose:
             list[multiprocessing.Process]: All the processes started by this \
                 method so they can be closed correctly later down the line.
         """
-        image_queue: mpq.Queue = mp.Queue()
+        self._pose_queues = pose_queues
         print("Starting image processing pipeline "
               "(This might take a while on Windows)...")
-        cap = mp.Process(target=self._capture_and_show, args=(image_queue,))
-        proc = mp.Process(target=self._process_image,
-                          args=(image_queue, pose_queues))
-        cap.start()
-        proc.start()
-        return [cap, proc]
-
-    def _capture_and_show(self, image_queue) -> None:
+        return self.restart()
+
+    def __getstate__(self) -> dict:
+        """Leave out the stage processes when sent to a new process."""
+        state: dict = self.__dict__.copy()
+        state["_capture"] = None
+        state["_inference"] = None
+        state["_stop"] = None
+        return state
+
+    def stages(self) -> List[Stage]:
+        """Get the capture and inference stages so that a \
+        `cvgui.pipeline.Supervisor` can restart them if they stall.
+
+        Returns:
+            List[Stage]: The capture stage followed by the \
+                inference stage.
+        """
+        return [Stage("capture", self.capture_heartbeat, self.restart),
+                Stage("inference", self.inference_heartbeat, self.restart)]
+
+    def restart(self) -> Iterable[mp.Process]:
+        """Stop the capture and inference processes if they are \
+        running and start new ones.
+
+        Both stages are asked to stop between frames, so the pose \
+        queues they share with the rest of the pipeline are never \
+        left locked. Only a stage that is still running after \
+        `stop_timeout`, such as one stuck inside its model, is \
+        killed. Since a killed stage may have been partway through \
+        using the image queue, both stages are restarted together \
+        with a new one between them.
+
+        Returns:
+            Iterable[mp.Process]: The new capture and inference \
+                processes.
+        """
+        self._stop_stages()
+        # Stages that ran before recorded the last segment
+        if self.recorder is not None and self._capture is not None:
+            self.recorder.new_segment()
+        self._stop = mp.Event()
+        # Only the newest frame is worth processing. Older frames
+        # are discarded so poses never lag behind the camera.
+        self._image_queue = Channel(capacity=1,
+                                    policy=ChannelPolicy.KEEP_LATEST)
+        self._capture = mp.Process(target=self._capture_and_show,
+                                   args=(self._image_queue, self._stop))
+        self._inference = mp.Process(
+            target=self._process_image,
+            args=(self._image_queue, self._pose_queues, self._stop))
+        self._capture.start()
+        self._inference.start()
+        return [self._capture, self._inference]
+
+    def _stop_stages(self) -> None:
+        """Ask the capture and inference processes to stop, killing \
+        any that do not stop in time."""
+        if self._stop is not None:
+            self._stop.set()
+        deadline: float = time.monotonic() + self.stop_timeout
+        for process in (self._capture, self._inference):
+            if process is None:
+                continue
+            process.join(max(deadline - time.monotonic(), 0))
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    def _capture_and_show(self, image_queue: mpq.Queue,
+                          stop: mps.Event) -> None:
         """Infinitely retrieve new frames and place them in the image \
-        queue. Additionally, display incoming frames to the user in \
-        real-time."""
-        while True:
-            frame: np.ndarray = self.frame_input.get_frame()
-            image_queue.put(frame)
-            cv2.imshow("Video Input", frame)
-            wait_key: Any = cv2.waitKey(1)
-            if wait_key == 27:
-                pass
-
-    def _process_image(self, image_queue, pose_queues) -> None:
+        queue along with their index. Additionally, display incoming \
+        frames to the user in real-time and write them to the frame \
+        buffer and recorder if there are ones."""
+        if self.capture_settings is not None:
+            self.capture_settings.apply()
+        # The recorder is started from here so that it can finish
+        # the video once this process is stopped.
+        if self.recorder is not None:
+            self.recorder.start()
+        while not stop.is_set():
+            frame: Optional[np.ndarray] = self.frame_input.get_frame()
+            timestamp: float = time.time()
+            # Failed reads are not passed on, shown, or counted, so a
+            # camera that stops returning frames shows up as a drop
+            # in throughput
+            captured: bool = frame is not None and frame.size > 0
+            if captured:
+                frame_index: int = self._frame_index.value
+                image_queue.put((frame_index, frame))
+                if self.frame_buffer is not None:
+                    self.frame_buffer.write(frame)
+                if self.recorder is not None:
+                    self.recorder.record(frame, frame_index, timestamp)
+                self._frame_index.value = frame_index + 1
+            self.capture_heartbeat.beat(1 if captured else 0)
+            if self.show_video and captured:
+                cv2.imshow("Video Input", frame)
+                wait_key: Any = cv2.waitKey(1)
+                if wait_key == 27:
+                    pass
+        # The image queue is replaced on restart, so a frame nobody
+        # will read must not keep this process from exiting
+        image_queue.cancel_join_thread()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    def _process_image(self, image_queue: mpq.Queue,
+                       pose_queues: Iterable[mpq.Queue],
+                       stop: mps.Event) -> None:
         """Infinitely take images from the given queue and turn them into \
         pose data using a computer vision model."""
-        while True:
-            if image_queue.empty():
+        # Applied before the model is first used, so the thread
+        # pools it creates are capped too
+        if self.inference_settings is not None:
+            self.inference_settings.apply()
+        was_detected: bool = True
+        while not stop.is_set():
+            try:
+                frame_index, frame = image_queue.get(
+                    timeout=self.poll_interval)
+            except queue.Empty:
+                self.inference_heartbeat.beat(0)
+                continue
+            skeleton: np.ndarray = self.model.get_pose(frame)
+            # Only the first pose without a person is sent on, so
+            # the user interface can hide it without loggers
+            # recording the same empty pose until someone returns
+            is_detected: bool = detected(skeleton)
+            if not is_detected and not was_detected:
+                self.inference_heartbeat.beat()
                 continue
-            skeleton: np.ndarray = self.model.get_pose(image_queue.get())
-            for queue in pose_queues:
-                queue.put(skeleton)
+            was_detected = is_detected
+            for pose_queue in pose_queues:
+                pose_queue.put(skeleton)
+            if self.recorder is not None:
+                self.recorder.mark_pose(frame_index, self._pose_row.value)
+            self._pose_row.value += 1
+            self.inference_heartbeat.beat()
 
     def get_pose(self) -> np.ndarray:
         """Use the frame input and computer vision model in tandem \
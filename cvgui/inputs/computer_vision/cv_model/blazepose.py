@@ -2,6 +2,9 @@
 import logging
 import numpy as np
 import mediapipe as mp
+from cvgui.core.receiving.visibility import VISIBILITY
+from cvgui.core.receiving.topology import BLAZEPOSE_CONNECTIONS, \
+    BLAZEPOSE_LANDMARKS
 
 
 class BlazePose:
@@ -34,6 +37,11 @@ class BlazePose:
 
     DEFAULT_SCALE: int = 450
 
+    NUM_LANDMARKS: int = BLAZEPOSE_LANDMARKS
+    """Blazepose landmark count"""
+    CONNECTIONS: np.ndarray = BLAZEPOSE_CONNECTIONS
+    """Blazepose limbs"""
+
     def __init__(self, min_detection_confidence: float = 0.5,
                  min_tracking_confidence: float = 0.5,
                  model_complexity: int = 1) -> None:
@@ -51,8 +59,7 @@ class BlazePose:
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
         self.model_complexity = model_complexity
-        self.pose_array: np.ndarray = np.zeros(
-            (33, 4))  # TODO: make these constants
+        self.pose_array: np.ndarray = np.zeros((self.NUM_LANDMARKS, 4))
         self.model = None
 
     def _configure(self):
@@ -70,7 +77,13 @@ class BlazePose:
 
     def get_pose(self, frame: np.ndarray) -> np.ndarray:
         """Process an image using Google's BlazePose and \
-        returns the pose data."""
+        returns the pose data.
+
+        If no person is found, a copy of the last pose is returned \
+        with the visibility of every landmark set to 0, which \
+        `cvgui.core.receiving.detected` reports as not detected. \
+        Poses returned earlier are left as they were.
+        """
         if self.model is None:
             self._configure()
 
@@ -87,7 +100,9 @@ class BlazePose:
         except AttributeError:
             # This error is thrown when a pose
             # is not found in the image provided
-            return self.pose_array
+            missing: np.ndarray = self.pose_array.copy()
+            missing[:, VISIBILITY] = 0
+            return missing
         except KeyboardInterrupt as excpt:
             logging.info("Ctrl-C pressed...")
             raise excpt
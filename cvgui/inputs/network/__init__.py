@@ -0,0 +1,5 @@
+"""The `network` package implements a pose generator that \
+    receives poses from another machine, such as a motion \
+        capture system or a dedicated inference box."""
+from .jitter_buffer import JitterBuffer  # noqa
+from .network_pose import NetworkPose, PoseSender  # noqa
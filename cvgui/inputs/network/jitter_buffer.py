@@ -0,0 +1,159 @@
+"""The jitter_buffer module smooths out poses that arrive \
+over a network at uneven intervals."""
+import bisect
+from collections import deque
+from typing import Deque, List, Optional
+import numpy as np
+
+
+# pylint: disable-next=too-many-instance-attributes
+class JitterBuffer:
+    """An adaptive playout buffer for poses received over a network.
+
+    Poses are held for a short delay and played back on the \
+    receiver's clock at the pace they were captured at. Packets \
+    that arrive out of order are put back in order, duplicates are \
+    ignored, and poses between packets, including ones for lost \
+    packets, are linearly interpolated.
+
+    The delay adapts to the network. It grows with the jitter in \
+    transit times, estimated like RFC 3550 does, so that packets \
+    usually arrive before they are needed, and shrinks again when \
+    the network calms down.
+
+    A packet numbered further behind the newest packet than the \
+    buffer can hold is taken to be the start of a new stream, such \
+    as from a sender that restarted, and the buffer starts over.
+    """
+
+    def __init__(self, min_delay: float = 0.02, max_delay: float = 0.5,
+                 capacity: int = 64, window: int = 128) -> None:
+        """Create a new jitter buffer.
+
+        Args:
+            min_delay (float, optional): The shortest time in seconds \
+                to hold poses for. Defaults to 0.02.
+            max_delay (float, optional): The longest time in seconds \
+                to hold poses for. Defaults to 0.5.
+            capacity (int, optional): The most packets to hold. The \
+                oldest packets are discarded beyond this. Defaults to 64.
+            window (int, optional): How many recent packets to find \
+                the shortest transit time from. Defaults to 128.
+        """
+        self.min_delay: float = min_delay
+        self.max_delay: float = max_delay
+        self.capacity: int = capacity
+        self.jitter: float = 0
+        """The estimated variation in transit time in seconds."""
+        self.late: int = 0
+        """How many packets arrived after they were needed."""
+        self.duplicates: int = 0
+        """How many packets arrived more than once."""
+        self._sequences: List[int] = []
+        self._timestamps: List[float] = []
+        self._poses: List[np.ndarray] = []
+        self._transits: Deque[float] = deque(maxlen=window)
+        self._last_transit: Optional[float] = None
+        self._oldest_needed: int = -1
+        self._newest: int = -1
+        self._last_pose: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Get the number of packets being held."""
+        return len(self._sequences)
+
+    @property
+    def delay(self) -> float:
+        """How long poses are currently held for in seconds."""
+        return min(max(self.min_delay + 4 * self.jitter, self.min_delay),
+                   self.max_delay)
+
+    def put(self, sequence: int, timestamp: float, pose: np.ndarray,
+            arrival: float) -> None:
+        """Add a received packet to the buffer.
+
+        Args:
+            sequence (int): The sequence number of the packet.
+            timestamp (float): When the pose was captured, on the \
+                sender's clock.
+            pose (np.ndarray): The pose in the packet.
+            arrival (float): When the packet arrived, on the \
+                receiver's clock.
+        """
+        if sequence < self._newest - self.capacity:
+            self.reset()
+        if sequence < self._oldest_needed:
+            self.late += 1
+            return
+        index: int = bisect.bisect_left(self._sequences, sequence)
+        if index < len(self._sequences) and \
+                self._sequences[index] == sequence:
+            self.duplicates += 1
+            return
+        self._sequences.insert(index, sequence)
+        self._newest = max(self._newest, sequence)
+        self._timestamps.insert(index, timestamp)
+        self._poses.insert(index, pose)
+        if len(self._sequences) > self.capacity:
+            self._discard(1)
+
+        transit: float = arrival - timestamp
+        if self._last_transit is not None:
+            self.jitter += (abs(transit - self._last_transit) -
+                            self.jitter) / 16
+        self._last_transit = transit
+        self._transits.append(transit)
+
+    def reset(self) -> None:
+        """Forget every packet and the sender's clock, such as when \
+        a new sender connects. The last pose played is held until \
+        packets of the new stream are due."""
+        self._sequences.clear()
+        self._timestamps.clear()
+        self._poses.clear()
+        self._transits.clear()
+        self._last_transit = None
+        self._oldest_needed = -1
+        self._newest = -1
+
+    def get(self, now: float) -> Optional[np.ndarray]:
+        """Get the pose that should be played at a given time.
+
+        Args:
+            now (float): The current time on the receiver's clock.
+
+        Returns:
+            Optional[np.ndarray]: The pose to play, or None if no \
+                pose has been received yet. The last pose is held \
+                    while the buffer is waiting for new packets.
+        """
+        if not self._sequences:
+            return self._last_pose
+        # The capture time to play, assuming the fastest transit
+        # seen recently is how long the network takes with no jitter.
+        target: float = now - min(self._transits) - self.delay
+        after: int = bisect.bisect_right(self._timestamps, target)
+        if after == 0:
+            # The oldest packet is not due yet
+            return self._last_pose
+        if after == len(self._timestamps):
+            # The buffer ran dry, so hold the newest pose
+            self._discard(after - 1)
+            self._last_pose = self._poses[0]
+            return self._last_pose
+
+        self._discard(after - 1)
+        start: float = self._timestamps[0]
+        weight: float = (target - start) / (self._timestamps[1] - start)
+        self._last_pose = self._poses[0] + \
+            weight * (self._poses[1] - self._poses[0])
+        return self._last_pose
+
+    def _discard(self, count: int) -> None:
+        """Forget the oldest packets in the buffer."""
+        if count <= 0:
+            return
+        del self._sequences[:count]
+        del self._timestamps[:count]
+        del self._poses[:count]
+        self._oldest_needed = self._sequences[0]
@@ -0,0 +1,264 @@
+"""The network_pose module contains a pose generator that \
+receives poses from another machine, such as a motion capture \
+system or a dedicated inference box."""
+import logging
+import socket
+import struct
+import threading
+import time
+from typing import Iterable, Optional, Tuple
+import multiprocessing as mp
+import multiprocessing.queues as mpq
+import numpy as np
+from cvgui.core.receiving import BLAZEPOSE_LANDMARKS, Topology
+from cvgui.inputs.network.jitter_buffer import JitterBuffer
+from cvgui.inputs.network.packets import PACKET_HEADER, decode_packet, \
+    encode_packet, payload_size
+
+UDP = "udp"
+TCP = "tcp"
+
+
+def _read_packet(connection: socket.socket) -> Optional[bytes]:
+    """Read a whole packet from a stream socket, or None if the \
+    connection was closed."""
+    header: Optional[bytes] = _read_exactly(connection, PACKET_HEADER.size)
+    if header is None:
+        return None
+    payload: Optional[bytes] = _read_exactly(connection,
+                                             payload_size(header))
+    if payload is None:
+        return None
+    return header + payload
+
+
+def _read_exactly(connection: socket.socket, size: int) -> Optional[bytes]:
+    """Read a number of bytes from a stream socket, or None if the \
+    connection was closed first."""
+    data: bytearray = bytearray()
+    while len(data) < size:
+        chunk: bytes = connection.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
+
+
+# pylint: disable-next=too-many-instance-attributes
+class NetworkPose:
+    """Generates poses from packets sent over UDP or TCP.
+
+    Packets are described by `cvgui.inputs.network.packets` and \
+    can be sent with `PoseSender`. Received poses pass through a \
+    `JitterBuffer`, which puts them back in order and plays them \
+    at an even rate, filling in lost packets by interpolating.
+
+    Anyone can send packets to the port, so packets that can't be \
+    decoded, or whose pose is not shaped like the model's, are \
+    logged and ignored.
+    """
+
+    POINTS_PER_LANDMARK: int = 4
+    """The number of values for each landmark of a pose."""
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, host: str = "0.0.0.0", port: int = 9870,
+                 protocol: str = UDP, rate: float = 30.0,
+                 min_delay: float = 0.02, max_delay: float = 0.5,
+                 model: Optional[Topology] = None) -> None:
+        """Create a new network pose generator.
+
+        Args:
+            host (str, optional): The address to listen on. \
+                Defaults to "0.0.0.0".
+            port (int, optional): The port to listen on. \
+                Defaults to 9870.
+            protocol (str, optional): Either "udp" or "tcp". \
+                Defaults to "udp".
+            rate (float, optional): How many poses to send to the pose \
+                queues per second. Defaults to 30.0.
+            min_delay (float, optional): The shortest time in seconds \
+                to buffer poses for. Defaults to 0.02.
+            max_delay (float, optional): The longest time in seconds \
+                to buffer poses for. Defaults to 0.5.
+            model (Optional[Topology], optional): The model, or model \
+                class, whose poses are sent. Defaults to None, meaning \
+                    BlazePose's 33 landmarks.
+
+        Raises:
+            ValueError: If the protocol is not "udp" or "tcp".
+        """
+        if protocol not in (UDP, TCP):
+            raise ValueError(f"Unknown protocol {protocol!r}")
+        self.host: str = host
+        self.port: int = port
+        self.protocol: str = protocol
+        self.rate: float = rate
+        self.min_delay: float = min_delay
+        self.max_delay: float = max_delay
+        self.model: Optional[Topology] = model
+        """The model whose landmarks the poses have, used by the \
+            pipeline to size its pose history."""
+        self.pose_shape: Tuple[int, int] = (
+            BLAZEPOSE_LANDMARKS if model is None else model.NUM_LANDMARKS,
+            self.POINTS_PER_LANDMARK)
+        """The shape every received pose must have."""
+        self._socket: Optional[socket.socket] = None
+
+    def start(self, pose_queues: Iterable[mpq.Queue]) -> Iterable[mp.Process]:
+        """Start a process that receives poses and plays them into \
+        the pose queues.
+
+        Args:
+            pose_queues (Iterable[mpq.Queue]): The queues to put pose \
+                data into.
+
+        Returns:
+            Iterable[mp.Process]: The process started by this method.
+        """
+        receiver = mp.Process(target=self._receive_and_play,
+                              args=(pose_queues,))
+        receiver.start()
+        return [receiver]
+
+    def _receive_and_play(self, pose_queues: Iterable[mpq.Queue]) -> None:
+        """Receive packets on a background thread and play poses \
+        from the jitter buffer at an even rate."""
+        buffer: JitterBuffer = JitterBuffer(self.min_delay, self.max_delay)
+        lock: threading.Lock = threading.Lock()
+        threading.Thread(target=self._receive, args=(buffer, lock),
+                         daemon=True).start()
+
+        period: float = 1 / self.rate
+        next_frame: float = time.monotonic()
+        while True:
+            with lock:
+                pose: Optional[np.ndarray] = buffer.get(time.monotonic())
+            if pose is not None:
+                for queue in pose_queues:
+                    queue.put(pose)
+            next_frame += period
+            time.sleep(max(0, next_frame - time.monotonic()))
+
+    def _receive(self, buffer: JitterBuffer, lock: threading.Lock) -> None:
+        """Infinitely receive packets into the jitter buffer."""
+        for packet in self._packets():
+            if packet is None:
+                # A new sender numbers its packets from the start
+                with lock:
+                    buffer.reset()
+                continue
+            arrival: float = time.monotonic()
+            decoded: Optional[Tuple[int, float, np.ndarray]] = \
+                self._decode(packet)
+            if decoded is None:
+                continue
+            with lock:
+                buffer.put(*decoded, arrival)
+
+    def _decode(self, packet: bytes
+                ) -> Optional[Tuple[int, float, np.ndarray]]:
+        """Decode a packet, or log why it can't be used and return \
+        None."""
+        try:
+            sequence, timestamp, pose = decode_packet(packet)
+        except (struct.error, ValueError) as excpt:
+            logging.warning("Ignoring a malformed pose packet: %s", excpt)
+            return None
+        if pose.shape != self.pose_shape:
+            logging.warning("Ignoring a pose packet shaped %s instead of "
+                            "%s", pose.shape, self.pose_shape)
+            return None
+        return sequence, timestamp, pose
+
+    def _packets(self) -> Iterable[Optional[bytes]]:
+        """Infinitely receive packets. TCP senders are accepted one \
+        at a time, and each new connection is marked with None."""
+        if self.protocol == UDP:
+            receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            receiver.bind((self.host, self.port))
+            while True:
+                yield receiver.recv(65535)
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((self.host, self.port))
+        listener.listen(1)
+        while True:
+            connection, _ = listener.accept()
+            yield None
+            with connection:
+                while True:
+                    packet: Optional[bytes] = _read_packet(connection)
+                    if packet is None:
+                        break
+                    yield packet
+
+    def get_pose(self) -> np.ndarray:
+        """Wait for the next packet and return its pose without \
+        buffering it."""
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.bind((self.host, self.port))
+        while True:
+            decoded: Optional[Tuple[int, float, np.ndarray]] = \
+                self._decode(self._socket.recv(65535))
+            if decoded is not None:
+                return decoded[2]
+
+
+class PoseSender:
+    """Sends poses to a `NetworkPose`. Useful for running inference \
+    on another machine, or for standing in for one while testing."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9870,
+                 protocol: str = UDP) -> None:
+        """Create a new pose sender.
+
+        Args:
+            host (str, optional): The address of the receiver. \
+                Defaults to "127.0.0.1".
+            port (int, optional): The port of the receiver. \
+                Defaults to 9870.
+            protocol (str, optional): Either "udp" or "tcp". \
+                Defaults to "udp".
+
+        Raises:
+            ValueError: If the protocol is not "udp" or "tcp".
+        """
+        if protocol not in (UDP, TCP):
+            raise ValueError(f"Unknown protocol {protocol!r}")
+        self.address = (host, port)
+        self.protocol: str = protocol
+        self.sequence: int = 0
+        """The sequence number of the next pose."""
+        if protocol == UDP:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.connect(self.address)
+        else:
+            self._socket = socket.create_connection(self.address)
+
+    def send(self, pose: np.ndarray,
+             timestamp: Optional[float] = None) -> None:
+        """Send a pose.
+
+        Args:
+            pose (np.ndarray): The pose to send.
+            timestamp (Optional[float], optional): When the pose was \
+                captured. Defaults to None, meaning now.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        packet: bytes = encode_packet(self.sequence, timestamp, pose)
+        self.sequence += 1
+        try:
+            self._socket.sendall(packet)
+        except ConnectionRefusedError:
+            # Datagrams are lost while nothing is listening, which
+            # the receiver handles like any other lost packet
+            if self.protocol == TCP:
+                raise
+
+    def close(self) -> None:
+        """Close the connection to the receiver."""
+        self._socket.close()
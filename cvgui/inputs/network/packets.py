@@ -0,0 +1,59 @@
+"""The packets module describes how poses are encoded when \
+they are sent to a `cvgui.inputs.network.NetworkPose`."""
+import struct
+from typing import Tuple
+import numpy as np
+
+PACKET_HEADER: struct.Struct = struct.Struct("<IdHH")
+"""Starts every packet: a uint32 sequence number, the float64 \
+time the pose was captured at on the sender's clock, and the \
+number of landmarks and values per landmark. The pose follows \
+as little endian float32 values."""
+
+
+def encode_packet(sequence: int, timestamp: float,
+                  pose: np.ndarray) -> bytes:
+    """Encode a pose as a packet.
+
+    Args:
+        sequence (int): The number of poses sent before this one.
+        timestamp (float): When the pose was captured.
+        pose (np.ndarray): The pose, shaped (landmarks, values).
+
+    Returns:
+        bytes: The encoded packet.
+    """
+    return PACKET_HEADER.pack(sequence, timestamp, *pose.shape) + \
+        pose.astype("<f4", copy=False).tobytes()
+
+
+def payload_size(header: bytes) -> int:
+    """Get the number of bytes of pose data that follow a \
+    packet header.
+
+    Args:
+        header (bytes): The packet header.
+
+    Returns:
+        int: The size of the pose data in bytes.
+    """
+    _, _, landmarks, values = PACKET_HEADER.unpack(header)
+    return landmarks * values * 4
+
+
+def decode_packet(packet: bytes) -> Tuple[int, float, np.ndarray]:
+    """Decode a packet.
+
+    Args:
+        packet (bytes): The packet header followed by its pose data.
+
+    Returns:
+        Tuple[int, float, np.ndarray]: The sequence number, capture \
+            time, and pose of the packet.
+    """
+    sequence, timestamp, landmarks, values = PACKET_HEADER.unpack_from(
+        packet)
+    pose: np.ndarray = np.frombuffer(
+        packet, dtype="<f4", offset=PACKET_HEADER.size,
+        count=landmarks * values).reshape(landmarks, values)
+    return sequence, timestamp, pose
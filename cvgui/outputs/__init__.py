@@ -2,3 +2,5 @@
 related to any output produced by activities."""
 
 from .loggers import *  # noqa
+from .recorders import *  # noqa
+from .streaming import *  # noqa
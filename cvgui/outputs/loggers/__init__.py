@@ -2,3 +2,10 @@
     interfaces located in the `cvgui.core.logging` \
         package."""
 from .csv_logger import CSVPoseLogger  # noqa
+from .binary_logger import (  # noqa
+    BinaryPoseLogger,
+    convert_from_csv,
+    convert_to_csv,
+    read_binary_log
+  )
+from .session_reader import SessionReader  # noqa
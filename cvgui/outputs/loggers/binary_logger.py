@@ -0,0 +1,238 @@
+"""The `binary_logger` module contains classes related \
+to logging data to compact binary files."""
+import itertools
+from pathlib import Path
+import struct
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+from cvgui.outputs.loggers.csv_logger import build_csv_header, write_csv_rows
+from cvgui.outputs.loggers.queued_logger import QueuedPoseLogger
+
+MAGIC: bytes = b"CVGUIPOS"
+"""The bytes every binary pose log starts with."""
+
+VERSION: int = 1
+"""The version of the binary pose log format."""
+
+HEADER_SIZE: int = 64
+"""The number of bytes before the first record of a binary pose log."""
+
+# Magic, version, header size, landmarks, values per landmark, rows
+_HEADER_FORMAT: str = "<8sHHHHQ"
+
+
+def record_dtype(pose_shape: Tuple[int, int]) -> np.dtype:
+    """Get the layout of a single record in a binary pose log.
+
+    Args:
+        pose_shape (Tuple[int, int]): The number of landmarks and \
+            values per landmark in a pose.
+
+    Returns:
+        np.dtype: A float64 timestamp followed by the float32 pose.
+    """
+    return np.dtype([("timestamp", "<f8"), ("pose", "<f4", pose_shape)])
+
+
+def read_binary_log(filepath: Path) -> np.ndarray:
+    """Memory map the records of a binary pose log without \
+    reading them.
+
+    Args:
+        filepath (Path): The binary pose log to read.
+
+    Raises:
+        ValueError: If the file is not a binary pose log.
+
+    Returns:
+        np.ndarray: The records, with "timestamp" and "pose" fields.
+    """
+    with open(filepath, "rb") as file:
+        header: bytes = file.read(struct.calcsize(_HEADER_FORMAT))
+    magic, _, header_size, landmarks, values, rows = \
+        struct.unpack(_HEADER_FORMAT, header)
+    if magic != MAGIC:
+        raise ValueError(f"{filepath} is not a binary pose log")
+    if rows == 0:
+        return np.zeros(0, dtype=record_dtype((landmarks, values)))
+    return np.memmap(filepath, dtype=record_dtype((landmarks, values)),
+                     mode="r", offset=header_size, shape=(rows,))
+
+
+def convert_to_csv(binary_path: Path, csv_path: Path,
+                   block_rows: int = 4096) -> None:
+    """Convert a binary pose log to the csv format written by \
+    `cvgui.outputs.loggers.CSVPoseLogger`.
+
+    Args:
+        binary_path (Path): The binary pose log to read.
+        csv_path (Path): Where to write the csv file.
+        block_rows (int, optional): How many records to convert \
+            at once. Defaults to 4096.
+    """
+    records: np.ndarray = read_binary_log(binary_path)
+    size: int = int(np.prod(records["pose"].shape[1:]))
+    with open(csv_path, "w", encoding="utf-8") as file:
+        file.write(build_csv_header(size) + "\n")
+        for start in range(0, len(records), block_rows):
+            block: np.ndarray = records[start:start + block_rows]
+            rows: np.ndarray = np.empty((len(block), size + 1))
+            rows[:, 0] = block["timestamp"]
+            rows[:, 1:] = block["pose"].reshape(len(block), size)
+            write_csv_rows(file, rows, block_rows)
+
+
+def convert_from_csv(csv_path: Path, binary_path: Path,
+                     block_rows: int = 4096) -> None:
+    """Convert a csv file written by \
+    `cvgui.outputs.loggers.CSVPoseLogger` to a binary pose log.
+
+    The csv file is read a block of rows at a time, so files \
+    larger than memory can be converted.
+
+    Args:
+        csv_path (Path): The csv file to read.
+        binary_path (Path): Where to write the binary pose log.
+        block_rows (int, optional): How many rows to convert \
+            at once. Defaults to 4096.
+    """
+    with open(csv_path, encoding="utf-8") as csv_file, \
+            open(binary_path, "wb") as binary_file:
+        # Every landmark has an x, y, z, and visibility column
+        landmarks: int = (len(csv_file.readline().split(",")) - 1) // 4
+        dtype: np.dtype = record_dtype((landmarks, 4))
+        binary_file.write(bytes(HEADER_SIZE))
+        rows: int = 0
+        while True:
+            lines: List[str] = list(itertools.islice(csv_file, block_rows))
+            if not lines:
+                break
+            block: np.ndarray = np.loadtxt(lines, delimiter=",", ndmin=2)
+            records: np.ndarray = np.empty(len(block), dtype=dtype)
+            records["timestamp"] = block[:, 0]
+            records["pose"] = block[:, 1:].reshape(len(block), landmarks, 4)
+            binary_file.write(records.tobytes())
+            rows += len(block)
+        binary_file.seek(0)
+        binary_file.write(struct.pack(_HEADER_FORMAT, MAGIC, VERSION,
+                                      HEADER_SIZE, landmarks, 4, rows))
+
+
+class BinaryPoseLogger(QueuedPoseLogger):
+    """A pose logger that saves data to a binary file.
+
+    Each pose is written as a fixed-width record holding a float64 \
+    timestamp and the float32 pose, following a small header that \
+    describes the shape of the pose. Records are written straight \
+    into a memory mapped file that grows a chunk at a time, and the \
+    number of records in the header is updated on every flush.
+    """
+
+    def __init__(self, filepath: Path, chunk_rows: int = 18000,
+                 flush_interval: float = 1.0) -> None:
+        """Create a new binary logger.
+
+        Args:
+            filepath (Path): The path to where the binary log \
+                file should be saved.
+            chunk_rows (int, optional): How many records to grow the \
+                file by when it is full. Defaults to 18000, which \
+                    is 10 minutes at 30 poses per second.
+            flush_interval (float, optional): The most seconds \
+                between flushing records to the disk. Defaults to 1.0.
+        """
+        super().__init__()
+        self.filepath: Path = Path(filepath)
+        self.chunk_rows: int = chunk_rows
+        self.flush_interval: float = flush_interval
+        self.count: int = 0
+        """How many poses have been logged."""
+        self._records: Optional[np.memmap] = None
+        self._pose_shape: Tuple[int, int] = (0, 0)
+        self._last_flush: float = time.time()
+
+    def _configure(self, pose_shape: Tuple[int, int]) -> None:
+        """Create the file and write its header."""
+        self._pose_shape = pose_shape
+        with open(self.filepath, "wb") as file:
+            file.write(self._header())
+        self._resize(self.chunk_rows)
+
+    def _header(self) -> bytes:
+        """Create the file header for the current number of records."""
+        return struct.pack(_HEADER_FORMAT, MAGIC, VERSION, HEADER_SIZE,
+                           self._pose_shape[0], self._pose_shape[1],
+                           self.count).ljust(HEADER_SIZE, b"\0")
+
+    def _resize(self, rows: int) -> None:
+        """Size the file to hold the given number of records and \
+        memory map it."""
+        dtype: np.dtype = record_dtype(self._pose_shape)
+        if self._records is not None:
+            self._records.flush()
+            self._records = None
+        with open(self.filepath, "r+b") as file:
+            file.truncate(HEADER_SIZE + rows * dtype.itemsize)
+        self._records = np.memmap(self.filepath, dtype=dtype, mode="r+",
+                                  offset=HEADER_SIZE, shape=(rows,))
+
+    def _append(self, pose_data: np.ndarray) -> None:
+        """Write a pose and the current time to the next record.
+
+        Args:
+            pose_data (np.ndarray): The pose to add.
+        """
+        if self._records is None:
+            self._configure(pose_data.shape)
+        elif self.count == len(self._records):
+            self._resize(self.count + self.chunk_rows)
+
+        self._records["timestamp"][self.count] = time.time()
+        self._records["pose"][self.count] = pose_data
+        self.count += 1
+
+    def _flush_due(self) -> bool:
+        """Check if the flush interval has passed."""
+        return time.time() - self._last_flush >= self.flush_interval
+
+    def _flush(self) -> None:
+        """Flush records to the disk and record how many there are."""
+        self._last_flush = time.time()
+        if self._records is None:
+            return
+        self._records.flush()
+        with open(self.filepath, "r+b") as file:
+            file.write(self._header())
+
+    def _save(self) -> None:
+        """Flush records to the disk."""
+        self._flush()
+
+    def _close_file(self) -> None:
+        """Flush records and trim the unused space from the file."""
+        if self._records is None:
+            return
+        self._flush()
+        self._resize(self.count)
+        self._records = None
+
+    def write(self, pose_data: np.ndarray) -> None:
+        """Log a pose from the calling process, flushing records \
+        to the disk if the flush interval has passed.
+
+        Args:
+            pose_data (np.ndarray): The pose to log.
+        """
+        self._append(pose_data)
+        if self._flush_due():
+            self._flush()
+
+    def flush(self) -> None:
+        """Flush records to the disk from the calling process."""
+        self._flush()
+
+    def finish(self) -> None:
+        """Flush records and trim the file from the calling \
+        process."""
+        self._close_file()
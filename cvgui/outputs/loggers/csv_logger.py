@@ -3,110 +3,242 @@ classes related to logging data to csv \
 files."""
 from pathlib import Path
 import time
-from typing import Iterable, List
-import multiprocessing as mp
-import multiprocessing.queues as mpq
+from typing import IO, List, Optional
 import numpy as np
-
-
-class CSVPoseLogger:
-    """A pose logger that saves data to a csv file."""
-
-    active: bool = True
-    """Whether the logger should be actively saving \
-        pose data."""
-
-    def __init__(self, filepath: Path) -> None:
+from cvgui.outputs.loggers.queued_logger import QueuedPoseLogger
+
+
+def build_csv_header(size: int) -> str:
+    """
+    Create the header of a pose csv file.
+
+    This method assumes each pose point has 4 points \
+        (x, y, z, visibility).
+
+    Args:
+        size (int): The number of values in a pose.
+
+    Returns:
+        str: The column names, separated by commas.
+    """
+    header_array: List[str] = []
+    for i in range(size//4):
+        header_array += [f"x{i:02d}", f"y{i:02d}",
+                         f"z{i:02d}", f"vis{i:02d}"]
+    return "timestamp," + ",".join(header_array)
+
+
+def write_csv_rows(file: IO[str], rows: np.ndarray,
+                   block_rows: int = 4096) -> None:
+    """Format rows of data as csv and write them to a file.
+
+    Blocks of rows are formatted with a single string format \
+    operation rather than one per value.
+
+    Args:
+        file (IO[str]): The file to write to.
+        rows (np.ndarray): The rows to write.
+        block_rows (int, optional): How many rows to format at once. \
+            Defaults to 4096.
+    """
+    row_format: str = ",".join(["%5.5f"] * rows.shape[1]) + "\n"
+    for start in range(0, len(rows), block_rows):
+        block: np.ndarray = rows[start:start + block_rows]
+        file.write((row_format * len(block)) % tuple(block.ravel()))
+
+
+# pylint: disable-next=too-many-instance-attributes
+class CSVPoseLogger(QueuedPoseLogger):
+    """A pose logger that saves data to a csv file.
+
+    By default, every pose is kept in memory and the whole file is \
+    rewritten each time the logger is saved. In streaming mode, new \
+    poses are instead appended to the file every few seconds or \
+    poses and then dropped from memory, optionally starting a new \
+    file once the current one gets too big or too old.
+    """
+
+    INITIAL_ROWS: int = 1024
+    """How many poses to make room for before the \
+        internal array first needs to grow."""
+
+    FORMAT_ROWS: int = 4096
+    """How many rows to format into text at once when saving."""
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, filepath: Path, streaming: bool = False,
+                 flush_interval: float = 1.0, flush_rows: int = 300,
+                 rotate_bytes: Optional[int] = None,
+                 rotate_seconds: Optional[float] = None) -> None:
         """Create a new csv logger.
 
         Args:
             filepath (Path): The path to where the csv log \
                 file should be saved.
+            streaming (bool, optional): Whether to append new poses \
+                to the file as they arrive instead of rewriting the \
+                    whole file on save. Defaults to False.
+            flush_interval (float, optional): In streaming mode, \
+                the most seconds poses wait before being written. \
+                    Defaults to 1.0.
+            flush_rows (int, optional): In streaming mode, the most \
+                poses that wait before being written. Defaults to 300.
+            rotate_bytes (Optional[int], optional): In streaming \
+                mode, start a new file once the current one reaches \
+                    this size. Defaults to None, meaning never.
+            rotate_seconds (Optional[float], optional): In streaming \
+                mode, start a new file once the current one has been \
+                    open this long. Defaults to None, meaning never.
+
+        Rotated files are numbered, so a `filepath` of `poses.csv` \
+        is written as `poses_0000.csv`, `poses_0001.csv`, and so on.
         """
-        self.filepath: Path = filepath
-        self.data: np.ndarray = None
+        super().__init__()
+        self.filepath: Path = Path(filepath)
         self.size: int = 0
-        self.count = 0
-        self._save_queue: mpq.Queue
-
-    def start(self, pose_queue: mpq.Queue) -> Iterable[mp.Process]:
-        """Initialize the CSVLogger.
-
-        This needs to be done here instead of the init function \
-            because of how windows multiprocessing works.
-
-        Args:
-            pose_queue (mpq.Queue): The queue where pose data \
-                will be coming in.
-
-        Returns:
-            Iterable[mp.Process]: Any processes created by the \
-                logger that will need to be cleaned up later.
-        """
-        self._save_queue = mp.Queue()
-        cap = mp.Process(target=self._log_data, args=(
-            pose_queue, self._save_queue))
-        cap.start()
-        return [cap]
+        self.count: int = 0
+        """How many poses are held in memory."""
+        self._buffer: Optional[np.ndarray] = None
+
+        self.streaming: bool = streaming
+        self.flush_interval: float = flush_interval
+        self.flush_rows: int = flush_rows
+        self.rotate_bytes: Optional[int] = rotate_bytes
+        self.rotate_seconds: Optional[float] = rotate_seconds
+        self._file: Optional[IO[str]] = None
+        self._file_index: int = 0
+        self._file_opened: float = 0
+        self._last_flush: float = time.time()
+
+    @property
+    def data(self) -> Optional[np.ndarray]:
+        """The logged poses, one row per pose with the \
+            timestamp in the first column."""
+        if self._buffer is None:
+            return None
+        return self._buffer[:self.count]
 
     def _configure(self, size) -> None:
         # Add one to make room for the timestamp
-        self.data = np.empty((0, size + 1))
+        self._buffer = np.empty((self.INITIAL_ROWS, size + 1))
         self.size = size
 
-    def _log_data(self, pose_queue: mpq.Queue, save_queue: mpq.Queue) -> None:
-        """Get data from queue and add it to the internal numpy array.
+    def _grow(self) -> None:
+        """Double the number of rows in the internal array. \
+        Doubling keeps the cost of appending a pose constant \
+        on average no matter how long the session is."""
+        buffer: np.ndarray = np.empty(
+            (2 * len(self._buffer), self._buffer.shape[1]))
+        buffer[:self.count] = self._buffer[:self.count]
+        self._buffer = buffer
+
+    def _append(self, pose_data: np.ndarray) -> None:
+        """Add a pose and the current time to the internal numpy array.
 
         Args:
-            pose_queue (mpq.Queue): The queue of pose data coming in.
-            save_queue (mpq.Queue): The queue to notify of when to save.
+            pose_data (np.ndarray): The pose to add.
         """
-        while True:
-            if self.active:
-                if pose_queue.empty():
-                    continue
-
-                pose_data: np.ndarray = pose_queue.get()
-                newdata: np.ndarray = pose_data.ravel()
+        # Create numpy array if not already created
+        if self._buffer is None:
+            self._configure(pose_data.size)
+
+        if self.count == len(self._buffer):
+            self._grow()
+
+        # Write the timestamp and pose directly into the next row
+        row: np.ndarray = self._buffer[self.count]
+        row[0] = time.time()
+        row[1:] = pose_data.ravel()
+        self.count += 1
+
+    def _save(self) -> None:
+        """Write the data held in memory to the disk."""
+        if self.streaming:
+            self._flush()
+        else:
+            self._save_to_csv()
 
-                # Create numpy array if not already created
-                if self.data is None:
-                    data_length: int = newdata.shape[0]
-                    self._configure(data_length)
+    def _save_to_csv(self) -> None:
+        """Rewrite the whole csv file with every logged pose."""
+        with open(self.filepath, "w", encoding="utf-8") as file:
+            file.write(self._build_header() + "\n")
+            if self.data is not None:
+                self._write_rows(file, self.data)
+
+    def _write_rows(self, file: IO[str], rows: np.ndarray) -> None:
+        """Format rows of data as csv and write them to a file."""
+        write_csv_rows(file, rows, self.FORMAT_ROWS)
+
+    def _flush_due(self) -> bool:
+        """Check if, in streaming mode, enough time has passed or \
+        enough poses are waiting to append them to the file."""
+        return self.streaming and (
+            self.count >= self.flush_rows or (
+                self.count > 0 and
+                time.time() - self._last_flush >= self.flush_interval))
+
+    def _flush(self) -> None:
+        """Append the poses held in memory to the file, then \
+        forget them."""
+        self._last_flush = time.time()
+        if self.count == 0:
+            return
+        if self._file is None:
+            self._open_file()
+        self._write_rows(self._file, self.data)
+        self._file.flush()
+        self.count = 0
 
-                # insert timestamp into first index
-                newdata = np.insert(newdata, 0, [time.time()])
-                self.data = np.vstack([self.data, newdata])
+        if (self.rotate_bytes is not None and
+                self._file.tell() >= self.rotate_bytes) or \
+                (self.rotate_seconds is not None and
+                 time.time() - self._file_opened >= self.rotate_seconds):
+            self._file.close()
+            self._file = None
+            self._file_index += 1
+
+    def _open_file(self) -> None:
+        """Open the next file to stream poses to and write its \
+        header."""
+        filepath: Path = self.filepath
+        if self.rotate_bytes is not None or self.rotate_seconds is not None:
+            filepath = filepath.with_name(
+                f"{filepath.stem}_{self._file_index:04d}{filepath.suffix}")
+        # Stays open between flushes, so it can't use a with block
+        self._file = open(  # pylint: disable=consider-using-with
+            filepath, "w", encoding="utf-8")
+        self._file.write(self._build_header() + "\n")
+        self._file_opened = time.time()
 
-                # Save the data if the save queue has been pushed
-                # to or if data hasn't been saved for 1 second.
-                if not save_queue.empty():
-                    save_queue.get()
-                    self._save_to_csv()
+    def _build_header(self) -> str:
+        """Create the csv file header."""
+        return build_csv_header(self.size)
 
-    def _save_to_csv(self) -> None:
-        header: str = self._build_header()
-        np.savetxt(self.filepath, self.data, header=header,
-                   delimiter=",", fmt="%5.5f", comments="")
+    def _close_file(self) -> None:
+        """Write the data held in memory to the disk and close the \
+        file being streamed to."""
+        self._save()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
-    def _build_header(self) -> str:
-        """
-        Create the csv file header.
+    def write(self, pose_data: np.ndarray) -> None:
+        """Log a pose from the calling process, appending it to \
+        the file if a flush is due in streaming mode.
 
-        This method assumes each pose point has 4 points \
-            (x, y, z, visibility).
+        Args:
+            pose_data (np.ndarray): The pose to log.
         """
-        header_array: List[str] = []
-        for i in range(self.size//4):
-            header_array += [f"x{i:02d}", f"y{i:02d}",
-                             f"z{i:02d}", f"vis{i:02d}"]
-        return "timestamp," + ",".join(header_array)
-
-    def save(self) -> None:
-        """Write the most current data to the disk."""
-        self._save_queue.put(0)
-
-    def close(self) -> None:
-        """Finish writing to the file."""
-        self._save_queue.put(0)
-        self.active = False
+        self._append(pose_data)
+        if self._flush_due():
+            self._flush()
+
+    def flush(self) -> None:
+        """Write the data held in memory to the disk from the \
+        calling process."""
+        self._save()
+
+    def finish(self) -> None:
+        """Write the data held in memory to the disk and close \
+        the file from the calling process."""
+        self._close_file()
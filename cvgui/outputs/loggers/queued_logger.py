@@ -0,0 +1,109 @@
+"""The `queued_logger` module contains the process loop shared \
+by loggers that read poses from a queue."""
+from abc import ABC, abstractmethod
+import queue
+from typing import Iterable
+import multiprocessing as mp
+import multiprocessing.queues as mpq
+import numpy as np
+
+_SAVE = 0
+_CLOSE = 1
+
+
+class QueuedPoseLogger(ABC):
+    """A pose logger that runs in its own process, adding poses \
+    from a queue and writing them out when asked to.
+
+    Subclasses decide how poses are stored by defining `_append`, \
+    `_flush_due`, `_flush`, `_save`, and `_close_file`, and can't \
+    be created until they all are. The process stops once the file \
+    is closed, disconnecting the pose queue if it is a \
+    `cvgui.pipeline.Channel` so the pose input doesn't block on \
+    poses no one will read.
+    """
+
+    active: bool = True
+    """Whether the logger should be actively saving \
+        pose data."""
+
+    def __init__(self) -> None:
+        """Create a new queued logger."""
+        self._save_queue: mpq.Queue
+
+    def start(self, pose_queue: mpq.Queue) -> Iterable[mp.Process]:
+        """Initialize the logger.
+
+        This needs to be done here instead of the init function \
+            because of how windows multiprocessing works.
+
+        Args:
+            pose_queue (mpq.Queue): The queue where pose data \
+                will be coming in.
+
+        Returns:
+            Iterable[mp.Process]: Any processes created by the \
+                logger that will need to be cleaned up later.
+        """
+        self._save_queue = mp.Queue()
+        cap = mp.Process(target=self._log_data, args=(
+            pose_queue, self._save_queue))
+        cap.start()
+        return [cap]
+
+    def _log_data(self, pose_queue: mpq.Queue, save_queue: mpq.Queue) -> None:
+        """Get data from queue and log it until the file is closed.
+
+        Args:
+            pose_queue (mpq.Queue): The queue of pose data coming in.
+            save_queue (mpq.Queue): The queue to notify of when to save.
+        """
+        while True:
+            try:
+                self._append(pose_queue.get(timeout=0.1))
+            except queue.Empty:
+                pass
+
+            if self._flush_due():
+                self._flush()
+
+            # Save the data if the save queue has been pushed to
+            if not save_queue.empty():
+                if save_queue.get() == _CLOSE:
+                    # Nothing is left to do once the file is closed
+                    self._close_file()
+                    disconnect = getattr(pose_queue, "disconnect", None)
+                    if disconnect is not None:
+                        disconnect()
+                    return
+                self._save()
+
+    @abstractmethod
+    def _append(self, pose_data: np.ndarray) -> None:
+        """Add a pose and the current time to the log."""
+
+    @abstractmethod
+    def _flush_due(self) -> bool:
+        """Check if poses should be written to the file."""
+
+    @abstractmethod
+    def _flush(self) -> None:
+        """Write the poses that are due to the file."""
+
+    @abstractmethod
+    def _save(self) -> None:
+        """Write the data held in memory to the disk."""
+
+    @abstractmethod
+    def _close_file(self) -> None:
+        """Write the data held in memory to the disk and close \
+        the file."""
+
+    def save(self) -> None:
+        """Write the most current data to the disk."""
+        self._save_queue.put(_SAVE)
+
+    def close(self) -> None:
+        """Finish writing to the file."""
+        self._save_queue.put(_CLOSE)
+        self.active = False
@@ -0,0 +1,141 @@
+"""The `session_reader` module contains classes related \
+to querying logged sessions without reading them into memory."""
+import os
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Tuple, Union
+import numpy as np
+from cvgui.outputs.loggers.binary_logger import MAGIC, convert_from_csv, \
+    read_binary_log
+
+Landmarks = Union[slice, Sequence[int], None]
+"""Which landmarks to select from each pose."""
+
+
+class SessionReader:
+    """Reads a logged session through a memory map.
+
+    Binary pose logs are mapped directly. Csv logs are converted to \
+    a binary pose log next to them the first time they are read, \
+    which is reused until the csv file changes.
+
+    Records are fixed-width and ordered by time, so the timestamp \
+    column is itself the index, and time ranges are found with a \
+    binary search that only touches a handful of pages. Queries \
+    return views of the mapped file rather than copies.
+    """
+
+    CACHE_SUFFIX: str = ".bin"
+    """Added to the name of a csv log to name its binary copy."""
+
+    def __init__(self, filepath: Path) -> None:
+        """Open a logged session.
+
+        Args:
+            filepath (Path): A binary pose log or a csv file \
+                written by `cvgui.outputs.loggers.CSVPoseLogger`.
+        """
+        self.filepath: Path = Path(filepath)
+        with open(self.filepath, "rb") as file:
+            is_binary: bool = file.read(len(MAGIC)) == MAGIC
+        self.binary_path: Path = self.filepath if is_binary else \
+            self.filepath.with_name(self.filepath.name + self.CACHE_SUFFIX)
+        if not is_binary and self._cache_stale():
+            convert_from_csv(self.filepath, self.binary_path)
+        self.records: np.ndarray = read_binary_log(self.binary_path)
+
+    def _cache_stale(self) -> bool:
+        """Check if the binary copy of a csv log is missing or \
+        older than the csv log."""
+        return not self.binary_path.exists() or \
+            os.path.getmtime(self.binary_path) < \
+            os.path.getmtime(self.filepath)
+
+    def __len__(self) -> int:
+        """Get the number of poses in the session."""
+        return len(self.records)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """When each pose was logged."""
+        return self.records["timestamp"]
+
+    @property
+    def poses(self) -> np.ndarray:
+        """Every pose in the session, with the shape \
+            (poses, landmarks, values per landmark)."""
+        return self.records["pose"]
+
+    def rows(self, start: Optional[float] = None,
+             end: Optional[float] = None) -> slice:
+        """Find the rows logged within a span of time.
+
+        Args:
+            start (Optional[float], optional): The earliest time to \
+                include. Defaults to None, meaning the first pose.
+            end (Optional[float], optional): The time to stop before. \
+                Defaults to None, meaning after the last pose.
+
+        Returns:
+            slice: The rows logged at or after `start` and \
+                before `end`.
+        """
+        timestamps: np.ndarray = self.timestamps
+        first: int = 0 if start is None else \
+            int(np.searchsorted(timestamps, start, side="left"))
+        last: int = len(self) if end is None else \
+            int(np.searchsorted(timestamps, end, side="left"))
+        return slice(first, max(first, last))
+
+    def query(self, start: Optional[float] = None,
+              end: Optional[float] = None,
+              landmarks: Landmarks = None
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the poses logged within a span of time.
+
+        Args:
+            start (Optional[float], optional): The earliest time to \
+                include. Defaults to None, meaning the first pose.
+            end (Optional[float], optional): The time to stop before. \
+                Defaults to None, meaning after the last pose.
+            landmarks (Landmarks, optional): Which landmarks to \
+                include. A slice returns a view, while a sequence of \
+                    indices copies just the selected poses. \
+                        Defaults to None, meaning every landmark.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The timestamps and poses.
+        """
+        return self._select(self.rows(start, end), landmarks)
+
+    def chunks(self, size: int = 65536, start: Optional[float] = None,
+               end: Optional[float] = None, landmarks: Landmarks = None
+               ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Iterate over the poses logged within a span of time a \
+        fixed number of poses at a time.
+
+        Args:
+            size (int, optional): The most poses in each chunk. \
+                Defaults to 65536.
+            start (Optional[float], optional): The earliest time to \
+                include. Defaults to None, meaning the first pose.
+            end (Optional[float], optional): The time to stop before. \
+                Defaults to None, meaning after the last pose.
+            landmarks (Landmarks, optional): Which landmarks to \
+                include. Defaults to None, meaning every landmark.
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: The timestamps and poses \
+                of each chunk.
+        """
+        rows: slice = self.rows(start, end)
+        for first in range(rows.start, rows.stop, size):
+            yield self._select(slice(first, min(first + size, rows.stop)),
+                               landmarks)
+
+    def _select(self, rows: slice, landmarks: Landmarks
+                ) -> Tuple[np.ndarray, np.ndarray]:
+        """Select rows and landmarks from the session."""
+        poses: np.ndarray = self.poses[rows]
+        if landmarks is not None:
+            poses = poses[:, landmarks]
+        return self.timestamps[rows], poses
@@ -0,0 +1,4 @@
+"""The `recorders` package contains classes that record \
+the raw input of a session so it can be processed again \
+later."""
+from .session_recorder import SessionRecorder  # noqa
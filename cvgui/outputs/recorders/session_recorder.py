@@ -0,0 +1,232 @@
+"""The session_recorder module contains classes related \
+to recording the raw video of a session."""
+from collections import deque
+from pathlib import Path
+import queue
+from typing import IO, Any, Deque, Dict, Iterable, Optional, Tuple
+import multiprocessing as mp
+import multiprocessing.queues as mpq
+import cv2
+import numpy as np
+
+SIDECAR_HEADER: str = "video_frame,capture_frame,timestamp,pose_row"
+"""The header of the frame index written next to each video."""
+
+
+# pylint: disable-next=too-many-instance-attributes
+class SessionRecorder:
+    """Records captured frames to a video file from its own process.
+
+    Alongside the video, a csv sidecar file with the suffix \
+    `.frames.csv` links every recorded frame to the index and time \
+    it was captured at, and to the row of the pose made from it. \
+    Pose rows count every pose sent to the activity's pose loggers \
+    starting at zero, and are -1 for frames that inference skipped.
+
+    Recording never waits on the encoder. If frames arrive faster \
+    than they can be encoded, new frames are dropped until the \
+    recorder catches up.
+
+    Before the recorder is started again, such as when stalled \
+    capture and inference processes are restarted, `new_segment` \
+    should be called so it records a new numbered segment, and \
+    `session.avi` is followed by `session_0001.avi` and so on.
+    """
+
+    def __init__(self, filepath: Path, fps: float = 30.0,
+                 fourcc: str = "MJPG", max_pending: int = 8,
+                 poll_interval: float = 0.5) -> None:
+        """Create a new session recorder.
+
+        Args:
+            filepath (Path): The path to where the video should \
+                be saved.
+            fps (float, optional): The frame rate stored in the \
+                video file. Use the sidecar timestamps for exact \
+                    timing. Defaults to 30.0.
+            fourcc (str, optional): The four character code of the \
+                codec to encode frames with. Defaults to "MJPG", \
+                    which is cheap to encode.
+            max_pending (int, optional): How many frames can wait \
+                to be encoded before new frames are dropped. \
+                    Defaults to 8.
+            poll_interval (float, optional): The most seconds to wait \
+                for a frame before checking if the process that \
+                    started the recorder has stopped. Defaults to 0.5.
+        """
+        self.filepath: Path = Path(filepath)
+        self.sidecar_path: Path = self.filepath.with_suffix(".frames.csv")
+        self.fps: float = fps
+        self.fourcc: str = fourcc
+        self.poll_interval: float = poll_interval
+        self.max_pending: int = max_pending
+        self._segment: int = 0
+        """The number of the segment the recorder will record."""
+        self._frame_queue: mpq.Queue = mp.Queue(max_pending)
+        self._pose_queue: mpq.Queue = mp.Queue()
+        self._dropped: Any = mp.Value("Q", 0)
+        self._size: Optional[Tuple[int, int]] = None
+        """The width and height of the video, set by its first frame."""
+
+    @property
+    def dropped(self) -> int:
+        """The number of frames dropped because the encoder \
+            fell behind."""
+        return self._dropped.value
+
+    def new_segment(self) -> None:
+        """Record into a new numbered segment the next time the \
+        recorder is started.
+
+        The segment gets its own frame and pose queues, so neither \
+        frames nor pose rows of the new segment reach the recorder \
+        that is still finishing the last one. Call this from the \
+        process that starts both the process calling `record` and \
+        the one calling `mark_pose`, before starting them.
+        """
+        self._segment += 1
+        self._frame_queue = mp.Queue(self.max_pending)
+        self._pose_queue = mp.Queue()
+
+    def start(self) -> Iterable[mp.Process]:
+        """Start the process that encodes frames of the \
+        current segment.
+
+        The recorder finishes the video on its own once the process \
+        that started it stops, so it is started by the capture \
+        process rather than next to it.
+
+        Returns:
+            Iterable[mp.Process]: The recorder's process.
+        """
+        filepath: Path = self.filepath
+        if self._segment > 0:
+            filepath = filepath.with_name(
+                f"{filepath.stem}_{self._segment:04d}{filepath.suffix}")
+        recorder = mp.Process(target=self._record, args=(
+            self._frame_queue, self._pose_queue, filepath))
+        recorder.start()
+        return [recorder]
+
+    def record(self, frame: np.ndarray, frame_index: int,
+               timestamp: float) -> bool:
+        """Hand a captured frame to the recorder without waiting.
+
+        Args:
+            frame (np.ndarray): The captured bgr frame.
+            frame_index (int): The index the frame was captured at.
+            timestamp (float): The time the frame was captured at.
+
+        Returns:
+            bool: Whether the frame will be recorded. False if it \
+                was dropped because the encoder fell behind.
+        """
+        try:
+            self._frame_queue.put_nowait((frame_index, timestamp, frame))
+        except queue.Full:
+            with self._dropped.get_lock():
+                self._dropped.value += 1
+            return False
+        return True
+
+    def mark_pose(self, frame_index: int, pose_row: int) -> None:
+        """Record which pose was made from a captured frame.
+
+        Args:
+            frame_index (int): The index the frame was captured at.
+            pose_row (int): The row of the pose made from the frame.
+        """
+        self._pose_queue.put_nowait((frame_index, pose_row))
+
+    def close(self) -> None:
+        """Finish the video once every pending frame is encoded."""
+        self._frame_queue.put(None)
+
+    def _record(self, frame_queue: mpq.Queue, pose_queue: mpq.Queue,
+                filepath: Path) -> None:
+        """Encode frames until the recorder is closed or the \
+        process that started it stops.
+
+        Args:
+            frame_queue (mpq.Queue): The queue of captured frames.
+            pose_queue (mpq.Queue): The queue of frame indices and \
+                the pose rows made from them.
+            filepath (Path): Where to save the video segment.
+        """
+        parent: Optional[mp.process.BaseProcess] = mp.parent_process()
+        writer: Optional[cv2.VideoWriter] = None
+        # Frames wait here until inference has caught up to them
+        pending: Deque[Tuple[int, int, float]] = deque()
+        pose_rows: Dict[int, int] = {}
+        video_frame: int = 0
+
+        with open(filepath.with_suffix(".frames.csv"), "w",
+                  encoding="utf-8") as sidecar:
+            sidecar.write(SIDECAR_HEADER + "\n")
+            while True:
+                try:
+                    item: Optional[tuple] = frame_queue.get(
+                        timeout=self.poll_interval)
+                except queue.Empty:
+                    if parent is not None and not parent.is_alive():
+                        break
+                    continue
+                except (EOFError, OSError):
+                    # The capture process stopped mid-frame
+                    break
+                if item is None:
+                    break
+
+                frame_index, timestamp, frame = item
+                if writer is None:
+                    writer = self._open_writer(frame, filepath)
+                writer.write(self._fit(frame))
+                pending.append((video_frame, frame_index, timestamp))
+                video_frame += 1
+                self._write_sidecar(sidecar, pending, pose_rows, pose_queue)
+
+            self._write_sidecar(sidecar, pending, pose_rows, pose_queue,
+                                final=True)
+        if writer is not None:
+            writer.release()
+
+    def _open_writer(self, frame: np.ndarray,
+                     filepath: Path) -> cv2.VideoWriter:
+        """Create a video writer sized to the first frame."""
+        self._size = (frame.shape[1], frame.shape[0])
+        return cv2.VideoWriter(str(filepath),
+                               cv2.VideoWriter_fourcc(*self.fourcc),
+                               self.fps, self._size)
+
+    def _fit(self, frame: np.ndarray) -> np.ndarray:
+        """Resize a frame to the size of the video if needed."""
+        if (frame.shape[1], frame.shape[0]) == self._size:
+            return frame
+        return cv2.resize(frame, self._size, interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _write_sidecar(sidecar: IO[str],
+                       pending: Deque[Tuple[int, int, float]],
+                       pose_rows: Dict[int, int], pose_queue: mpq.Queue,
+                       final: bool = False) -> None:
+        """Write the sidecar rows of pending frames that inference \
+        has caught up to, or of every pending frame if final."""
+        # Inference handles frames in the order they were captured,
+        # so every frame before the newest marked one is settled.
+        latest: int = max(pose_rows, default=-1)
+        while True:
+            try:
+                frame_index, pose_row = pose_queue.get_nowait()
+            except queue.Empty:
+                break
+            pose_rows[frame_index] = pose_row
+            latest = max(latest, frame_index)
+
+        while pending and (final or pending[0][1] <= latest):
+            video_frame, frame_index, timestamp = pending.popleft()
+            sidecar.write(f"{video_frame},{frame_index},{timestamp:.6f},"
+                          f"{pose_rows.get(frame_index, -1)}\n")
+            for settled in [index for index in pose_rows
+                            if index < frame_index]:
+                del pose_rows[settled]
+        sidecar.flush()
@@ -0,0 +1,5 @@
+"""The `streaming` package contains classes that stream \
+poses to other applications while an activity is running."""
+from .framing import FRAME_HEADER, decode_pose, encode_frame  # noqa
+from .server import PoseStreamServer  # noqa
+from .client import PoseStreamClient  # noqa
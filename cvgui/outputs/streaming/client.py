@@ -0,0 +1,92 @@
+"""The client module contains a subscriber for poses streamed \
+by `cvgui.outputs.streaming.PoseStreamServer`."""
+import asyncio
+from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
+from cvgui.outputs.streaming.framing import FRAME_HEADER, decode_pose, \
+    frame_size
+
+
+class PoseStreamClient:
+    """Receives poses from a pose stream server.
+
+    Clients can be used as async context managers and iterated \
+    over to receive poses until the server disconnects::
+
+        async with PoseStreamClient(port=8765) as client:
+            async for timestamp, pose in client:
+                ...
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765,
+                 path: Optional[Path] = None) -> None:
+        """Create a new pose stream client.
+
+        Args:
+            host (str, optional): The address of the server. \
+                Defaults to "127.0.0.1".
+            port (int, optional): The TCP port of the server. \
+                Defaults to 8765.
+            path (Optional[Path], optional): The Unix socket of the \
+                server instead of a TCP port. Defaults to None.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.path: Optional[Path] = path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self) -> None:
+        """Connect to the server."""
+        if self.path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                str(self.path))
+        else:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port)
+
+    async def receive(self) -> Tuple[float, np.ndarray]:
+        """Wait for the next pose.
+
+        Raises:
+            asyncio.IncompleteReadError: If the server disconnects.
+
+        Returns:
+            Tuple[float, np.ndarray]: When the server recieved the \
+                pose and the pose.
+        """
+        header: bytes = await self._reader.readexactly(FRAME_HEADER.size)
+        _, landmarks, values = FRAME_HEADER.unpack(header)
+        data: bytes = await self._reader.readexactly(
+            frame_size(landmarks, values))
+        return decode_pose(header, data)
+
+    async def close(self) -> None:
+        """Disconnect from the server."""
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def __aenter__(self) -> "PoseStreamClient":
+        """Connect to the server when entering an async with block."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        """Disconnect from the server when leaving an async with \
+        block."""
+        await self.close()
+
+    def __aiter__(self) -> "PoseStreamClient":
+        """Iterate over the poses sent by the server."""
+        return self
+
+    async def __anext__(self) -> Tuple[float, np.ndarray]:
+        """Receive the next pose, stopping once the server \
+        disconnects."""
+        try:
+            return await self.receive()
+        except asyncio.IncompleteReadError as excpt:
+            raise StopAsyncIteration from excpt
@@ -0,0 +1,54 @@
+"""The framing module describes how poses are encoded \
+when they are streamed."""
+import struct
+from typing import Tuple
+import numpy as np
+
+FRAME_HEADER: struct.Struct = struct.Struct("<dHH")
+"""Starts every frame: a float64 timestamp followed by the \
+number of landmarks and the number of values per landmark. \
+The pose follows as little endian float32 values."""
+
+
+def encode_frame(pose: np.ndarray, timestamp: float) -> bytes:
+    """Encode a pose as a frame.
+
+    Args:
+        pose (np.ndarray): The pose, shaped (landmarks, values).
+        timestamp (float): When the pose was recieved.
+
+    Returns:
+        bytes: The encoded frame.
+    """
+    return FRAME_HEADER.pack(timestamp, *pose.shape) + \
+        pose.astype("<f4", copy=False).tobytes()
+
+
+def frame_size(landmarks: int, values: int) -> int:
+    """Get the number of bytes of pose data that follow a frame header.
+
+    Args:
+        landmarks (int): The number of landmarks in the pose.
+        values (int): The number of values per landmark.
+
+    Returns:
+        int: The size of the pose data in bytes.
+    """
+    return landmarks * values * 4
+
+
+def decode_pose(header: bytes, data: bytes) -> Tuple[float, np.ndarray]:
+    """Decode a frame.
+
+    Args:
+        header (bytes): The frame header.
+        data (bytes): The pose data following the header.
+
+    Returns:
+        Tuple[float, np.ndarray]: When the pose was recieved and \
+            the pose.
+    """
+    timestamp, landmarks, values = FRAME_HEADER.unpack(header)
+    pose: np.ndarray = np.frombuffer(data, dtype="<f4").reshape(
+        landmarks, values)
+    return timestamp, pose
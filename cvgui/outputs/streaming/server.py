@@ -0,0 +1,181 @@
+"""The server module contains a pose sink that streams poses \
+to any number of subscribers over a socket."""
+import asyncio
+from collections import deque
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Deque, Optional, Set
+import numpy as np
+from cvgui.outputs.streaming.framing import encode_frame
+
+
+class _Subscriber:
+    """A connected client and the frames waiting to be sent to it."""
+
+    def __init__(self, buffer_size: int) -> None:
+        self.frames: Deque[bytes] = deque(maxlen=buffer_size)
+        self.ready: asyncio.Event = asyncio.Event()
+        self.dropped: int = 0
+
+    def push(self, frame: bytes) -> None:
+        """Queue a frame, dropping the oldest one if the buffer \
+        is full."""
+        if len(self.frames) == self.frames.maxlen:
+            self.dropped += 1
+        self.frames.append(frame)
+        self.ready.set()
+
+
+# pylint: disable-next=too-many-instance-attributes
+class PoseStreamServer:
+    """A pose sink that streams poses over TCP or a Unix socket.
+
+    Every pose is encoded once as a frame described by \
+    `cvgui.outputs.streaming.framing` and sent to every connected \
+    subscriber. The server runs on an asyncio event loop in a \
+    background thread, and each subscriber has its own bounded \
+    buffer. A subscriber that falls behind loses its oldest frames \
+    instead of slowing down the process writing poses.
+
+    Add the server to an activity with `Activity.add_sink`, or call \
+    `start_server` and `write` directly.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765,
+                 path: Optional[Path] = None, buffer_size: int = 8) -> None:
+        """Create a new pose stream server.
+
+        Args:
+            host (str, optional): The address to listen on. \
+                Defaults to "127.0.0.1".
+            port (int, optional): The TCP port to listen on. Use 0 to \
+                pick a free port. Defaults to 8765.
+            path (Optional[Path], optional): A Unix socket to listen on \
+                instead of a TCP port. Defaults to None.
+            buffer_size (int, optional): How many frames can wait for \
+                each subscriber before its oldest frames are dropped. \
+                    Defaults to 8.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.path: Optional[Path] = None if path is None else Path(path)
+        self.buffer_size: int = buffer_size
+        self.address: Any = None
+        """Where the server is listening, once it has started."""
+        self._subscribers: Set[_Subscriber] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def subscribers(self) -> int:
+        """The number of connected subscribers."""
+        return len(self._subscribers)
+
+    def start_server(self) -> None:
+        """Start listening for subscribers in a background thread. \
+        This is done automatically when the first pose is written."""
+        if self._thread is not None:
+            return
+        started: threading.Event = threading.Event()
+        errors: list = []
+        self._thread = threading.Thread(
+            target=self._run, args=(started, errors), daemon=True)
+        self._thread.start()
+        started.wait()
+        if errors:
+            self._thread.join()
+            self._thread = None
+            raise errors[0]
+
+    def _run(self, started: threading.Event, errors: list) -> None:
+        """Run the event loop until the server is finished."""
+        loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._open())
+        except OSError as excpt:
+            errors.append(excpt)
+            loop.close()
+            started.set()
+            return
+        self._loop = loop
+        started.set()
+        loop.run_forever()
+        loop.run_until_complete(self._close())
+        loop.close()
+
+    async def _open(self) -> None:
+        """Start listening for subscribers."""
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._serve, path=str(self.path))
+            self.address = self.path
+        else:
+            self._server = await asyncio.start_server(
+                self._serve, self.host, self.port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+
+    async def _close(self) -> None:
+        """Disconnect every subscriber and stop listening."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self.path is not None and self.path.exists():
+            os.unlink(self.path)
+
+    async def _serve(self, _: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        """Send frames to a subscriber until it disconnects."""
+        task: Optional[asyncio.Task] = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        subscriber: _Subscriber = _Subscriber(self.buffer_size)
+        self._subscribers.add(subscriber)
+        try:
+            while True:
+                await subscriber.ready.wait()
+                subscriber.ready.clear()
+                while subscriber.frames:
+                    writer.write(subscriber.frames.popleft())
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._subscribers.discard(subscriber)
+            self._tasks.discard(task)
+            writer.close()
+
+    def _broadcast(self, frame: bytes) -> None:
+        """Queue a frame for every subscriber."""
+        for subscriber in self._subscribers:
+            subscriber.push(frame)
+
+    def write(self, pose_data: np.ndarray) -> None:
+        """Stream a pose to every subscriber without waiting for them.
+
+        Args:
+            pose_data (np.ndarray): The pose to stream.
+        """
+        if self._thread is None:
+            self.start_server()
+        frame: bytes = encode_frame(pose_data, time.time())
+        self._loop.call_soon_threadsafe(self._broadcast, frame)
+
+    def flush(self) -> None:
+        """Frames are sent as soon as subscribers can take them, \
+        so there is nothing to flush."""
+
+    def finish(self) -> None:
+        """Disconnect every subscriber and stop the server."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._loop = None
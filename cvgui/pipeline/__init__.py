@@ -0,0 +1,11 @@
+"""The `pipeline` package contains the plumbing used to move \
+data between the processes started by an activity."""
+
+from .channel import Channel, ChannelPolicy  # noqa
+from .process_settings import ProcessSettings, limit_threads  # noqa
+from .history import HistoryReader, PoseHistory  # noqa
+from .frame_buffer import FrameBuffer  # noqa
+from .logging_hub import LoggingHub  # noqa
+from .heartbeat import Heartbeat, Stage  # noqa
+from .supervisor import Supervisor  # noqa
+from .pose_pipeline import PosePipeline  # noqa
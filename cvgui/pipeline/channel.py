@@ -0,0 +1,210 @@
+"""The channel module contains a bounded multiprocessing queue \
+with an explicit policy for what happens when it fills up."""
+from enum import Enum
+import multiprocessing as mp
+import multiprocessing.queues as mpq
+import queue
+import time
+from typing import Any, Optional
+
+
+class ChannelPolicy(Enum):
+    """What a channel should do when a producer outpaces \
+    its consumer."""
+
+    KEEP_LATEST = "keep_latest"
+    """Evict the oldest items when full and only hand the \
+        newest available item to the consumer. Useful for \
+            displays that should never render a backlog."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Evict the oldest items when full but otherwise \
+        deliver items in order."""
+
+    BLOCK = "block"
+    """Block the producer until the consumer catches up. \
+        Useful for consumers that must be lossless."""
+
+
+class Channel(mpq.Queue):
+    """A bounded `multiprocessing.Queue` with a backpressure policy \
+    as well as depth and drop counters that are shared between \
+    processes.
+
+    Since a channel is a queue, it can be used anywhere a \
+    `multiprocessing.Queue` is expected.
+
+    A consumer that stops reading for good, such as a closed pose \
+    logger, should `disconnect` the channel. Its producers then \
+    drop their items instead of blocking on a channel no one \
+    will empty.
+    """
+
+    disconnect_poll: float = 0.1
+    """How often in seconds a blocked producer checks whether \
+        the consumer has disconnected."""
+
+    def __init__(self, capacity: int = 1,
+                 policy: ChannelPolicy = ChannelPolicy.KEEP_LATEST) -> None:
+        """Create a new channel.
+
+        Args:
+            capacity (int, optional): The maximum number of items \
+                the channel can hold. Defaults to 1.
+            policy (ChannelPolicy, optional): What to do when the \
+                channel is full. Defaults to ChannelPolicy.KEEP_LATEST.
+
+        Raises:
+            ValueError: If the capacity is less than one.
+        """
+        if capacity < 1:
+            raise ValueError("Channel capacity must be at least 1")
+        super().__init__(capacity, ctx=mp.get_context())
+        self.capacity: int = capacity
+        self.policy: ChannelPolicy = policy
+        self._put_count: Any = mp.Value("Q", 0)
+        self._get_count: Any = mp.Value("Q", 0)
+        self._drop_count: Any = mp.Value("Q", 0)
+        self._disconnected: Any = mp.Value("b", 0)
+
+    def __getstate__(self) -> tuple:
+        """Include the channel settings and counters when the \
+        channel is sent to a new process."""
+        return (super().__getstate__(), self.capacity, self.policy,
+                self._put_count, self._get_count, self._drop_count,
+                self._disconnected)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore a channel sent to a new process."""
+        (queue_state, self.capacity, self.policy, self._put_count,
+         self._get_count, self._drop_count, self._disconnected) = state
+        super().__setstate__(queue_state)
+
+    @property
+    def depth(self) -> int:
+        """The number of items currently waiting in the channel."""
+        return self._put_count.value - self._get_count.value
+
+    @property
+    def dropped(self) -> int:
+        """The number of items discarded by the channel's policy \
+        or because the consumer disconnected."""
+        return self._drop_count.value
+
+    @property
+    def disconnected(self) -> bool:
+        """Whether the consumer has stopped reading from the channel."""
+        return bool(self._disconnected.value)
+
+    def disconnect(self) -> None:
+        """Stop reading from the channel for good. Items waiting \
+        in the channel and any put afterwards are dropped."""
+        self._disconnected.value = 1
+        while True:
+            try:
+                super().get(block=False)
+            except queue.Empty:
+                return
+            self._increment(self._get_count)
+            self._increment(self._drop_count)
+
+    def put(self, obj: Any, block: bool = True,
+            timeout: Optional[float] = None) -> None:
+        """Put an item into the channel, applying the channel's \
+        policy if it is full.
+
+        Args:
+            obj (Any): The item to put in the channel.
+            block (bool, optional): Whether to wait for room in \
+                the channel. Only used by `ChannelPolicy.BLOCK`. \
+                    Defaults to True.
+            timeout (Optional[float], optional): How long to wait \
+                for room in the channel. Only used by \
+                    `ChannelPolicy.BLOCK`. Defaults to None.
+        """
+        if self.disconnected:
+            self._increment(self._drop_count)
+            return
+        if self.policy == ChannelPolicy.BLOCK:
+            if not self._put_while_connected(obj, block, timeout):
+                self._increment(self._drop_count)
+                return
+        else:
+            while True:
+                try:
+                    super().put(obj, block=False)
+                    break
+                except queue.Full:
+                    self._evict()
+        self._increment(self._put_count)
+
+    def get(self, block: bool = True,
+            timeout: Optional[float] = None) -> Any:
+        """Remove and return an item from the channel.
+
+        Channels using `ChannelPolicy.KEEP_LATEST` discard every \
+        item older than the newest one available.
+
+        Args:
+            block (bool, optional): Whether to wait for an item. \
+                Defaults to True.
+            timeout (Optional[float], optional): How long to wait \
+                for an item. Defaults to None.
+
+        Returns:
+            Any: The item removed from the channel.
+        """
+        item: Any = super().get(block, timeout)
+        self._increment(self._get_count)
+        if self.policy == ChannelPolicy.KEEP_LATEST:
+            while True:
+                try:
+                    newer: Any = super().get(block=False)
+                except queue.Empty:
+                    break
+                self._increment(self._get_count)
+                self._increment(self._drop_count)
+                item = newer
+        return item
+
+    def _put_while_connected(self, obj: Any, block: bool,
+                             timeout: Optional[float]) -> bool:
+        """Wait for room in the channel unless the consumer \
+        disconnects first.
+
+        Returns:
+            bool: Whether the item was put in the channel.
+        """
+        if not block:
+            super().put(obj, block=False)
+            return True
+        deadline: Optional[float] = None if timeout is None \
+            else time.monotonic() + timeout
+        while not self.disconnected:
+            wait: float = self.disconnect_poll if deadline is None \
+                else min(self.disconnect_poll, deadline - time.monotonic())
+            try:
+                super().put(obj, timeout=max(wait, 0.0))
+                return True
+            except queue.Full:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+        return False
+
+    def _evict(self) -> None:
+        """Discard the oldest item in the channel to make room \
+        for a new one."""
+        try:
+            super().get(block=False)
+        except queue.Empty:
+            # The item is still being flushed into the pipe
+            # or a consumer took it first. Either way the
+            # caller will try again.
+            return
+        self._increment(self._get_count)
+        self._increment(self._drop_count)
+
+    @staticmethod
+    def _increment(counter: Any) -> None:
+        with counter.get_lock():
+            counter.value += 1
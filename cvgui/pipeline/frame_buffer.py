@@ -0,0 +1,137 @@
+"""The frame_buffer module contains a shared memory buffer \
+for handing the newest video frame to another process."""
+from multiprocessing import shared_memory
+import multiprocessing as mp
+from typing import Any, Optional, Tuple
+import cv2
+import numpy as np
+
+
+class FrameBuffer:
+    """Holds the most recent video frame in shared memory.
+
+    The buffer has two slots. New frames are written to the slot \
+    that was not published last, and then that slot is published. \
+    A reader that is slower than two writes could still see the \
+    slot it is copying being overwritten, so each slot also has a \
+    sequence number that is odd while the slot is being written. \
+    Readers copy the newest slot and start over if its sequence \
+    number changed meanwhile, so they never get a torn frame. \
+    Frames that are not the size of the buffer are resized as \
+    they are written, which keeps readers from having to scale \
+    full resolution frames.
+
+    A buffer has a single writer, such as the capture process of \
+    a `cvgui.ComputerVisionPose`, and any number of readers.
+
+    Like `cvgui.pipeline.PoseHistory`, a frame buffer can be sent to \
+    other processes when they are started.
+    """
+
+    def __init__(self, height: int, width: int, channels: int = 3) -> None:
+        """Create a new frame buffer.
+
+        Args:
+            height (int): The height to store frames at.
+            width (int): The width to store frames at.
+            channels (int, optional): The number of color channels \
+                in a frame. Defaults to 3.
+        """
+        self.shape: Tuple[int, int, int] = (height, width, channels)
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=2 * height * width * channels)
+        self._count: Any = mp.Value("Q", 0)
+        self._sequences: Any = mp.RawArray("Q", 2)
+        """The number of times each slot has started or finished \
+            being written."""
+        self._owner: bool = True
+        self._attach()
+
+    def __getstate__(self) -> tuple:
+        """Send the name of the shared memory instead of its contents \
+        when the buffer is sent to a new process."""
+        return (self.shape, self._memory.name, self._count,
+                self._sequences)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Attach to the shared memory of a buffer sent to a \
+        new process."""
+        self.shape, name, self._count, self._sequences = state
+        self._memory = shared_memory.SharedMemory(name=name)
+        self._owner = False
+        self._attach()
+
+    def _attach(self) -> None:
+        """Create numpy arrays backed by the shared memory."""
+        self._slots: np.ndarray = np.ndarray(
+            (2, *self.shape), dtype=np.uint8, buffer=self._memory.buf)
+
+    @property
+    def height(self) -> int:
+        """The height frames are stored at."""
+        return self.shape[0]
+
+    @property
+    def width(self) -> int:
+        """The width frames are stored at."""
+        return self.shape[1]
+
+    @property
+    def count(self) -> int:
+        """The total number of frames written to the buffer."""
+        return self._count.value
+
+    def write(self, frame: np.ndarray) -> None:
+        """Store a frame, resizing it to fit the buffer if needed.
+
+        Args:
+            frame (np.ndarray): The frame to store.
+        """
+        index: int = (self._count.value + 1) % 2
+        slot: np.ndarray = self._slots[index]
+        # Readers of the slot retry until it is written
+        self._sequences[index] += 1
+        if frame.shape == self.shape:
+            np.copyto(slot, frame)
+        else:
+            cv2.resize(frame, (self.width, self.height), dst=slot,
+                       interpolation=cv2.INTER_AREA)
+        self._sequences[index] += 1
+        # Publish the slot only after it has been completely written
+        with self._count.get_lock():
+            self._count.value += 1
+
+    def read(self, out: Optional[np.ndarray] = None
+             ) -> Optional[np.ndarray]:
+        """Copy the most recent frame.
+
+        Args:
+            out (Optional[np.ndarray], optional): An array shaped \
+                like the buffer's frames to copy the frame into, so \
+                    reading allocates nothing. Defaults to None, \
+                        meaning a new array.
+
+        Returns:
+            Optional[np.ndarray]: The most recent frame, or None if \
+                no frame has been written.
+        """
+        if out is None:
+            out = np.empty(self.shape, dtype=np.uint8)
+        while True:
+            count: int = self._count.value
+            if count == 0:
+                return None
+            index: int = count % 2
+            sequence: int = self._sequences[index]
+            if sequence % 2 == 0:
+                np.copyto(out, self._slots[index])
+                if self._sequences[index] == sequence:
+                    return out
+
+    def close(self) -> None:
+        """Detach from the shared memory, freeing it if this \
+        buffer created it."""
+        del self._slots
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
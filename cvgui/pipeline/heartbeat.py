@@ -0,0 +1,57 @@
+"""The heartbeat module lets worker processes report that they \
+are alive and how much work they are getting done."""
+import time
+from typing import Any, Callable, Iterable, NamedTuple
+import multiprocessing as mp
+
+
+class Heartbeat:
+    """A worker's last sign of life and a count of its work, kept \
+    in shared memory.
+
+    Each heartbeat should only be written by one process, which \
+    lets beats skip locking entirely. Like `cvgui.pipeline.Channel`, \
+    a heartbeat is sent to a worker when the worker is started.
+    """
+
+    def __init__(self) -> None:
+        """Create a new heartbeat that has never beaten."""
+        self._last_beat: Any = mp.RawValue("d", 0)
+        self._count: Any = mp.RawValue("Q", 0)
+
+    @property
+    def last_beat(self) -> float:
+        """The `time.monotonic` time of the last beat, or 0 if \
+            there has not been one."""
+        return self._last_beat.value
+
+    @property
+    def count(self) -> int:
+        """The total amount of work reported by beats."""
+        return self._count.value
+
+    def beat(self, work: int = 1) -> None:
+        """Report that the worker is alive.
+
+        Args:
+            work (int, optional): How many items the worker finished \
+                since its last beat. Idle workers should beat with 0. \
+                    Defaults to 1.
+        """
+        self._count.value += work
+        self._last_beat.value = time.monotonic()
+
+
+class Stage(NamedTuple):
+    """A worker that a `cvgui.pipeline.Supervisor` can watch \
+    and restart."""
+
+    name: str
+    """What to call the stage when reporting on it."""
+
+    heartbeat: Heartbeat
+    """The heartbeat the stage's worker beats."""
+
+    restart: Callable[[], Iterable[mp.Process]]
+    """Stops the stage's worker and starts a new one, returning \
+        the processes it started."""
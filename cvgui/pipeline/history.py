@@ -0,0 +1,223 @@
+"""The history module contains a fixed-size, timestamped record \
+of recent poses that is shared between processes."""
+from multiprocessing import shared_memory
+import multiprocessing as mp
+import queue
+import time
+from typing import Any, Optional, Tuple
+import numpy as np
+
+
+class PoseHistory:
+    """A ring buffer of the most recent poses and the time each \
+    was recieved, stored in shared memory.
+
+    Every pose is written twice, once at its slot and once at \
+    its slot plus the capacity. This way the most recent `n` \
+    poses are always stored contiguously and can be returned \
+    as numpy views without copying.
+
+    A pose history has a `put` method so it can be given to a \
+    `cvgui.core.receiving.PoseGenerator` alongside its other pose \
+    queues. Any process it is sent to can then read the history.
+    """
+
+    def __init__(self, capacity: int = 300,
+                 pose_shape: Tuple[int, ...] = (33, 4)) -> None:
+        """Create a new pose history.
+
+        Args:
+            capacity (int, optional): How many poses to keep. \
+                Defaults to 300.
+            pose_shape (Tuple[int, ...], optional): The shape of \
+                a single pose. Defaults to (33, 4).
+
+        Raises:
+            ValueError: If the capacity is less than one.
+        """
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+        self.capacity: int = capacity
+        self.pose_shape: Tuple[int, ...] = tuple(pose_shape)
+        pose_size: int = int(np.prod(self.pose_shape))
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=2 * capacity * (pose_size + 1) * 8)
+        self._count: Any = mp.Value("Q", 0)
+        self._owner: bool = True
+        self._attach()
+
+    def __getstate__(self) -> tuple:
+        """Send the name of the shared memory instead of its contents \
+        when the history is sent to a new process."""
+        return (self.capacity, self.pose_shape,
+                self._memory.name, self._count)
+
+    def __setstate__(self, state: tuple) -> None:
+        """Attach to the shared memory of a history sent to a \
+        new process."""
+        self.capacity, self.pose_shape, name, self._count = state
+        self._memory = shared_memory.SharedMemory(name=name)
+        self._owner = False
+        self._attach()
+
+    def _attach(self) -> None:
+        """Create numpy arrays backed by the shared memory."""
+        timestamps_size: int = 2 * self.capacity * 8
+        self._timestamps: np.ndarray = np.ndarray(
+            (2 * self.capacity,), dtype=np.float64,
+            buffer=self._memory.buf[:timestamps_size])
+        self._poses: np.ndarray = np.ndarray(
+            (2 * self.capacity, *self.pose_shape), dtype=np.float64,
+            buffer=self._memory.buf[timestamps_size:])
+
+    def __len__(self) -> int:
+        """Get the number of poses currently held in the history."""
+        return min(self._count.value, self.capacity)
+
+    @property
+    def count(self) -> int:
+        """The total number of poses ever added to the history."""
+        return self._count.value
+
+    def put(self, pose: np.ndarray, timestamp: Optional[float] = None
+            ) -> None:
+        """Add a pose to the history, replacing the oldest pose \
+        if the history is full.
+
+        Args:
+            pose (np.ndarray): The pose to add.
+            timestamp (Optional[float], optional): When the pose was \
+                recieved. Defaults to the current time.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        slot: int = self._count.value % self.capacity
+        for index in (slot, slot + self.capacity):
+            self._poses[index] = pose
+            self._timestamps[index] = timestamp
+        # Only publish the pose once it has been completely written
+        with self._count.get_lock():
+            self._count.value += 1
+
+    def _window(self, length: int) -> slice:
+        """Get the slice of the mirrored buffer that holds the \
+        newest `length` poses, oldest first."""
+        end: int = (self._count.value - 1) % self.capacity + \
+            self.capacity + 1
+        return slice(end - length, end)
+
+    def last(self, length: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the most recent poses.
+
+        Args:
+            length (int): The most poses to return.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Views of the timestamps \
+                and the poses, oldest first. The views are overwritten \
+                    as new poses arrive, so copy them to keep them.
+        """
+        length = min(length, len(self))
+        if length <= 0:
+            return self._timestamps[:0], self._poses[:0]
+        window: slice = self._window(length)
+        return self._timestamps[window], self._poses[window]
+
+    def since(self, seconds: float, now: Optional[float] = None
+              ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the poses recieved within the given number of seconds.
+
+        Args:
+            seconds (float): How far back to look.
+            now (Optional[float], optional): The time to look back \
+                from. Defaults to the current time.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Views of the timestamps \
+                and the poses, oldest first.
+        """
+        if now is None:
+            now = time.time()
+        timestamps, poses = self.last(self.capacity)
+        start: int = int(np.searchsorted(timestamps, now - seconds))
+        return timestamps[start:], poses[start:]
+
+    def latest(self) -> Optional[np.ndarray]:
+        """Get a view of the most recent pose, or None if the \
+        history is empty."""
+        _, poses = self.last(1)
+        if len(poses) == 0:
+            return None
+        return poses[0]
+
+    def reader(self) -> "HistoryReader":
+        """Get a reader that takes the newest pose from the history \
+        like a pose queue.
+
+        Returns:
+            HistoryReader: A reader starting after the newest pose.
+        """
+        return HistoryReader(self)
+
+    def close(self) -> None:
+        """Detach from the shared memory, freeing it if this \
+        history created it."""
+        del self._timestamps, self._poses
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+
+class HistoryReader:
+    """Reads a `PoseHistory` as if it were a pose queue that only \
+    ever holds the newest pose.
+
+    Any number of readers, in any number of processes, can follow \
+    the same history without the pose input putting each pose into \
+    another queue. Readers never remove poses, so a slow reader \
+    skips poses instead of holding anything up.
+    """
+
+    def __init__(self, history: PoseHistory,
+                 poll_interval: float = 0.001) -> None:
+        """Create a new reader of a pose history.
+
+        Args:
+            history (PoseHistory): The history to read.
+            poll_interval (float, optional): How many seconds `get` \
+                waits between checks for a new pose. Defaults to 0.001.
+        """
+        self.history: PoseHistory = history
+        self.poll_interval: float = poll_interval
+        self._seen: int = history.count
+
+    def empty(self) -> bool:
+        """Check if no poses have arrived since the last `get`."""
+        return self.history.count == self._seen
+
+    def get(self, block: bool = True,
+            timeout: Optional[float] = None) -> np.ndarray:
+        """Get a copy of the newest pose, waiting for one to arrive \
+        if none have since the last `get`.
+
+        Args:
+            block (bool, optional): Whether to wait for a new pose. \
+                Defaults to True.
+            timeout (Optional[float], optional): The most seconds to \
+                wait. Defaults to None, meaning forever.
+
+        Raises:
+            queue.Empty: If no new pose arrived in time.
+
+        Returns:
+            np.ndarray: The newest pose.
+        """
+        deadline: Optional[float] = None if timeout is None \
+            else time.monotonic() + timeout
+        while self.empty():
+            if not block or (deadline is not None and
+                             time.monotonic() >= deadline):
+                raise queue.Empty
+            time.sleep(self.poll_interval)
+        self._seen = self.history.count
+        return self.history.latest().copy()
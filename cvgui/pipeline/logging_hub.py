@@ -0,0 +1,197 @@
+"""The logging hub module runs every pose sink of an activity \
+in a single process."""
+import logging
+import queue
+import time
+from typing import Any, Callable, Iterable, List, Optional
+import multiprocessing as mp
+import multiprocessing.queues as mpq
+import numpy as np
+from cvgui.core.logging import PoseSink
+from cvgui.pipeline.process_settings import ProcessSettings
+
+_SAVE = 0
+_CLOSE = 1
+_ATTACH = 2
+_DETACH = 3
+
+
+class LoggingHub:
+    """A pose logger that fans each pose out to any number of sinks.
+
+    The hub receives every pose once and hands it to each sink in \
+    turn from its own process, so adding a sink does not add a \
+    process or another copy of each pose. A sink that raises an \
+    exception is reported and stops receiving poses without \
+    affecting the other sinks.
+
+    Sinks can also be attached to and detached from a running hub, \
+    which lets one hub process outlive many logging sessions.
+
+    Sinks only write poses to the disk as they receive them, so once \
+    poses stop arriving, such as when a person leaves, the hub \
+    flushes every sink after the flush interval passes.
+    """
+
+    active: bool = True
+    """Whether the hub should be actively logging \
+        pose data."""
+
+    def __init__(self, sinks: Optional[Iterable[PoseSink]] = None,
+                 poll_interval: float = 0.1,
+                 settings: Optional[ProcessSettings] = None,
+                 flush_interval: float = 1.0) -> None:
+        """Create a new logging hub.
+
+        Args:
+            sinks (Optional[Iterable[PoseSink]], optional): The sinks \
+                to send poses to. Defaults to None, meaning sinks \
+                    are added later with `add_sink`.
+            poll_interval (float, optional): The most seconds to wait \
+                for a pose before checking for save requests. \
+                    Defaults to 0.1.
+            settings (Optional[ProcessSettings], optional): The cores, \
+                priority, and thread caps of the hub's process. \
+                    Defaults to None.
+            flush_interval (float, optional): The most seconds poses \
+                wait in a sink after the last pose arrives before the \
+                    sink is flushed. Defaults to 1.0.
+        """
+        self.sinks: List[PoseSink] = list(sinks or [])
+        self.poll_interval: float = poll_interval
+        self.settings: Optional[ProcessSettings] = settings
+        self.flush_interval: float = flush_interval
+        self.failed: List[PoseSink] = []
+        """Sinks that raised an exception and no longer \
+            receive poses."""
+        self._save_queue: mpq.Queue
+
+    def add_sink(self, sink: PoseSink) -> None:
+        """Add a sink to the hub. Sinks must be added before \
+        the hub is started.
+
+        Args:
+            sink (PoseSink): The sink to send poses to.
+        """
+        self.sinks.append(sink)
+
+    def start(self, pose_queue: mpq.Queue) -> Iterable[mp.Process]:
+        """Start the process that sends poses to the sinks.
+
+        Args:
+            pose_queue (mpq.Queue): The queue where pose data \
+                will be coming in.
+
+        Returns:
+            Iterable[mp.Process]: The hub's process, which will \
+                need to be cleaned up later.
+        """
+        self._save_queue = mp.Queue()
+        hub = mp.Process(target=self._log_data, args=(
+            pose_queue, self._save_queue))
+        hub.start()
+        return [hub]
+
+    def _log_data(self, pose_queue: mpq.Queue, save_queue: mpq.Queue) -> None:
+        """Send poses to the sinks until the hub is closed.
+
+        Args:
+            pose_queue (mpq.Queue): The queue of pose data coming in.
+            save_queue (mpq.Queue): The queue to notify of when to save.
+        """
+        if self.settings is not None:
+            self.settings.apply()
+        last_pose: float = time.monotonic()
+        unflushed: bool = False
+        while self.active:
+            try:
+                self.write(pose_queue.get(timeout=self.poll_interval))
+                last_pose = time.monotonic()
+                unflushed = True
+            except queue.Empty:
+                # Sinks flush themselves while poses keep arriving,
+                # so only the poses written since then need flushing
+                if unflushed and \
+                        time.monotonic() - last_pose >= self.flush_interval:
+                    self.flush()
+                    unflushed = False
+
+            if not save_queue.empty():
+                self._handle(save_queue.get(), pose_queue)
+
+    def _handle(self, message: Any, pose_queue: mpq.Queue) -> None:
+        """Act on a message sent to the hub's process."""
+        if isinstance(message, tuple):
+            self.sinks += message[1]
+        elif message in (_CLOSE, _DETACH):
+            # Log poses that arrived before the sinks were released
+            self._drain(pose_queue)
+            self.finish()
+            self.sinks = []
+            self.failed = []
+            self.active = message != _CLOSE
+        else:
+            self.flush()
+
+    def _drain(self, pose_queue: mpq.Queue) -> None:
+        """Send the poses waiting in the queue to the sinks. Poses \
+        may keep arriving, so this gives up after one poll \
+        interval."""
+        deadline: float = time.monotonic() + self.poll_interval
+        while time.monotonic() < deadline:
+            try:
+                self.write(pose_queue.get(timeout=self.poll_interval))
+            except queue.Empty:
+                return
+
+    def write(self, pose_data: np.ndarray) -> None:
+        """Send a pose to every working sink.
+
+        Args:
+            pose_data (np.ndarray): The pose to log.
+        """
+        for sink in self.sinks:
+            self._call(sink, sink.write, pose_data)
+
+    def flush(self) -> None:
+        """Save the poses recorded by every working sink."""
+        for sink in self.sinks:
+            self._call(sink, sink.flush)
+
+    def finish(self) -> None:
+        """Save remaining poses and release every working sink."""
+        for sink in self.sinks:
+            self._call(sink, sink.finish)
+
+    def _call(self, sink: PoseSink, method: Callable, *args) -> None:
+        """Call a method of a sink, removing the sink from the \
+        hub if it raises an exception."""
+        if sink in self.failed:
+            return
+        try:
+            method(*args)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception("Pose sink %r failed and was disabled", sink)
+            self.failed.append(sink)
+
+    def attach(self, sinks: Iterable[PoseSink]) -> None:
+        """Send more sinks to a running hub.
+
+        Args:
+            sinks (Iterable[PoseSink]): The sinks to send poses to.
+        """
+        self._save_queue.put((_ATTACH, list(sinks)))
+
+    def detach(self) -> None:
+        """Finish and remove every sink from a running hub, \
+        leaving the hub running."""
+        self._save_queue.put(_DETACH)
+
+    def save(self) -> None:
+        """Save the poses recorded by every sink."""
+        self._save_queue.put(_SAVE)
+
+    def close(self) -> None:
+        """Finish logging and close every sink."""
+        self._save_queue.put(_CLOSE)
+        self.active = False
@@ -0,0 +1,155 @@
+"""The pose_pipeline module keeps the processes that produce \
+and log poses running between activities."""
+import time
+from typing import Any, Iterable, List, Optional
+import multiprocessing as mp
+import multiprocessing.queues as mpq
+from cvgui.core.logging import PoseLogger, PoseSink
+from cvgui.core.receiving import BLAZEPOSE_LANDMARKS, PoseGenerator
+from cvgui.pipeline.channel import Channel, ChannelPolicy
+from cvgui.pipeline.history import PoseHistory
+from cvgui.pipeline.logging_hub import LoggingHub
+from cvgui.pipeline.process_settings import ProcessSettings
+from cvgui.pipeline.supervisor import Supervisor
+
+
+# pylint: disable-next=too-many-instance-attributes
+class PosePipeline:
+    """The long-lived processes behind one or more activity runs.
+
+    Starting a pose input means spawning processes, importing \
+    models, and loading them, which can take seconds. A pipeline \
+    starts its pose input, pose loggers, and logging hub once, and \
+    activities given the pipeline attach to it when they run and \
+    detach from it when they stop, leaving its workers warm for \
+    the next activity.
+
+    Pose loggers run for as long as the pipeline does. Sinks added \
+    to an activity only receive the poses of that activity's run.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, pose_input: PoseGenerator,
+                 loggers: Iterable[PoseLogger] = (),
+                 ui_channel_capacity: int = 1,
+                 logger_channel_capacity: int = 1024,
+                 pose_history_capacity: int = 300,
+                 save_time: float = 5.0,
+                 supervisor: Optional[Supervisor] = None,
+                 hub_settings: Optional[ProcessSettings] = None) -> None:
+        """Create a new pose pipeline.
+
+        Args:
+            pose_input (PoseGenerator): An object that can generate poses.
+            loggers (Iterable[PoseLogger], optional): Pose loggers \
+                to run for as long as the pipeline. Defaults to ().
+            ui_channel_capacity (int, optional): How many poses can \
+                wait for the user interface. Defaults to 1.
+            logger_channel_capacity (int, optional): How many poses \
+                can wait for each pose logger before the pose input \
+                    blocks. Defaults to 1024.
+            pose_history_capacity (int, optional): How many of the \
+                most recent poses to keep. Defaults to 300.
+            save_time (float, optional): How many seconds loggers \
+                are given to save their data when the pipeline is \
+                    closed. Defaults to 5.0.
+            supervisor (Optional[Supervisor], optional): Restarts \
+                stages of the pose input that stall, such as the ones \
+                    from `cvgui.ComputerVisionPose.stages`. It runs \
+                        while the pipeline does. Defaults to None.
+            hub_settings (Optional[ProcessSettings], optional): The \
+                cores, priority, and thread caps of the logging hub's \
+                    process. Defaults to None.
+        """
+        self.pose_input: PoseGenerator = pose_input
+        self.loggers: List[PoseLogger] = list(loggers)
+        self.ui_channel_capacity: int = ui_channel_capacity
+        self.logger_channel_capacity: int = logger_channel_capacity
+        self.pose_history_capacity: int = pose_history_capacity
+        self.save_time: float = save_time
+        self.supervisor: Optional[Supervisor] = supervisor
+        self.hub: LoggingHub = LoggingHub(settings=hub_settings)
+        """Sends poses to the sinks of the attached activity."""
+        self.ui_queue: Optional[mpq.Queue] = None
+        """The newest pose for the user interface."""
+        self.pose_history: Optional[PoseHistory] = None
+        """The most recent poses and when they were recieved."""
+        self.processes: List[mp.Process] = []
+        self._attached: bool = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the pipeline's processes have been started."""
+        return self.ui_queue is not None
+
+    def start(self) -> None:
+        """Start the pipeline's processes if they are not \
+        already running."""
+        if self.running:
+            return
+
+        # The user interface only ever needs the newest pose
+        self.ui_queue = Channel(capacity=self.ui_channel_capacity,
+                                policy=ChannelPolicy.KEEP_LATEST)
+        pose_queues: List[mpq.Queue] = [self.ui_queue]
+
+        # Logging is lossless, so the pose input waits for loggers
+        for logger in self.loggers + [self.hub]:
+            queue: mpq.Queue = Channel(
+                capacity=self.logger_channel_capacity,
+                policy=ChannelPolicy.BLOCK)
+            pose_queues.append(queue)
+            self.processes += logger.start(queue)
+
+        # Size the history for the pose input's model if it has one
+        model: Any = getattr(self.pose_input, "model", None)
+        self.pose_history = PoseHistory(
+            capacity=self.pose_history_capacity,
+            pose_shape=(BLAZEPOSE_LANDMARKS if model is None
+                        else model.NUM_LANDMARKS, 4))
+        pose_queues.append(self.pose_history)  # type: ignore
+
+        self.processes += self.pose_input.start(pose_queues)
+        if self.supervisor is not None:
+            self.supervisor.start()
+
+    def attach(self, sinks: Iterable[PoseSink] = ()) -> None:
+        """Start a run on the pipeline, starting the pipeline \
+        if needed.
+
+        Args:
+            sinks (Iterable[PoseSink], optional): Sinks to receive \
+                poses until the run is detached. Defaults to ().
+        """
+        self.start()
+        sinks = list(sinks)
+        if sinks:
+            self.hub.attach(sinks)
+        self._attached = True
+
+    def detach(self) -> None:
+        """End a run on the pipeline, finishing the sinks it \
+        attached. The pipeline keeps running."""
+        if self._attached:
+            self.hub.detach()
+            self._attached = False
+
+    def close(self) -> None:
+        """Save logged data and stop the pipeline's processes."""
+        if not self.running:
+            return
+        self.detach()
+        if self.supervisor is not None:
+            self.supervisor.stop()
+            self.processes += self.supervisor.processes
+            self.supervisor.processes = []
+        for logger in self.loggers:
+            logger.save()
+        # Give some time for files to be saved
+        time.sleep(self.save_time)
+        for process in self.processes:
+            process.kill()
+        self.processes = []
+        self.pose_history.close()
+        self.pose_history = None
+        self.ui_queue = None
@@ -0,0 +1,127 @@
+"""The process_settings module controls how the processes of a \
+pipeline share the cpu."""
+import logging
+import os
+from typing import Any, NamedTuple, Optional, Sequence
+import cv2
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # pylint: disable=invalid-name
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None  # pylint: disable=invalid-name
+
+THREAD_VARIABLES: Sequence[str] = (
+    "OMP_NUM_THREADS", "NUMEXPR_NUM_THREADS",
+    "TF_NUM_INTRAOP_THREADS", "TF_NUM_INTEROP_THREADS")
+"""Environment variables read by OpenMP, numexpr, and TensorFlow \
+Lite when they are first loaded or create their thread pools. \
+BLAS reads its variables when numpy is imported, which every \
+process of a pipeline has done before its settings are applied, \
+so BLAS pools are capped with `threadpoolctl` instead."""
+
+
+class ProcessSettings(NamedTuple):
+    """How a pipeline stage's process should be scheduled.
+
+    Every stage of a pipeline, along with any thread pools OpenCV, \
+    mediapipe, and BLAS start inside them, would otherwise compete \
+    for every core. On machines with few cores, pinning stages to \
+    their own cores and capping their thread pools keeps the user \
+    interface's frame times steady.
+
+    Settings are applied by the process they describe when it \
+    starts. Affinity is set with `os.sched_setaffinity` on Linux \
+    and priority with `os.setpriority` on Linux and macOS. On other \
+    platforms, such as Windows, both need `psutil` to be installed. \
+    Settings the platform does not support are skipped with a \
+    warning.
+    """
+
+    cpus: Optional[Sequence[int]] = None
+    """The cores the process may run on. None leaves the process's \
+        affinity unchanged."""
+
+    nice: Optional[int] = None
+    """The niceness of the process, from -20 (highest priority) to \
+        19 (lowest). Raising priority usually needs elevated \
+            permissions. On Windows it is mapped to the nearest \
+                priority class. None leaves the niceness unchanged."""
+
+    threads: Optional[int] = None
+    """The most threads each library thread pool in the process may \
+        use. None leaves the thread pools unchanged."""
+
+    def apply(self) -> None:
+        """Apply the settings to the current process."""
+        if self.cpus is not None:
+            if hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(0, self.cpus)
+            elif psutil is not None and \
+                    hasattr(psutil.Process, "cpu_affinity"):
+                psutil.Process().cpu_affinity(list(self.cpus))
+            else:
+                logging.warning("CPU affinity is not supported on this "
+                                "platform, ignoring cpus=%s", self.cpus)
+        if self.nice is not None:
+            try:
+                _set_nice(self.nice)
+            except NotImplementedError:
+                logging.warning("Process priority is not supported on "
+                                "this platform, ignoring nice=%d",
+                                self.nice)
+            except PermissionError:
+                logging.warning("Not permitted to set nice=%d", self.nice)
+        if self.threads is not None:
+            limit_threads(self.threads)
+
+
+def _set_nice(nice: int) -> None:
+    """Set the niceness of the current process, or the nearest \
+    priority class on Windows.
+
+    Raises:
+        NotImplementedError: If the platform has no way to set it.
+    """
+    if hasattr(os, "setpriority"):
+        os.setpriority(os.PRIO_PROCESS, 0, nice)
+        return
+    if psutil is None:
+        raise NotImplementedError
+    process: Any = psutil.Process()
+    if not hasattr(psutil, "IDLE_PRIORITY_CLASS"):
+        process.nice(nice)
+    elif nice <= -15:
+        process.nice(psutil.HIGH_PRIORITY_CLASS)
+    elif nice < 0:
+        process.nice(psutil.ABOVE_NORMAL_PRIORITY_CLASS)
+    elif nice == 0:
+        process.nice(psutil.NORMAL_PRIORITY_CLASS)
+    elif nice < 15:
+        process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+    else:
+        process.nice(psutil.IDLE_PRIORITY_CLASS)
+
+
+def limit_threads(threads: int) -> None:
+    """Cap the thread pools of OpenCV, BLAS, OpenMP, and TensorFlow \
+    Lite in the current process.
+
+    Thread pools read their environment variables when they are \
+    created, so libraries loaded after this is called are capped \
+    by them, including the mediapipe graph a model creates on its \
+    first pose. BLAS and OpenMP pools that numpy has already \
+    loaded are capped with `threadpoolctl` if it is installed.
+
+    Args:
+        threads (int): The most threads each pool may use.
+    """
+    cv2.setNumThreads(threads)
+    for variable in THREAD_VARIABLES:
+        os.environ[variable] = str(threads)
+    if threadpool_limits is not None:
+        threadpool_limits(limits=threads)
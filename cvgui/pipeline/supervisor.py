@@ -0,0 +1,168 @@
+"""The supervisor module restarts pipeline workers that stall \
+without restarting the user interface."""
+from collections import deque
+import logging
+import threading
+import time
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+import multiprocessing as mp
+from cvgui.pipeline.heartbeat import Stage
+
+
+class _StageState:
+    """What the supervisor remembers about a stage between checks."""
+
+    def __init__(self, now: float, awaiting: bool) -> None:
+        self.started: float = now
+        self.awaiting: bool = awaiting
+        self.stalled_since: Optional[float] = None
+        self.samples: Deque[Tuple[float, int]] = deque()
+
+
+# pylint: disable-next=too-many-instance-attributes
+class Supervisor:
+    """Watches the heartbeats of pipeline stages and restarts \
+    stages that stall.
+
+    A stage has stalled if it has not beaten for `stall_timeout` \
+    seconds, or, when a minimum rate is given, if it finished less \
+    than `min_rate` items per second over the last `stall_timeout` \
+    seconds. Newly started stages are given `startup_timeout` \
+    seconds to beat for the first time, since opening cameras and \
+    loading models can be slow.
+
+    Stages that share a restart function, like the capture and \
+    inference stages of `cvgui.ComputerVisionPose`, are restarted \
+    together. The supervisor runs on a thread of the process that \
+    starts it, usually the user interface's, so recovering a stage \
+    never interrupts the user interface.
+    """
+
+    def __init__(self, stages: Iterable[Stage], stall_timeout: float = 2.0,
+                 min_rate: Optional[float] = None,
+                 startup_timeout: float = 30.0,
+                 check_interval: float = 0.25) -> None:
+        """Create a new supervisor.
+
+        Args:
+            stages (Iterable[Stage]): The stages to watch.
+            stall_timeout (float, optional): How many seconds a stage \
+                can go without beating. Defaults to 2.0.
+            min_rate (Optional[float], optional): The fewest items per \
+                second a stage can finish. Defaults to None, meaning \
+                    throughput is not checked.
+            startup_timeout (float, optional): How many seconds a \
+                started stage has to beat for the first time. \
+                    Defaults to 30.0.
+            check_interval (float, optional): How many seconds to wait \
+                between checks. Defaults to 0.25.
+        """
+        self.stages: List[Stage] = list(stages)
+        self.stall_timeout: float = stall_timeout
+        self.min_rate: Optional[float] = min_rate
+        self.startup_timeout: float = startup_timeout
+        self.check_interval: float = check_interval
+        self.processes: List[mp.Process] = []
+        """Processes started by restarting stages."""
+        self.restarts: Dict[str, int] = {stage.name: 0
+                                         for stage in self.stages}
+        """How many times each stage has been restarted."""
+        self.recovery_times: List[Tuple[str, float]] = []
+        """Each recovered stage and the seconds between its last \
+            beat before stalling and its first beat after restarting."""
+        self._states: List[_StageState] = []
+        self._stop: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start checking the stages on a background thread."""
+        if self._thread is not None:
+            return
+        self._reset()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop checking the stages."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _reset(self) -> None:
+        """Forget what is known about the stages."""
+        now: float = time.monotonic()
+        self._states = [_StageState(now, stage.heartbeat.last_beat == 0)
+                        for stage in self.stages]
+
+    def _watch(self) -> None:
+        """Check the stages until stopped."""
+        while not self._stop.wait(self.check_interval):
+            self.check()
+
+    def check(self, now: Optional[float] = None) -> List[str]:
+        """Restart any stages that have stalled.
+
+        Args:
+            now (Optional[float], optional): The current \
+                `time.monotonic` time. Defaults to None, meaning now.
+
+        Returns:
+            List[str]: The names of the stages that were restarted.
+        """
+        if not self._states:
+            self._reset()
+        if now is None:
+            now = time.monotonic()
+        restarted: List[str] = []
+        for stage, state in zip(self.stages, self._states):
+            beat: float = stage.heartbeat.last_beat
+            if state.awaiting and beat > state.started:
+                state.awaiting = False
+                if state.stalled_since is not None:
+                    self._recovered(stage, beat - state.stalled_since)
+                    state.stalled_since = None
+
+            state.samples.append((now, stage.heartbeat.count))
+            while len(state.samples) > 2 and \
+                    state.samples[1][0] <= now - self.stall_timeout:
+                state.samples.popleft()
+
+            if not self._stalled(state, beat, now):
+                continue
+            logging.warning("Pipeline stage %s stalled, restarting it",
+                            stage.name)
+            if state.stalled_since is None:
+                state.stalled_since = beat if beat > 0 else state.started
+            self.processes += stage.restart()
+            self.restarts[stage.name] += 1
+            restarted.append(stage.name)
+            # Stages restarted together all need time to start again
+            for other, other_state in zip(self.stages, self._states):
+                if other.restart == stage.restart:
+                    other_state.started = now
+                    other_state.awaiting = True
+                    other_state.samples.clear()
+        return restarted
+
+    def _stalled(self, state: _StageState, beat: float, now: float) -> bool:
+        """Check if a stage has stalled."""
+        if state.awaiting:
+            return now - state.started > self.startup_timeout
+        if now - beat > self.stall_timeout:
+            return True
+        if self.min_rate is None or \
+                state.samples[-1][0] - state.samples[0][0] < \
+                self.stall_timeout:
+            return False
+        (first, first_count), (last, last_count) = \
+            state.samples[0], state.samples[-1]
+        return (last_count - first_count) / (last - first) < self.min_rate
+
+    def _recovered(self, stage: Stage, seconds: float) -> None:
+        """Record how long a stage took to recover."""
+        self.recovery_times.append((stage.name, seconds))
+        logging.info("Pipeline stage %s recovered after %.2f seconds",
+                     stage.name, seconds)
@@ -4,5 +4,13 @@ from .pygame_ui.pygame import (  # noqa
     PyGameUI,
     PyGameButton,
     PyGameSkeleton,
-    PyGameTrackingBubble
+    PyGameTrackingBubble,
+    PyGameProfilerOverlay
+)
+from .pygame_ui.headless import HeadlessPyGameUI  # noqa
+from .opencv_ui.opencv import (  # noqa
+    OpenCVUI,
+    OpenCVButton,
+    OpenCVSkeleton,
+    OpenCVTrackingBubble
 )
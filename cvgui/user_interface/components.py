@@ -0,0 +1,65 @@
+"""The components module contains the state shared by the button \
+and tracking bubble components of every user interface."""
+from typing import Callable, List, Optional, Tuple
+from cvgui.core.displaying.components import Skeleton
+
+
+class ButtonBase:
+    """The attributes of a `cvgui.core.displaying.components.Button`, \
+    leaving drawing and clicking to each user interface."""
+
+    def __init__(self, pos: Tuple[float, float],
+                 activation_distance: float,
+                 color: Tuple[int, int, int, int],
+                 radius: int) -> None:
+        """Create a new button at the location specified."""
+        self.pos = pos
+        """The position to render the button at."""
+
+        self.activation_distance: float = activation_distance
+        """The distance between and action and the button for \
+            it to be considered clicked."""
+
+        self.targets: List[int] = []
+        """Indicies of pose points that can click the button."""
+
+        self.callback: Callable = lambda: None
+        """The function to run when the button is clicked."""
+
+        self.color: Tuple[int, int, int, int] = color
+        """The color to make the button."""
+
+        self.radius: int = radius
+        """The radius to make the button."""
+
+        self.view: Optional[Skeleton] = None
+        """The skeleton whose screen space targets are checked in. \
+            The first skeleton of the scene is used if None."""
+
+
+class TrackingBubbleBase:
+    """The attributes of a \
+    `cvgui.core.displaying.components.TrackingBubble`, leaving \
+    drawing to each user interface."""
+
+    def __init__(self,
+                 color: Tuple[int, int, int, int],
+                 radius: int,
+                 target: int) -> None:
+        """Create a new tracking bubble.
+
+        Args:
+            color (Tuple[int, int, int, int]): The color \
+                to make the tracking bubble.
+            radius (int): The radius to make the \
+                tracking bubble.
+            target (int): The index of the pose point that \
+                the tracking bubble should follow.
+        """
+        self.color: Tuple[int, int, int, int] = color
+        self.radius: int = radius
+        self.target: int = target
+        self.pos: Tuple[float, float] = (0, 0)
+        self.view: Optional[Skeleton] = None
+        """The skeleton whose screen space the tracking bubble \
+            follows. The first skeleton of the scene is used if None."""
@@ -0,0 +1,3 @@
+"""The `opencv_ui` package implements the `cvgui.core.displaying` interface \
+by drawing directly into numpy image buffers with \
+[OpenCV](https://docs.opencv.org/)."""
@@ -0,0 +1,210 @@
+"""User interface implementation that composites components \
+into a numpy image using OpenCV."""
+import time
+from typing import Callable, List, Optional, Tuple
+import cv2
+import numpy as np
+from cvgui.core.displaying.components import Button, Skeleton, TrackingBubble
+from cvgui.core.receiving import Topology
+from cvgui.user_interface.components import ButtonBase, TrackingBubbleBase
+from cvgui.user_interface.skeleton_view import SkeletonView
+
+X = 0
+Y = 1
+
+
+def _bgr(color: Tuple[int, ...]) -> Tuple[int, int, int]:
+    """Convert an rgb(a) color to the bgr order used by OpenCV."""
+    return (color[2], color[1], color[0])
+
+
+# pylint: disable-next=too-many-instance-attributes
+class OpenCVUI:
+    """User interface whose window is a preallocated numpy image.
+
+    Components draw into the image in place. Once a frame is \
+    finished, the image itself is handed to every sink, such as \
+    a video writer or a network stream, without being copied. \
+    Sinks must copy the frame if they need it after they return.
+    """
+
+    BACKGROUND: Tuple[int, int, int] = (0, 0, 0)
+
+    window: np.ndarray
+    running: bool
+
+    def __init__(self, height: int, width: int, fps: int = 0,
+                 show: bool = True, title: str = "cvgui") -> None:
+        """Create a new OpenCV user interface.
+
+        Args:
+            height (int): The height of the image.
+            width (int): The width of the image.
+            fps (int, optional): The most frames per second to render. \
+                Defaults to 0, meaning unthrottled.
+            show (bool, optional): Whether to display each frame in an \
+                OpenCV window. Defaults to True.
+            title (str, optional): The title of the OpenCV window. \
+                Defaults to "cvgui".
+        """
+        self.width: int = width
+        self.height: int = height
+        self.fps: int = fps
+        self.show: bool = show
+        self.title: str = title
+        self.sinks: List[Callable[[np.ndarray], None]] = []
+        """Functions that are given each finished frame."""
+        self.background: Optional[np.ndarray] = None
+        """An image, such as a camera frame, to draw components \
+            on top of. Resized to fit the window if needed."""
+        self._blank: np.ndarray = np.empty((0, 0, 3), dtype=np.uint8)
+        self._last_update: float = 0
+
+    def add_sink(self, sink: Callable[[np.ndarray], None]) -> None:
+        """Hand every finished frame to a function.
+
+        Args:
+            sink (Callable[[np.ndarray], None]): The function to give \
+                each finished (height, width, 3) bgr frame to.
+        """
+        self.sinks.append(sink)
+
+    def new_gui(self) -> None:
+        """Allocate the image that components are drawn into."""
+        self.window = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        # Filling the window with a color broadcasts it pixel by
+        # pixel, so the blank frame is built once and copied instead
+        self._blank = np.empty_like(self.window)
+        self._blank[:] = _bgr(self.BACKGROUND)
+        np.copyto(self.window, self._blank)
+        self._last_update = time.perf_counter()
+        self.running = True
+
+    def clear(self) -> None:
+        """Reset the image to the background."""
+        if self.background is None:
+            np.copyto(self.window, self._blank)
+        elif self.background.shape == self.window.shape:
+            np.copyto(self.window, self.background)
+        else:
+            cv2.resize(self.background, (self.width, self.height),
+                       dst=self.window)
+
+    def update(self) -> None:
+        """Hand the finished frame to each sink and optionally \
+        display it."""
+        for sink in self.sinks:
+            sink(self.window)
+
+        if self.show:
+            cv2.imshow(self.title, self.window)
+            if cv2.waitKey(1) == 27:
+                cv2.destroyWindow(self.title)
+                self.running = False
+
+        if self.fps > 0:
+            remaining: float = 1 / self.fps - \
+                (time.perf_counter() - self._last_update)
+            if remaining > 0:
+                time.sleep(remaining)
+        self._last_update = time.perf_counter()
+
+    def button(self, pos: Tuple[float, float],
+               activation_distance: float,
+               color: Tuple[int, int, int, int],
+               radius: int = 100) -> Button:
+        """Create an OpenCV button at the specified location."""
+        return OpenCVButton(pos=pos, activation_distance=activation_distance,
+                            color=color, radius=radius)
+
+    def skeleton(self, pos: Tuple[float, float], scale: int,
+                 mirror: bool = False,
+                 model: Optional[Topology] = None,
+                 visibility_threshold: Optional[float] = None
+                 ) -> Skeleton:
+        """Create an OpenCV skeleton at the specified location."""
+        return OpenCVSkeleton(pos=pos, scale=scale, mirror=mirror,
+                              model=model,
+                              visibility_threshold=visibility_threshold)
+
+    def tracking_bubble(self,
+                        target: int,
+                        color: Tuple[int, int, int, int],
+                        radius: int = 100
+                        ) -> TrackingBubble:
+        """Create an OpenCV tracking bubble with the given settings."""
+        return OpenCVTrackingBubble(color=color, target=target,
+                                    radius=radius)
+
+
+class OpenCVTrackingBubble(TrackingBubbleBase):
+    """An implementation of the \
+        `cvgui.core.displaying.components.TrackingBubble` \
+            component in OpenCV."""
+
+    def render(self, window: np.ndarray) -> None:
+        """Draw the tracking bubble into the image."""
+        cv2.circle(window, (int(self.pos[X]), int(self.pos[Y])),
+                   self.radius, _bgr(self.color), cv2.FILLED)
+
+
+class OpenCVButton(ButtonBase):
+    """An implementation of the \
+        `cvgui.core.displaying.components.Button` \
+            component in OpenCV."""
+
+    def is_clicked(self, pos: Tuple[float, float]) -> bool:
+        """Check if the button has been clicked."""
+        return (self.pos[X] - pos[X])**2 + (self.pos[Y] - pos[Y])**2 \
+            <= self.activation_distance**2
+
+    def render(self, window: np.ndarray) -> None:
+        """Draw the button into the image."""
+        cv2.circle(window, (int(self.pos[X]), int(self.pos[Y])),
+                   self.radius, _bgr(self.color), cv2.FILLED)
+
+
+class OpenCVSkeleton(SkeletonView):
+    """Skeleton implementation in OpenCV."""
+
+    LIMB_COLOR: Tuple[int, int, int] = (255, 255, 255)
+    LIMB_WIDTH: int = 2
+
+    LANDMARK_COLOR: Tuple[int, int, int] = (0, 255, 0)
+    LANDMARK_RADIUS: int = 5
+
+    def __init__(self, pos: Tuple[float, float], scale: int,
+                 mirror: bool = False,
+                 model: Optional[Topology] = None,
+                 visibility_threshold: Optional[float] = None) -> None:
+        """Create a new OpenCV skeleton."""
+        self._limbs: np.ndarray
+        self._landmarks: np.ndarray
+        super().__init__(pos=pos, scale=scale, mirror=mirror, model=model,
+                         visibility_threshold=visibility_threshold)
+
+    def _topology_changed(self) -> None:
+        """Resize the buffers drawing reuses every frame so it \
+        allocates nothing."""
+        self._limbs = np.zeros((len(self.connections), 2, 2), dtype=np.int32)
+        self._landmarks = np.zeros((len(self.skeleton_points), 2),
+                                   dtype=np.int32)
+
+    def render(self, window: np.ndarray) -> None:
+        """Draw the skeleton into the image."""
+        np.copyto(self._limbs, self.skeleton_points[self.connections, :2],
+                  casting="unsafe")
+        np.copyto(self._landmarks, self.skeleton_points[:, :2],
+                  casting="unsafe")
+        limbs: np.ndarray = self._limbs
+        landmarks: np.ndarray = self._landmarks
+        if self.visibility_threshold is not None:
+            limbs = limbs[self.limbs_visible]
+            landmarks = landmarks[self.visible]
+
+        cv2.polylines(window, limbs, False, _bgr(self.LIMB_COLOR),
+                      self.LIMB_WIDTH)
+        color: Tuple[int, int, int] = _bgr(self.LANDMARK_COLOR)
+        for point_x, point_y in landmarks:
+            cv2.circle(window, (int(point_x), int(point_y)),
+                       self.LANDMARK_RADIUS, color, cv2.FILLED)
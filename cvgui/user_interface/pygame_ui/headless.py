@@ -0,0 +1,70 @@
+"""Offscreen user interface implementation of PyGame."""
+from typing import Optional
+import pygame
+import numpy as np
+from cvgui.pipeline.frame_buffer import FrameBuffer
+from cvgui.user_interface.pygame_ui.pygame import PyGameUI
+
+
+class HeadlessPyGameUI(PyGameUI):
+    """PyGame user interface that renders onto an offscreen surface.
+
+    No display window is opened and frames are not throttled, which \
+    allows activities to run on machines without a display such as \
+    build agents and render servers.
+    """
+
+    window: pygame.surface.Surface
+    running: bool
+
+    def __init__(self, height: int, width: int,
+                 max_frames: Optional[int] = None,
+                 background: Optional[FrameBuffer] = None) -> None:
+        """Create a new headless pygame user interface.
+
+        Args:
+            height (int): The height of the offscreen surface.
+            width (int): The width of the offscreen surface.
+            max_frames (Optional[int], optional): How many frames \
+                to render before the user interface stops running. \
+                    Defaults to None, meaning render forever.
+            background (Optional[FrameBuffer], optional): Buffer \
+                holding bgr video frames to draw behind the \
+                    components. Defaults to None.
+        """
+        super().__init__(height=height, width=width, fps=0,
+                         background=background)
+        self.max_frames: Optional[int] = max_frames
+        self.frame_count: int = 0
+        """How many frames have been rendered since `new_gui` \
+            was called."""
+
+    def new_gui(self) -> None:
+        """Initialize the offscreen surface."""
+        pygame.font.init()
+        self.window = pygame.Surface((self.width, self.height))
+        self.window.fill(self.BACKGROUND)
+        self.frame_count = 0
+        self.running = self.max_frames is None or self.max_frames > 0
+
+    def update(self) -> None:
+        """Finish the current frame without throttling and stop \
+        running once the maximum number of frames is reached."""
+        self.frame_count += 1
+        if self.max_frames is not None and \
+                self.frame_count >= self.max_frames:
+            self.running = False
+
+    def get_frame(self) -> np.ndarray:
+        """Read back the most recently rendered frame.
+
+        Returns:
+            np.ndarray: A copy of the window as a contiguous \
+                (height, width, 3) RGB array.
+        """
+        # Referencing the pixels directly avoids a second copy, but
+        # keeps the surface locked until the reference is released.
+        pixels: np.ndarray = pygame.surfarray.pixels3d(self.window)
+        frame: np.ndarray = np.ascontiguousarray(pixels.swapaxes(0, 1))
+        del pixels
+        return frame
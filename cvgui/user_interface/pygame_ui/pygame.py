@@ -1,15 +1,21 @@
 """User interface implementation of PyGame."""
-from typing import Any, Callable, List, Literal, Tuple
+from typing import Any, List, Literal, Optional, Tuple
 import math
 import pygame
 from pygame.constants import QUIT
 import numpy as np
+from cvgui.activity.profiler import FrameProfiler
 from cvgui.core.displaying.components import Button, Skeleton, TrackingBubble
+from cvgui.core.receiving import Topology
+from cvgui.pipeline.frame_buffer import FrameBuffer
+from cvgui.user_interface.components import ButtonBase, TrackingBubbleBase
+from cvgui.user_interface.skeleton_view import SkeletonView
 
 X = 0
 Y = 1
 
 
+# pylint: disable-next=too-many-instance-attributes
 class PyGameUI:
     """User interface implementation of PyGame."""
 
@@ -19,7 +25,8 @@ class PyGameUI:
     fps_clock: pygame.time.Clock
     running: bool
 
-    def __init__(self, height: int, width: int, fps: int) -> None:
+    def __init__(self, height: int, width: int, fps: int,
+                 background: Optional[FrameBuffer] = None) -> None:
         """Create a new pygame user interface.
 
         Args:
@@ -27,15 +34,42 @@ class PyGameUI:
             width (int): The width of the UI window.
             fps (int): How many frames per second to \
                 render in the UI window.
+            background (Optional[FrameBuffer], optional): Buffer \
+                holding bgr video frames, such as from the camera, \
+                    to draw behind the components. Defaults to None.
         """
         self.width: int = width
         self.height: int = height
         self.fps: int = fps
+        self.background: Optional[FrameBuffer] = background
+        self._scaled_background: Optional[pygame.surface.Surface] = None
+        self._frame: Optional[np.ndarray] = None
+        """The latest background frame, reused every frame."""
 
     def clear(self) -> None:
         """Clear the pygame window by filling it with \
-        a single color."""
-        self.window.fill(self.BACKGROUND)
+        a single color, or by drawing the latest background frame."""
+        frame: Optional[np.ndarray] = None
+        if self.background is not None:
+            if self._frame is None:
+                self._frame = np.empty(self.background.shape, np.uint8)
+            frame = self.background.read(self._frame)
+        if frame is None:
+            self.window.fill(self.BACKGROUND)
+            return
+
+        # Wrap the frame in a surface without copying it again,
+        # then draw it onto the window in a single blit.
+        surface: pygame.surface.Surface = pygame.image.frombuffer(
+            frame, (frame.shape[1], frame.shape[0]), "BGR")
+        if surface.get_size() != self.window.get_size():
+            # Size the frame buffer to the window to skip this step
+            if self._scaled_background is None:
+                self._scaled_background = pygame.Surface(
+                    self.window.get_size(), 0, surface)
+            surface = pygame.transform.scale(
+                surface, self.window.get_size(), self._scaled_background)
+        self.window.blit(surface, (0, 0))
 
     def update(self) -> None:
         """Update the PyGame window."""
@@ -55,9 +89,15 @@ class PyGameUI:
         return PyGameButton(pos=pos, activation_distance=activation_distance,
                             color=color, radius=radius)
 
-    def skeleton(self, pos: Tuple[float, float], scale: int) -> Skeleton:
+    def skeleton(self, pos: Tuple[float, float], scale: int,
+                 mirror: bool = False,
+                 model: Optional[Topology] = None,
+                 visibility_threshold: Optional[float] = None
+                 ) -> Skeleton:
         """Create a PyGame skeleton at the specified location."""
-        return PyGameSkeleton(pos=pos, scale=scale)
+        return PyGameSkeleton(pos=pos, scale=scale, mirror=mirror,
+                              model=model,
+                              visibility_threshold=visibility_threshold)
 
     def tracking_bubble(self,
                         target: int,
@@ -94,30 +134,11 @@ class PyGameUI:
         self.running = True
 
 
-class PyGameTrackingBubble:
+class PyGameTrackingBubble(TrackingBubbleBase):
     """An implementation of the \
         `cvgui.core.displaying.components.TrackingBubble` \
             component in pygame."""
 
-    def __init__(self,
-                 color: Tuple[int, int, int, int],
-                 radius: int,
-                 target: int) -> None:
-        """Create a new pygame tracking bubble.
-
-        Args:
-            color (Tuple[int, int, int, int]): The color \
-                to make the tracking bubble.
-            radius (int): The radius to make the \
-                tracking bubble.
-            target (int): The index of the pose point that \
-                the pygame tracking bubble should follow.
-        """
-        self.color: Tuple[int, int, int, int] = color
-        self.radius: int = radius
-        self.target: int = target
-        self.pos: Tuple[float, float] = (0, 0)
-
     def render(self, window: Any) -> None:
         """Draw the tracking bubble on the \
             pygame window.
@@ -136,35 +157,11 @@ class PyGameTrackingBubble:
         )
 
 
-class PyGameButton:
+class PyGameButton(ButtonBase):
     """An implementation of the \
         `cvgui.core.displaying.components.Button` \
             component in pygame."""
 
-    def __init__(self, pos: Tuple[float, float],
-                 activation_distance: float,
-                 color: Tuple[int, int, int, int],
-                 radius: int) -> None:
-        """Create a new PyGameButton at the location specified."""
-        self.pos = pos
-        """The position to render the button at."""
-
-        self.activation_distance: float = activation_distance
-        """The distance between and action and the button for \
-            it to be considered clicked."""
-
-        self.targets: List[int]
-        """Indicies of pose points that can click the button."""
-
-        self.callback: Callable
-        """The function to run when the button is clicked."""
-
-        self.color: Tuple[int, int, int, int] = color
-        """The color to make the button."""
-
-        self.radius: int = radius
-        """The radius to make the button."""
-
     def is_clicked(self, pos: Tuple[float, float]) -> bool:
         """Check if the button has been clicked."""
         if abs(self.pos[X] - pos[X]) > self.activation_distance \
@@ -187,24 +184,9 @@ class PyGameButton:
         )
 
 
-class PyGameSkeleton:
+class PyGameSkeleton(SkeletonView):
     """Skeleton implementation in PyGame."""
 
-    # Where to connect limbs. Refer to here
-    # https://mediapipe.dev/images/mobile/pose_tracking_full_body_landmarks.png
-    # TODO: Move this somewhere else
-    CONNECTIONS: np.ndarray = np.array([
-        [16, 14], [16, 18], [16, 20], [16, 22],
-        [18, 20], [14, 12], [12, 11], [12, 24],
-        [11, 23], [11, 13], [15, 13], [15, 17],
-        [15, 19], [15, 21], [17, 19], [24, 23],
-        [26, 24], [26, 28], [25, 23], [25, 27],
-        [10, 9], [8, 6], [5, 6], [5, 4], [0, 4],
-        [0, 1], [2, 1], [2, 3], [3, 7], [28, 32],
-        [28, 30], [27, 29], [27, 31], [32, 30],
-        [29, 31]
-    ])
-
     LIMB_COLOR: tuple[Literal[255], Literal[255],
                       Literal[255]] = (255, 255, 255)
     LIMB_WIDTH: Literal[2] = 2
@@ -213,33 +195,80 @@ class PyGameSkeleton:
     LANDMARK_RADIUS: Literal[5] = 5
     LANDMARK_OUTLINE_WIDTH: Literal[0] = 0
 
-    NUM_LANDMARKS: Literal[33] = 33
     POINTS_PER_LANDMARK: Literal[4] = 4  # x, y, z, depth?
 
-    def __init__(self, pos: Tuple[float, float], scale: int) -> None:
+    def __init__(self, pos: Tuple[float, float], scale: int,
+                 mirror: bool = False,
+                 model: Optional[Topology] = None,
+                 visibility_threshold: Optional[float] = None) -> None:
         """Create a new PyGame skeleton."""
-        self.pos = pos
-        self.skeleton_points: np.ndarray = np.zeros((33, 4))
-        self.scale = scale
+        self._limbs: List[List[int]]
+        super().__init__(pos=pos, scale=scale, mirror=mirror, model=model,
+                         points_per_landmark=self.POINTS_PER_LANDMARK,
+                         visibility_threshold=visibility_threshold)
+
+    def _topology_changed(self) -> None:
+        """Convert the limbs to lists, since plain ints index \
+        python lists much faster than numpy scalars."""
+        self._limbs = self.connections.tolist()
 
     def render(self, window) -> None:
         """Draw the skeleton on the pygame window."""
-        for landmark_pair in self.CONNECTIONS:
-            start_landmark: int = landmark_pair[X]
-            end_landmark: int = landmark_pair[Y]
-            line_start_x: float = self.skeleton_points[start_landmark][X]
-            line_start_y: float = self.skeleton_points[start_landmark][Y]
-            line_end_x: float = self.skeleton_points[end_landmark][X]
-            line_end_y: float = self.skeleton_points[end_landmark][Y]
+        points: List[List[float]] = self.skeleton_points[:, :2].tolist()
+        limbs: List[List[int]] = self._limbs
+        shown_points: List[List[float]] = points
+        if self.visibility_threshold is not None:
+            limbs = [limb for limb, shown
+                     in zip(limbs, self.limbs_visible.tolist()) if shown]
+            shown_points = [point for point, shown
+                            in zip(points, self.visible.tolist()) if shown]
+        for start_landmark, end_landmark in limbs:
             pygame.draw.line(window, self.LIMB_COLOR,
-                             [float(line_start_x), float(line_start_y)],
-                             [float(line_end_x), float(line_end_y)],
+                             points[start_landmark], points[end_landmark],
                              self.LIMB_WIDTH)
 
-        for _, landmark in enumerate(self.skeleton_points):
-            point_x: float = landmark[X]
-            point_y: float = landmark[Y]
-            pygame.draw.circle(window, self.LANDMARK_COLOR,
-                               [point_x, point_y],
+        for point in shown_points:
+            pygame.draw.circle(window, self.LANDMARK_COLOR, point,
                                self.LANDMARK_RADIUS,
                                self.LANDMARK_OUTLINE_WIDTH)
+
+
+class PyGameProfilerOverlay:
+    """Component that draws the stage times recorded by a \
+    `cvgui.activity.FrameProfiler` on the pygame window."""
+
+    TEXT_COLOR: tuple[Literal[255], Literal[255],
+                      Literal[0]] = (255, 255, 0)
+    FONT_SIZE: Literal[18] = 18
+
+    def __init__(self, profiler: FrameProfiler,
+                 pos: Tuple[float, float] = (10, 10),
+                 refresh_frames: int = 30) -> None:
+        """Create a new profiler overlay.
+
+        Args:
+            profiler (FrameProfiler): The profiler to display.
+            pos (Tuple[float, float], optional): Where to draw the \
+                top left corner of the text. Defaults to (10, 10).
+            refresh_frames (int, optional): How many frames to wait \
+                between redrawing the text. Defaults to 30.
+        """
+        self.profiler: FrameProfiler = profiler
+        self.pos: Tuple[float, float] = pos
+        self.refresh_frames: int = refresh_frames
+        self._font: Any = None
+        self._lines: List[pygame.surface.Surface] = []
+        self._frames: int = 0
+
+    def render(self, window) -> None:
+        """Draw the most recent stage times on the pygame window."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, self.FONT_SIZE)
+        # Drawing text is slow, so only do it every few frames
+        if self._frames % self.refresh_frames == 0:
+            self._lines = [self._font.render(line, True, self.TEXT_COLOR)
+                           for line in self.profiler.summary()]
+        self._frames += 1
+        for i, line in enumerate(self._lines):
+            window.blit(line, (self.pos[X],
+                               self.pos[Y] + i * line.get_height()))
@@ -0,0 +1,167 @@
+"""The skeleton_view module contains the screen space \
+transformation shared by skeleton components."""
+from typing import Dict, Optional, Tuple
+import numpy as np
+from cvgui.core.receiving import Topology, visible
+from cvgui.core.receiving.topology import BLAZEPOSE_CONNECTIONS, \
+    BLAZEPOSE_LANDMARKS, COCO_CONNECTIONS, COCO_LANDMARKS
+
+X = 0
+Y = 1
+
+_CONNECTIONS: Dict[int, np.ndarray] = {
+    BLAZEPOSE_LANDMARKS: BLAZEPOSE_CONNECTIONS,
+    COCO_LANDMARKS: COCO_CONNECTIONS}
+"""The limbs of the known topologies, by number of landmarks."""
+
+
+# pylint: disable-next=too-many-instance-attributes
+class SkeletonView:
+    """Transforms raw poses into the screen space of a \
+    single skeleton component.
+
+    Each view owns an affine transform and a preallocated buffer \
+    for its screen space points. Updating a view never modifies \
+    the raw pose, so several views of the same pose can be shown \
+    at different positions, scales, or mirrored.
+
+    The number of landmarks and the limbs between them come from \
+    the topology of the model that makes the poses, such as \
+    `cvgui.BlazePose`. A view without a model starts with \
+    BlazePose's topology and switches to the topology of the first \
+    pose with a different number of landmarks, such as a 17 \
+    keypoint COCO pose, drawing no limbs if it is unknown. \
+    Landmarks less visible than the view's visibility threshold, \
+    along with the limbs they end, are neither drawn nor used to \
+    click buttons.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(self, pos: Tuple[float, float], scale: float,
+                 mirror: bool = False, model: Optional[Topology] = None,
+                 points_per_landmark: int = 4,
+                 visibility_threshold: Optional[float] = None) -> None:
+        """Create a new skeleton view.
+
+        Args:
+            pos (Tuple[float, float]): Where the origin of the pose \
+                should be on screen.
+            scale (float): How much to scale the pose by.
+            mirror (bool, optional): Whether to flip the pose \
+                horizontally. Defaults to False.
+            model (Optional[Topology], optional): The model, or model \
+                class, whose poses are shown. Defaults to None, meaning \
+                    the topology of the poses it is given.
+            points_per_landmark (int, optional): The number of values \
+                for each point in a pose. Defaults to 4.
+            visibility_threshold (Optional[float], optional): The \
+                lowest visibility a landmark can have to be shown. \
+                    Defaults to None, meaning every landmark is shown.
+        """
+        self._pos: Tuple[float, float] = pos
+        self._scale: float = scale
+        self._mirror: bool = mirror
+        self._model: Optional[Topology] = model
+        self._points_per_landmark: int = points_per_landmark
+
+        self.transform: np.ndarray = np.zeros((2, 3))
+        """The 2x3 affine transform from pose to screen coordinates. \
+            Rebuilt whenever `pos`, `scale`, or `mirror` change, but \
+                can also be set directly."""
+        self._build_transform()
+
+        self.visibility_threshold: Optional[float] = visibility_threshold
+        """The lowest visibility a landmark can have to be shown. \
+            None shows every landmark."""
+
+        self.connections: np.ndarray
+        """The landmark indices at either end of each limb."""
+        self.skeleton_points: np.ndarray
+        """The most recent pose in screen coordinates."""
+        self.visible: np.ndarray
+        """Whether each landmark of the most recent pose is shown."""
+        self.limbs_visible: np.ndarray
+        """Whether both ends of each limb are shown."""
+        self._homogeneous: np.ndarray
+        if model is None:
+            self._set_topology(BLAZEPOSE_LANDMARKS, BLAZEPOSE_CONNECTIONS)
+        else:
+            self._set_topology(model.NUM_LANDMARKS, model.CONNECTIONS)
+
+    @property
+    def pos(self) -> Tuple[float, float]:
+        """Where the origin of the pose should be on screen."""
+        return self._pos
+
+    @pos.setter
+    def pos(self, pos: Tuple[float, float]) -> None:
+        self._pos = pos
+        self._build_transform()
+
+    @property
+    def scale(self) -> float:
+        """How much to scale the pose by."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: float) -> None:
+        self._scale = scale
+        self._build_transform()
+
+    @property
+    def mirror(self) -> bool:
+        """Whether to flip the pose horizontally."""
+        return self._mirror
+
+    @mirror.setter
+    def mirror(self, mirror: bool) -> None:
+        self._mirror = mirror
+        self._build_transform()
+
+    def _set_topology(self, num_landmarks: int,
+                      connections: np.ndarray) -> None:
+        """Size the view's buffers for a topology."""
+        self.connections = np.asarray(connections,
+                                      dtype=np.intp).reshape(-1, 2)
+        self.skeleton_points = np.zeros(
+            (num_landmarks, self._points_per_landmark))
+        # Pose x and y values with a column of ones so the
+        # whole transform can be applied in one multiplication
+        self._homogeneous = np.ones((num_landmarks, 3))
+        self.visible = np.ones(num_landmarks, dtype=bool)
+        self.limbs_visible = np.ones(len(self.connections), dtype=bool)
+        self._topology_changed()
+
+    def _topology_changed(self) -> None:
+        """Resize anything a subclass derived from the topology. \
+        Called whenever the view's buffers are resized."""
+
+    def _build_transform(self) -> None:
+        """Build the affine transform from the position, scale, \
+        and mirroring of the view."""
+        self.transform[:] = 0
+        self.transform[X, X] = -self._scale if self._mirror else self._scale
+        self.transform[Y, Y] = self._scale
+        self.transform[X, 2] = self._pos[X]
+        self.transform[Y, 2] = self._pos[Y]
+
+    def update(self, pose: np.ndarray) -> None:
+        """Transform a raw pose into the view's screen space.
+
+        Args:
+            pose (np.ndarray): The raw pose. It is not modified.
+        """
+        if self._model is None and len(pose) != len(self.skeleton_points):
+            self._set_topology(len(pose), _CONNECTIONS.get(
+                len(pose), np.zeros((0, 2), dtype=np.intp)))
+        self._homogeneous[:, :2] = pose[:, :2]
+        np.matmul(self._homogeneous, self.transform.T,
+                  out=self.skeleton_points[:, :2])
+        self.skeleton_points[:, 2:] = pose[:, 2:]
+        visible(pose, self.visibility_threshold, out=self.visible)
+        if self.visibility_threshold is None:
+            self.limbs_visible[:] = True
+        else:
+            np.logical_and(self.visible[self.connections[:, 0]],
+                           self.visible[self.connections[:, 1]],
+                           out=self.limbs_visible)
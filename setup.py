@@ -15,7 +15,7 @@ REQUIRED = [
     "numpy>=1.21.2",
     "opencv_python>=4.3.0.38",
     "typing_extensions>=4.3.0",
-    "pygame>=2.0.0"
+    "pygame>=2.1.3"
 ]
 
 here = os.path.abspath(os.path.dirname(__file__))
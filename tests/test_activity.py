@@ -8,16 +8,18 @@ class TestActivity(unittest.TestCase):
         self.activity = cvgui.Activity(pose_input=None, frontend=None)
         self.scene_1 = cvgui.Scene()
         self.scene_2 = cvgui.Scene()
-        self.activity._active_scene = 0
-
-    def tearDown(self) -> None:
-        self.activity._scenes = []
-        self.activity._active_scene = 0
-
-    def test_add_scene(self):
         self.activity.add_scene(self.scene_1)
         self.activity.add_scene(self.scene_2)
-        self.assertEqual(len(self.activity._scenes), 2)
+
+    def test_add_scene(self):
+        self.assertEqual(self.activity._scenes,
+                         [self.scene_1, self.scene_2])
+
+    def test_scenes_per_instance(self):
+        other = cvgui.Activity(pose_input=None, frontend=None)
+        other.add_logger(None)
+        self.assertEqual(other._scenes, [])
+        self.assertEqual(self.activity.pose_loggers, [])
 
     def test_next_scene(self):
         self.assertEqual(self.activity._active_scene, 0)
@@ -65,3 +67,16 @@ class TestActivity(unittest.TestCase):
         index_too_big = 5
         self.assertFalse(self.activity.set_scene(index_too_big))
         self.assertEqual(self.activity._active_scene, 0)
+
+    def test_scene_sorts_components(self):
+        ui = cvgui.HeadlessPyGameUI(100, 100)
+        skeleton = cvgui.skeleton(gui=ui, pos=(50, 50), scale=10)
+        button = cvgui.button(gui=ui, pos=(10, 10), radius=5,
+                              activation_distance=5)
+        bubble = cvgui.tracking_bubble(gui=ui, target=0, radius=5)
+        for component in (button, skeleton, bubble):
+            self.scene_1.add_component(component)
+        self.assertEqual(self.scene_1.components, [button, skeleton, bubble])
+        self.assertEqual(self.scene_1.skeletons, [skeleton])
+        self.assertEqual(self.scene_1.buttons, [button])
+        self.assertEqual(self.scene_1.tracking_bubbles, [bubble])
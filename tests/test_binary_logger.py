@@ -0,0 +1,76 @@
+import multiprocessing as mp
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+
+from cvgui.outputs.loggers.binary_logger import BinaryPoseLogger, \
+    HEADER_SIZE, convert_to_csv, read_binary_log
+
+
+class TestBinaryPoseLogger(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = Path(self.directory.name) / "poses.bin"
+        self.logger = BinaryPoseLogger(self.filepath, chunk_rows=4)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def append(self, count):
+        for i in range(count):
+            self.logger._append(np.full((33, 4), i))
+
+    def test_grows_in_chunks(self):
+        self.append(5)
+        self.logger._flush()
+        record_size = 8 + 33 * 4 * 4
+        self.assertEqual(self.filepath.stat().st_size,
+                         HEADER_SIZE + 8 * record_size)
+
+    def test_read_flushed(self):
+        self.append(5)
+        self.logger._flush()
+        records = read_binary_log(self.filepath)
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records["pose"].shape, (5, 33, 4))
+        np.testing.assert_array_equal(records["pose"][:, 0, 0], range(5))
+        self.assertTrue(np.all(np.diff(records["timestamp"]) >= 0))
+
+    def test_process_exits_on_close(self):
+        pose_queue = mp.Queue()
+        process, = self.logger.start(pose_queue)
+        pose_queue.put(np.zeros((33, 4)))
+        self.logger.close()
+        process.join(10)
+        self.assertFalse(process.is_alive())
+        self.assertEqual(len(read_binary_log(self.filepath)), 1)
+
+    def test_close_trims_file(self):
+        self.append(5)
+        self.logger._close_file()
+        self.assertEqual(self.filepath.stat().st_size,
+                         HEADER_SIZE + 5 * (8 + 33 * 4 * 4))
+        self.assertEqual(len(read_binary_log(self.filepath)), 5)
+
+    def test_convert_to_csv(self):
+        self.append(3)
+        self.logger._close_file()
+        csv_path = Path(self.directory.name) / "poses.csv"
+        convert_to_csv(self.filepath, csv_path, block_rows=2)
+        with open(csv_path, encoding="utf-8") as file:
+            header = file.readline().strip().split(",")
+        self.assertEqual(len(header), 133)
+        saved = np.loadtxt(csv_path, delimiter=",", skiprows=1)
+        np.testing.assert_array_equal(saved[:, 1], [0, 1, 2])
+
+    def test_not_a_log(self):
+        self.filepath.write_bytes(b"\0" * HEADER_SIZE)
+        with self.assertRaises(ValueError):
+            read_binary_log(self.filepath)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import multiprocessing as mp
+import time
+import unittest
+
+from cvgui.pipeline import Channel, ChannelPolicy
+
+
+def _produce(channel, count):
+    for i in range(count):
+        channel.put(i)
+
+
+class TestChannel(unittest.TestCase):
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            Channel(capacity=0)
+
+    def test_drop_oldest(self):
+        channel = Channel(capacity=2, policy=ChannelPolicy.DROP_OLDEST)
+        for i in range(5):
+            channel.put(i)
+        self.assertEqual(channel.depth, 2)
+        self.assertEqual(channel.dropped, 3)
+        self.assertEqual(channel.get(timeout=1), 3)
+        self.assertEqual(channel.get(timeout=1), 4)
+        self.assertEqual(channel.depth, 0)
+
+    def test_keep_latest(self):
+        channel = Channel(capacity=4, policy=ChannelPolicy.KEEP_LATEST)
+        for i in range(3):
+            channel.put(i)
+        # Give the queue's feeder thread time to flush
+        time.sleep(0.1)
+        self.assertEqual(channel.get(timeout=1), 2)
+        self.assertEqual(channel.dropped, 2)
+        self.assertEqual(channel.depth, 0)
+
+    def test_block_is_lossless(self):
+        channel = Channel(capacity=2, policy=ChannelPolicy.BLOCK)
+        channel.put(0)
+        channel.put(1)
+        with self.assertRaises(Exception):
+            channel.put(2, timeout=0.05)
+        self.assertEqual(channel.get(timeout=1), 0)
+        self.assertEqual(channel.dropped, 0)
+
+    def test_disconnect(self):
+        channel = Channel(capacity=2, policy=ChannelPolicy.BLOCK)
+        channel.put(0)
+        channel.put(1)
+        producer = mp.Process(target=_produce, args=(channel, 10))
+        producer.start()
+        time.sleep(0.1)
+        channel.disconnect()
+        producer.join(10)
+        self.assertFalse(producer.is_alive())
+        self.assertTrue(channel.disconnected)
+        # A put already waiting when the channel was drained can
+        # still land in it
+        self.assertLessEqual(channel.depth, 1)
+        self.assertEqual(channel.depth + channel.dropped, 12)
+
+    def test_counters_shared_across_processes(self):
+        channel = Channel(capacity=4, policy=ChannelPolicy.BLOCK)
+        producer = mp.Process(target=_produce, args=(channel, 10))
+        producer.start()
+        received = [channel.get(timeout=5) for _ in range(10)]
+        producer.join(timeout=5)
+        self.assertEqual(received, list(range(10)))
+        self.assertEqual(channel.depth, 0)
+        self.assertEqual(channel.dropped, 0)
@@ -0,0 +1,121 @@
+import multiprocessing as mp
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+
+from cvgui.outputs.loggers.csv_logger import CSVPoseLogger
+from cvgui.outputs.loggers.queued_logger import QueuedPoseLogger
+
+
+class TestCSVPoseLogger(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = Path(self.directory.name) / "poses.csv"
+        self.logger = CSVPoseLogger(self.filepath)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_no_data(self):
+        self.assertIsNone(self.logger.data)
+
+    def test_append_grows(self):
+        rows = CSVPoseLogger.INITIAL_ROWS * 2 + 1
+        for i in range(rows):
+            self.logger._append(np.full((33, 4), i))
+        self.assertEqual(self.logger.count, rows)
+        self.assertEqual(self.logger.data.shape, (rows, 133))
+        np.testing.assert_array_equal(self.logger.data[:, 1], range(rows))
+        self.assertTrue(np.all(np.diff(self.logger.data[:, 0]) >= 0))
+
+    def test_save(self):
+        for i in range(3):
+            self.logger._append(np.full((33, 4), i))
+        self.logger._save_to_csv()
+        with open(self.filepath, encoding="utf-8") as file:
+            header = file.readline().strip().split(",")
+        self.assertEqual(header[:3], ["timestamp", "x00", "y00"])
+        saved = np.loadtxt(self.filepath, delimiter=",", skiprows=1)
+        np.testing.assert_array_equal(saved[:, 1], [0, 1, 2])
+
+    def test_process_exits_on_close(self):
+        pose_queue = mp.Queue()
+        process, = self.logger.start(pose_queue)
+        pose_queue.put(np.zeros((33, 4)))
+        self.logger.close()
+        process.join(10)
+        self.assertFalse(process.is_alive())
+        self.assertTrue(self.filepath.exists())
+
+
+class TestStreamingCSVPoseLogger(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = Path(self.directory.name) / "poses.csv"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def append(self, logger, count):
+        for i in range(count):
+            logger._append(np.full((33, 4), i))
+            if logger._flush_due():
+                logger._flush()
+
+    def test_flush_on_row_threshold(self):
+        logger = CSVPoseLogger(self.filepath, streaming=True,
+                               flush_rows=10, flush_interval=60)
+        self.append(logger, 25)
+        # Only unflushed poses are kept in memory
+        self.assertEqual(logger.count, 5)
+        self.assertEqual(len(np.loadtxt(self.filepath, delimiter=",",
+                                        skiprows=1)), 20)
+        logger._close_file()
+        saved = np.loadtxt(self.filepath, delimiter=",", skiprows=1)
+        np.testing.assert_array_equal(saved[:, 1], range(25))
+
+    def test_flush_on_time_threshold(self):
+        logger = CSVPoseLogger(self.filepath, streaming=True,
+                               flush_rows=1000, flush_interval=0)
+        self.append(logger, 3)
+        self.assertEqual(logger.count, 0)
+        logger._close_file()
+
+    def test_rotate_by_size(self):
+        logger = CSVPoseLogger(self.filepath, streaming=True,
+                               flush_rows=10, rotate_bytes=1)
+        self.append(logger, 30)
+        logger._close_file()
+        files = sorted(Path(self.directory.name).iterdir())
+        self.assertEqual([file.name for file in files],
+                         ["poses_0000.csv", "poses_0001.csv",
+                          "poses_0002.csv"])
+        for i, file in enumerate(files):
+            saved = np.loadtxt(file, delimiter=",", skiprows=1)
+            np.testing.assert_array_equal(saved[:, 1],
+                                          range(i * 10, i * 10 + 10))
+
+
+class TestQueuedPoseLogger(unittest.TestCase):
+
+    def test_incomplete_logger_rejected(self):
+        class NoSaveLogger(QueuedPoseLogger):
+
+            def _append(self, pose_data):
+                pass
+
+            def _flush_due(self):
+                return False
+
+            def _flush(self):
+                pass
+
+            def _close_file(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            NoSaveLogger()
@@ -0,0 +1,101 @@
+import threading
+import time
+import unittest
+
+from cvgui.activity.executor import CallbackExecutor
+
+
+class TestCallbackExecutor(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.executor = CallbackExecutor(max_workers=2, frame_budget=0.05)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+
+    def test_callback_runs_off_thread(self):
+        release = threading.Event()
+        threads = []
+
+        def callback():
+            threads.append(threading.current_thread())
+            release.wait(timeout=1)
+
+        self.assertTrue(self.executor.submit(callback))
+        release.set()
+        time.sleep(0.1)
+        self.assertNotEqual(threads[0], threading.current_thread())
+
+    def test_running_callback_not_resubmitted(self):
+        release = threading.Event()
+
+        def callback():
+            release.wait(timeout=1)
+
+        self.assertTrue(self.executor.submit(callback))
+        self.assertFalse(self.executor.submit(callback))
+        release.set()
+        time.sleep(0.1)
+        self.assertTrue(self.executor.submit(callback))
+
+    def test_running_callback_not_resubmitted_with_new_args(self):
+        release = threading.Event()
+        received = []
+
+        def callback(event):
+            received.append(event)
+            release.wait(timeout=1)
+
+        self.assertTrue(self.executor.submit(callback, 1))
+        self.assertFalse(self.executor.submit(callback, 2))
+        release.set()
+        time.sleep(0.1)
+        self.assertEqual(received, [1])
+
+    def test_returned_mutation_applied_next_frame(self):
+        state = {"pos": (0, 0)}
+
+        def mutation():
+            state["pos"] = (10, 10)
+
+        self.executor.submit(lambda: mutation)
+        time.sleep(0.1)
+        self.assertEqual(state["pos"], (0, 0))
+        self.executor.apply_mutations()
+        self.assertEqual(state["pos"], (10, 10))
+
+    def test_failed_mutation_reported(self):
+        state = {"pos": (0, 0)}
+
+        def failing():
+            raise RuntimeError("failed")
+
+        def mutation():
+            state["pos"] = (10, 10)
+
+        self.executor.defer(failing)
+        self.executor.defer(mutation)
+        with self.assertLogs(level="ERROR"):
+            self.executor.apply_mutations()
+        self.assertEqual(state["pos"], (10, 10))
+
+    def test_slow_callback_warns(self):
+        with self.assertLogs(level="WARNING"):
+            self.executor.submit(lambda: time.sleep(0.1))
+            time.sleep(0.3)
+
+    def test_reused_after_shutdown(self):
+        release = threading.Event()
+        ran = threading.Event()
+
+        def callback():
+            release.wait(timeout=1)
+
+        self.executor.submit(callback)
+        self.executor.submit(callback)
+        self.executor.submit(callback)
+        self.executor.shutdown()
+        release.set()
+        # Callbacks discarded by the shutdown can run again
+        self.assertTrue(self.executor.submit(ran.set))
+        self.assertTrue(ran.wait(timeout=1))
@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+
+import cvgui
+from cvgui import BlazePose, PoseFeatures
+from cvgui.activity import features as features_module
+
+
+def standing_pose():
+    """A pose with the arms straight out and the legs straight down."""
+    pose = np.zeros((33, 4))
+    for side, x in (("LEFT", 1), ("RIGHT", -1)):
+        for joint, point in (("SHOULDER", (x, 0)), ("ELBOW", (2 * x, 0)),
+                             ("HAND", (3 * x, 0)), ("HIP", (x, 2)),
+                             ("KNEE", (x, 3)), ("FOOT", (x, 4))):
+            pose[getattr(BlazePose, f"{side}_{joint}"), :2] = point
+    return pose
+
+
+class OnePose:
+
+    def __init__(self, pose):
+        self.pose = pose
+
+    def empty(self):
+        return self.pose is None
+
+    def get(self):
+        pose, self.pose = self.pose, None
+        return pose
+
+
+class TestPoseFeatures(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.features = PoseFeatures(standing_pose(), BlazePose, 1.0)
+
+    def test_angles(self):
+        angles = self.features.angles
+        self.assertAlmostEqual(angles[BlazePose.LEFT_ELBOW], 180)
+        self.assertAlmostEqual(angles[BlazePose.RIGHT_SHOULDER], 90)
+        self.assertAlmostEqual(angles[BlazePose.LEFT_KNEE], 180)
+        self.assertAlmostEqual(angles[BlazePose.RIGHT_HIP], 180)
+
+    def test_limb_lengths(self):
+        lengths = self.features.limb_lengths
+        self.assertAlmostEqual(
+            lengths[(BlazePose.LEFT_HIP, BlazePose.LEFT_KNEE)], 1)
+        self.assertAlmostEqual(
+            lengths[(BlazePose.LEFT_SHOULDER, BlazePose.RIGHT_SHOULDER)], 2)
+        self.assertAlmostEqual(self.features.distance(
+            BlazePose.LEFT_HAND, BlazePose.RIGHT_HAND), 6)
+
+    def test_center_of_mass(self):
+        center = self.features.center_of_mass
+        self.assertAlmostEqual(center[0], 0)
+        self.assertTrue(0 < center[1] < 2)
+
+    def test_models_share_index(self):
+        cache = features_module._build_feature_index
+        PoseFeatures(standing_pose(), BlazePose())
+        entries = cache.cache_info().currsize
+        for _ in range(3):
+            PoseFeatures(standing_pose(), BlazePose())
+        self.assertEqual(cache.cache_info().currsize, entries)
+
+    def test_velocities(self):
+        np.testing.assert_array_equal(self.features.speeds, 0)
+        moved = standing_pose()
+        moved[:, 0] += 1
+        features = self.features.next(moved, 1.5)
+        np.testing.assert_allclose(features.velocities[:, 0], 2)
+        np.testing.assert_allclose(features.speeds, 2)
+
+    def test_cached(self):
+        self.assertIs(self.features.angles, self.features.angles)
+        self.assertIs(self.features.center_of_mass,
+                      self.features.center_of_mass)
+
+    def test_activity_features(self):
+        ui = cvgui.HeadlessPyGameUI(100, 100, max_frames=3)
+        activity = cvgui.Activity(pose_input=None, frontend=ui,
+                                  model=BlazePose)
+        scene = cvgui.Scene()
+        seen = []
+        scene.frame_callback = lambda: seen.append(activity.features)
+        activity.add_scene(scene)
+        activity.update_ui(OnePose(standing_pose()))
+        self.assertEqual(len(seen), 3)
+        self.assertAlmostEqual(seen[-1].angles[BlazePose.LEFT_ELBOW], 180)
+        # The features only change when a new pose arrives
+        self.assertIs(seen[-1], seen[-2])
+
+
+if __name__ == "__main__":
+    unittest.main()
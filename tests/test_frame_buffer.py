@@ -0,0 +1,78 @@
+import multiprocessing as mp
+import unittest
+
+import numpy as np
+
+from cvgui.pipeline import FrameBuffer
+from cvgui.user_interface.pygame_ui.headless import HeadlessPyGameUI
+
+
+def _write(frame_buffer, value):
+    frame_buffer.write(np.full((40, 80, 3), value, dtype=np.uint8))
+
+
+def _write_alternating(frame_buffer, frames):
+    black = np.zeros(frame_buffer.shape, dtype=np.uint8)
+    white = np.full(frame_buffer.shape, 255, dtype=np.uint8)
+    for i in range(frames):
+        frame_buffer.write(white if i % 2 else black)
+
+
+class TestFrameBuffer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.frame_buffer = FrameBuffer(height=20, width=40)
+
+    def tearDown(self) -> None:
+        self.frame_buffer.close()
+
+    def test_empty(self):
+        self.assertIsNone(self.frame_buffer.read())
+
+    def test_write_resizes(self):
+        _write(self.frame_buffer, 9)
+        frame = self.frame_buffer.read()
+        self.assertEqual(frame.shape, (20, 40, 3))
+        self.assertTrue(np.all(frame == 9))
+
+    def test_read_frame_unchanged_by_next_write(self):
+        _write(self.frame_buffer, 1)
+        frame = self.frame_buffer.read()
+        _write(self.frame_buffer, 2)
+        self.assertTrue(np.all(frame == 1))
+        self.assertTrue(np.all(self.frame_buffer.read() == 2))
+
+    def test_shared_between_processes(self):
+        process = mp.Process(target=_write, args=(self.frame_buffer, 5))
+        process.start()
+        process.join(timeout=5)
+        self.assertEqual(self.frame_buffer.count, 1)
+        self.assertTrue(np.all(self.frame_buffer.read() == 5))
+
+    def test_reads_never_torn(self):
+        frame_buffer = FrameBuffer(height=480, width=640)
+        writer = mp.Process(target=_write_alternating,
+                            args=(frame_buffer, 2000))
+        writer.start()
+        frame = np.empty(frame_buffer.shape, dtype=np.uint8)
+        reads = 0
+        try:
+            while writer.is_alive() or reads == 0:
+                if frame_buffer.read(frame) is None:
+                    continue
+                reads += 1
+                self.assertEqual(frame.min(), frame.max())
+        finally:
+            writer.join(timeout=10)
+            frame_buffer.close()
+
+    def test_pygame_background(self):
+        frame = np.zeros((20, 40, 3), dtype=np.uint8)
+        # Blue in bgr order
+        frame[:] = (255, 0, 0)
+        self.frame_buffer.write(frame)
+        ui = HeadlessPyGameUI(height=60, width=80,
+                              background=self.frame_buffer)
+        ui.new_gui()
+        ui.clear()
+        self.assertEqual(tuple(ui.get_frame()[30, 40]), (0, 0, 255))
@@ -0,0 +1,143 @@
+import unittest
+
+import numpy as np
+
+import cvgui
+from cvgui.activity.gestures import GestureEngine, GestureType
+from cvgui.user_interface.pygame_ui.pygame import PyGameButton
+from cvgui.user_interface.pygame_ui.pygame import PyGameSkeleton
+
+
+class TestGestureEngine(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.button = PyGameButton(pos=(100, 100), activation_distance=50,
+                                   color=(0, 0, 0, 0), radius=50)
+        self.button.targets = [0]
+        self.button.callback = lambda: None
+        self.engine = GestureEngine(dwell_time=1.0, swipe_targets=[1],
+                                    swipe_distance=100, swipe_time=0.5,
+                                    window=3)
+        self.points = np.zeros((33, 4))
+
+    def types(self, events):
+        return [event.type for event in events]
+
+    def test_enter_is_edge_triggered(self):
+        self.points[0, :2] = (110, 100)
+        events = self.engine.update(self.points, 0.0, [self.button])
+        self.assertEqual(self.types(events), [GestureType.ENTER])
+        events = self.engine.update(self.points, 0.1, [self.button])
+        self.assertEqual(events, [])
+
+    def test_dwell_and_exit(self):
+        self.points[0, :2] = (110, 100)
+        self.engine.update(self.points, 0.0, [self.button])
+        events = self.engine.update(self.points, 1.0, [self.button])
+        self.assertEqual(self.types(events), [GestureType.DWELL])
+        events = self.engine.update(self.points, 1.5, [self.button])
+        self.assertEqual(events, [])
+        self.points[0, :2] = (500, 500)
+        events = self.engine.update(self.points, 2.0, [self.button])
+        self.assertEqual(self.types(events), [GestureType.EXIT])
+
+    def test_button_bound_to_view(self):
+        view = PyGameSkeleton(pos=(100, 100), scale=1)
+        view.update(self.points)
+        self.button.view = view
+        events = self.engine.update(None, 0.0, [self.button])
+        self.assertEqual(self.types(events), [GestureType.ENTER])
+
+    def test_no_view(self):
+        self.assertEqual(self.engine.update(None, 0.0, [self.button]), [])
+
+    def test_swipe(self):
+        for i, x in enumerate([0, 60, 120]):
+            self.points[1, :2] = (x, 0)
+            events = self.engine.update(self.points, i * 0.1)
+        self.assertEqual(self.types(events), [GestureType.SWIPE_RIGHT])
+        self.assertEqual(events[0].target, 1)
+        # A single swipe is only reported once
+        self.points[1, :2] = (180, 0)
+        self.assertEqual(self.engine.update(self.points, 0.3), [])
+
+    def test_slow_movement_is_not_a_swipe(self):
+        for i, y in enumerate([0, -60, -120]):
+            self.points[1, :2] = (0, y)
+            events = self.engine.update(self.points, i * 1.0)
+        self.assertEqual(events, [])
+
+    def test_subscribe_to_component(self):
+        other = PyGameButton(pos=(0, 0), activation_distance=1,
+                             color=(0, 0, 0, 0), radius=1)
+        received = []
+        self.engine.subscribe(GestureType.ENTER, received.append,
+                              component=other)
+        self.engine.subscribe(GestureType.ENTER, received.append)
+        self.points[0, :2] = (100, 100)
+        events = self.engine.update(self.points, 0.0, [self.button])
+        self.assertEqual(len(self.engine.callbacks(events[0])), 1)
+
+    def test_many_buttons(self):
+        buttons = [PyGameButton(pos=(x, 0), activation_distance=10,
+                                color=(0, 0, 0, 0), radius=10)
+                   for x in (0, 100, 200)]
+        for button in buttons:
+            button.targets = [0, 2]
+        buttons[2].targets = [2]
+        self.points[0, :2] = (0, 5)
+        self.points[2, :2] = (105, 0)
+        events = self.engine.update(self.points, 0.0, buttons)
+        self.assertEqual([event.component for event in events],
+                         buttons[:2])
+        # Buttons that stay on screen keep their state
+        self.points[0, :2] = (200, 0)
+        events = self.engine.update(self.points, 0.1, buttons[:2])
+        self.assertEqual(self.types(events), [GestureType.EXIT])
+        self.assertIs(events[0].component, buttons[0])
+
+    def test_occluded_target(self):
+        self.points[0, :2] = (110, 100)
+        visible = np.zeros(33, dtype=bool)
+        events = self.engine.update(self.points, 0.0, [self.button], visible)
+        self.assertEqual(events, [])
+        visible[0] = True
+        events = self.engine.update(self.points, 0.1, [self.button], visible)
+        self.assertEqual(self.types(events), [GestureType.ENTER])
+
+
+class CountingEngine(GestureEngine):
+
+    def __init__(self):
+        super().__init__()
+        self.timestamps = []
+
+    def update(self, points, timestamp, buttons=(), visible=None):
+        self.timestamps.append(timestamp)
+        return super().update(points, timestamp, buttons, visible)
+
+
+class Poses:
+
+    def __init__(self, poses):
+        self.poses = list(poses)
+
+    def empty(self):
+        return not self.poses
+
+    def get(self):
+        return self.poses.pop(0)
+
+
+class TestActivityGestures(unittest.TestCase):
+
+    def test_stepped_once_per_pose(self):
+        pose = np.ones((33, 4))
+        ui = cvgui.HeadlessPyGameUI(height=100, width=100, max_frames=10)
+        activity = cvgui.Activity(pose_input=None, frontend=ui)
+        activity.gestures = CountingEngine()
+        scene = cvgui.Scene()
+        scene.add_component(cvgui.skeleton(gui=ui, pos=(50, 50), scale=10))
+        activity.add_scene(scene)
+        activity.update_ui(Poses([pose, pose]))
+        self.assertEqual(len(activity.gestures.timestamps), 2)
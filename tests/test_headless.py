@@ -0,0 +1,36 @@
+import multiprocessing as mp
+import unittest
+
+import cvgui
+from cvgui.user_interface.pygame_ui.headless import HeadlessPyGameUI
+
+
+class TestHeadlessPyGameUI(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.ui = HeadlessPyGameUI(height=100, width=200, max_frames=3)
+        self.activity = cvgui.Activity(pose_input=None, frontend=self.ui)
+
+    def test_runs_fixed_number_of_frames(self):
+        scene = cvgui.Scene()
+        frames = []
+        scene.frame_callback = lambda: frames.append(1)
+        self.activity.add_scene(scene)
+        self.activity.update_ui(mp.Queue())
+        self.assertEqual(self.ui.frame_count, 3)
+        self.assertEqual(len(frames), 3)
+        self.assertFalse(self.ui.running)
+
+    def test_get_frame(self):
+        scene = cvgui.Scene()
+        button = cvgui.button(gui=self.ui, pos=(150, 50),
+                              activation_distance=5, radius=10,
+                              color=(255, 0, 0, 255))
+        button.targets = []
+        scene.add_component(button)
+        self.activity.add_scene(scene)
+        self.activity.update_ui(mp.Queue())
+        frame = self.ui.get_frame()
+        self.assertEqual(frame.shape, (100, 200, 3))
+        self.assertEqual(tuple(frame[50, 150]), (255, 0, 0))
+        self.assertEqual(tuple(frame[10, 10]), (0, 0, 0))
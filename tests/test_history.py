@@ -0,0 +1,69 @@
+import multiprocessing as mp
+import queue
+import unittest
+
+import numpy as np
+
+from cvgui.pipeline import PoseHistory
+
+
+def _fill(history, count):
+    for i in range(count):
+        history.put(np.full((33, 4), i), timestamp=float(i))
+
+
+class TestPoseHistory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.history = PoseHistory(capacity=4)
+
+    def tearDown(self) -> None:
+        self.history.close()
+
+    def test_empty(self):
+        timestamps, poses = self.history.last(3)
+        self.assertEqual(len(timestamps), 0)
+        self.assertEqual(poses.shape, (0, 33, 4))
+        self.assertIsNone(self.history.latest())
+
+    def test_last_wraps_around(self):
+        _fill(self.history, 6)
+        self.assertEqual(len(self.history), 4)
+        timestamps, poses = self.history.last(4)
+        np.testing.assert_array_equal(timestamps, [2, 3, 4, 5])
+        np.testing.assert_array_equal(poses[:, 0, 0], [2, 3, 4, 5])
+        self.assertEqual(self.history.latest()[0, 0], 5)
+
+    def test_last_is_a_view(self):
+        _fill(self.history, 5)
+        _, poses = self.history.last(2)
+        np.testing.assert_array_equal(poses[:, 0, 0], [3, 4])
+        self.assertFalse(poses.flags.owndata)
+        # Overwriting the oldest pose changes the view
+        for i in range(4):
+            self.history.put(np.full((33, 4), 9), timestamp=9.0)
+        np.testing.assert_array_equal(poses[:, 0, 0], [9, 9])
+
+    def test_since(self):
+        _fill(self.history, 6)
+        timestamps, poses = self.history.since(1.5, now=5.0)
+        np.testing.assert_array_equal(timestamps, [4, 5])
+
+    def test_shared_between_processes(self):
+        process = mp.Process(target=_fill, args=(self.history, 3))
+        process.start()
+        process.join(timeout=5)
+        self.assertEqual(self.history.count, 3)
+        self.assertEqual(self.history.latest()[0, 0], 2)
+
+    def test_reader(self):
+        _fill(self.history, 2)
+        reader = self.history.reader()
+        self.assertTrue(reader.empty())
+        with self.assertRaises(queue.Empty):
+            reader.get(timeout=0.01)
+        _fill(self.history, 3)
+        # Only the newest pose is read
+        self.assertFalse(reader.empty())
+        self.assertEqual(reader.get()[0, 0], 2)
+        self.assertTrue(reader.empty())
@@ -0,0 +1,111 @@
+from pathlib import Path
+import multiprocessing as mp
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from cvgui.outputs.loggers import BinaryPoseLogger, CSVPoseLogger, \
+    read_binary_log
+from cvgui.pipeline.logging_hub import LoggingHub
+
+
+class BrokenSink:
+
+    def write(self, pose_data):
+        raise RuntimeError("broken")
+
+    def flush(self):
+        pass
+
+    def finish(self):
+        pass
+
+
+class RecordingSink:
+
+    def __init__(self):
+        self.poses = []
+        self.finished = False
+
+    def write(self, pose_data):
+        self.poses.append(pose_data)
+
+    def flush(self):
+        pass
+
+    def finish(self):
+        self.finished = True
+
+
+class TestLoggingHub(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_fan_out(self):
+        first, second = RecordingSink(), RecordingSink()
+        hub = LoggingHub([first])
+        hub.add_sink(second)
+        hub.write(np.ones((33, 4)))
+        hub.finish()
+        self.assertEqual(len(first.poses), 1)
+        self.assertEqual(len(second.poses), 1)
+        self.assertTrue(first.finished and second.finished)
+
+    def test_failing_sink_is_isolated(self):
+        broken, working = BrokenSink(), RecordingSink()
+        hub = LoggingHub([broken, working])
+        with self.assertLogs(level="ERROR"):
+            hub.write(np.ones((33, 4)))
+        hub.write(np.ones((33, 4)))
+        self.assertEqual(hub.failed, [broken])
+        self.assertEqual(len(working.poses), 2)
+
+    def test_process(self):
+        hub = LoggingHub([CSVPoseLogger(self.path / "poses.csv"),
+                          BinaryPoseLogger(self.path / "poses.bin")],
+                         poll_interval=0.01)
+        pose_queue = mp.Queue()
+        for i in range(3):
+            pose_queue.put(np.full((33, 4), i))
+        processes = hub.start(pose_queue)
+        hub.close()
+        for process in processes:
+            process.join(timeout=10)
+            self.assertEqual(process.exitcode, 0)
+
+        saved = np.loadtxt(self.path / "poses.csv", delimiter=",",
+                           skiprows=1)
+        np.testing.assert_array_equal(saved[:, 1], [0, 1, 2])
+        records = read_binary_log(self.path / "poses.bin")
+        np.testing.assert_array_equal(records["pose"][:, 0, 0], [0, 1, 2])
+
+    def test_flush_once_poses_stop(self):
+        filepath = self.path / "poses.csv"
+        hub = LoggingHub([CSVPoseLogger(filepath, streaming=True,
+                                        flush_interval=60)],
+                         poll_interval=0.01, flush_interval=0.05)
+        pose_queue = mp.Queue()
+        for i in range(3):
+            pose_queue.put(np.full((33, 4), i))
+        processes = hub.start(pose_queue)
+        try:
+            deadline = time.monotonic() + 10
+            while not filepath.exists() or \
+                    len(filepath.read_text().splitlines()) < 4:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.02)
+        finally:
+            hub.close()
+            for process in processes:
+                process.join(timeout=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+import socket
+import time
+import unittest
+
+import numpy as np
+
+from cvgui.inputs.network import JitterBuffer, NetworkPose, PoseSender
+from cvgui.inputs.network.packets import encode_packet
+from cvgui.pipeline import Channel, ChannelPolicy
+
+
+def pose(value):
+    return np.full((33, 4), value, dtype=np.float32)
+
+
+def free_port(kind):
+    with socket.socket(socket.AF_INET, kind) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class TestJitterBuffer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.buffer = JitterBuffer(min_delay=0.1, max_delay=0.1)
+
+    def test_empty(self):
+        self.assertIsNone(self.buffer.get(0))
+
+    def test_reorders(self):
+        for sequence in [0, 2, 1, 3]:
+            self.buffer.put(sequence, sequence, pose(sequence),
+                            arrival=sequence)
+        self.assertEqual(self.buffer._sequences, [0, 1, 2, 3])
+
+    def test_interpolates_lost_packets(self):
+        self.buffer.put(0, 0.0, pose(0), arrival=1.0)
+        self.buffer.put(2, 2.0, pose(2), arrival=3.0)
+        # Plays one second of transit plus 0.1 seconds behind
+        np.testing.assert_allclose(self.buffer.get(2.1), pose(1))
+
+    def test_holds_when_dry(self):
+        self.buffer.put(0, 0.0, pose(0), arrival=0.0)
+        self.assertIsNone(self.buffer.get(0.05))
+        np.testing.assert_array_equal(self.buffer.get(5), pose(0))
+        np.testing.assert_array_equal(self.buffer.get(6), pose(0))
+
+    def test_late_and_duplicate(self):
+        for sequence in [0, 1, 2]:
+            self.buffer.put(sequence, sequence, pose(sequence), sequence)
+        self.buffer.get(2.1)
+        self.buffer.put(0, 0, pose(0), 3)
+        self.buffer.put(2, 2, pose(2), 3)
+        self.assertEqual(self.buffer.late, 1)
+        self.assertEqual(self.buffer.duplicates, 1)
+
+    def test_restarted_sender(self):
+        for sequence in range(100):
+            self.buffer.put(sequence, sequence, pose(0), sequence)
+        self.buffer.get(99.1)
+        # The sender restarts, numbering packets from 0 again
+        for sequence in range(50):
+            self.buffer.put(sequence, 200 + sequence, pose(1),
+                            200 + sequence)
+        self.assertEqual(self.buffer.late, 0)
+        self.assertEqual(len(self.buffer), 50)
+        np.testing.assert_array_equal(self.buffer.get(249.1), pose(1))
+
+    def test_reset(self):
+        self.buffer.put(5, 5, pose(5), 5)
+        self.buffer.get(5.1)
+        self.buffer.reset()
+        self.buffer.put(0, 100, pose(0), 100)
+        self.assertEqual(self.buffer.late, 0)
+        np.testing.assert_array_equal(self.buffer.get(100.1), pose(0))
+
+    def test_delay_adapts(self):
+        buffer = JitterBuffer(min_delay=0.02, max_delay=0.5)
+        for sequence in range(50):
+            transit = 0.1 * (sequence % 2)
+            buffer.put(sequence, sequence, pose(0), sequence + transit)
+        self.assertGreater(buffer.delay, 0.2)
+
+
+class TestNetworkPose(unittest.TestCase):
+
+    def connect(self, port, protocol, deadline):
+        while True:
+            try:
+                return PoseSender("127.0.0.1", port, protocol)
+            except ConnectionRefusedError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def send_until_received(self, sender, queue, value, deadline):
+        received = None
+        while received is None or received[0, 0] != value:
+            sender.send(pose(value))
+            try:
+                received = queue.get(timeout=0.05)
+            except Exception:  # pylint: disable=broad-except
+                pass
+            if time.monotonic() > deadline:
+                self.fail("No pose received")
+        np.testing.assert_array_equal(received, pose(value))
+
+    def receive(self, protocol, kind):
+        port = free_port(kind)
+        queue = Channel(capacity=1, policy=ChannelPolicy.KEEP_LATEST)
+        generator = NetworkPose(host="127.0.0.1", port=port,
+                                protocol=protocol, rate=100)
+        processes = generator.start([queue])
+        try:
+            deadline = time.monotonic() + 10
+            sender = self.connect(port, protocol, deadline)
+            self.send_until_received(sender, queue, 1, deadline)
+            sender.close()
+        finally:
+            for process in processes:
+                process.kill()
+
+    def test_udp(self):
+        self.receive("udp", socket.SOCK_DGRAM)
+
+    def test_tcp(self):
+        self.receive("tcp", socket.SOCK_STREAM)
+
+    def test_tcp_new_connection(self):
+        port = free_port(socket.SOCK_STREAM)
+        queue = Channel(capacity=1, policy=ChannelPolicy.KEEP_LATEST)
+        processes = NetworkPose(host="127.0.0.1", port=port,
+                                protocol="tcp", rate=100).start([queue])
+        try:
+            deadline = time.monotonic() + 10
+            first = self.connect(port, "tcp", deadline)
+            self.send_until_received(first, queue, 1, deadline)
+            for _ in range(40):
+                first.send(pose(1))
+            first.close()
+            # The new sender numbers its packets from 0 again, behind
+            # every packet the first sender sent
+            second = self.connect(port, "tcp", deadline)
+            for _ in range(20):
+                second.send(pose(2))
+                time.sleep(0.01)
+            received = queue.get(timeout=10)
+            while received[0, 0] != 2:
+                self.assertLess(time.monotonic(), deadline)
+                received = queue.get(timeout=10)
+            second.close()
+        finally:
+            for process in processes:
+                process.kill()
+
+    def test_bad_packets_ignored(self):
+        port = free_port(socket.SOCK_DGRAM)
+        queue = Channel(capacity=1, policy=ChannelPolicy.KEEP_LATEST)
+        processes = NetworkPose(host="127.0.0.1", port=port,
+                                protocol="udp", rate=100).start([queue])
+        try:
+            deadline = time.monotonic() + 10
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as raw:
+                for packet in (b"junk", encode_packet(0, 0.0, pose(3)[:5]),
+                               encode_packet(0, 0.0, pose(3)[:0]),
+                               encode_packet(0, 0.0, pose(3))[:-8]):
+                    raw.sendto(packet, ("127.0.0.1", port))
+            sender = self.connect(port, "udp", deadline)
+            self.send_until_received(sender, queue, 1, deadline)
+            sender.close()
+        finally:
+            for process in processes:
+                process.kill()
+
+    def test_decode(self):
+        generator = NetworkPose()
+        self.assertIsNone(generator.model)
+        self.assertIsNone(generator._decode(b"junk"))
+        self.assertIsNone(generator._decode(
+            encode_packet(0, 0.0, np.zeros((0, 4)))))
+        self.assertIsNone(generator._decode(
+            encode_packet(0, 0.0, np.zeros((17, 4)))))
+        sequence, timestamp, received = generator._decode(
+            encode_packet(4, 2.0, pose(1)))
+        self.assertEqual((sequence, timestamp), (4, 2.0))
+        np.testing.assert_array_equal(received, pose(1))
+
+    def test_model(self):
+        class COCO:
+            NUM_LANDMARKS = 17
+            CONNECTIONS = frozenset()
+
+        generator = NetworkPose(model=COCO)
+        self.assertIs(generator.model, COCO)
+        self.assertIsNotNone(generator._decode(
+            encode_packet(0, 0.0, np.zeros((17, 4)))))
+        self.assertIsNone(generator._decode(encode_packet(0, 0.0, pose(1))))
+
+    def test_unknown_protocol(self):
+        with self.assertRaises(ValueError):
+            NetworkPose(protocol="carrier pigeon")
+
+
+if __name__ == '__main__':
+    unittest.main()
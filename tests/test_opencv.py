@@ -0,0 +1,63 @@
+import multiprocessing as mp
+import unittest
+
+import numpy as np
+
+import cvgui
+from cvgui.user_interface.opencv_ui.opencv import OpenCVUI
+
+
+class TestOpenCVUI(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.ui = OpenCVUI(height=100, width=200, show=False)
+        self.ui.new_gui()
+
+    def test_components_draw_in_place(self):
+        window = self.ui.window
+        button = cvgui.button(gui=self.ui, pos=(150, 50),
+                              activation_distance=5, radius=10,
+                              color=(255, 0, 0, 255))
+        skeleton = cvgui.skeleton(gui=self.ui, pos=(50, 50), scale=10)
+        skeleton.update(np.zeros((33, 4)))
+        self.ui.clear()
+        button.render(self.ui.window)
+        skeleton.render(self.ui.window)
+        self.assertIs(self.ui.window, window)
+        # Red in bgr order
+        self.assertEqual(tuple(window[50, 150]), (0, 0, 255))
+        self.assertEqual(tuple(window[50, 50]), (0, 255, 0))
+        self.assertEqual(tuple(window[5, 5]), (0, 0, 0))
+
+    def test_sinks_get_frame_without_copy(self):
+        frames = []
+        self.ui.add_sink(frames.append)
+        self.ui.update()
+        self.assertIs(frames[0], self.ui.window)
+
+    def test_background_is_resized(self):
+        self.ui.background = np.full((50, 100, 3), 7, dtype=np.uint8)
+        self.ui.clear()
+        self.assertTrue(np.all(self.ui.window == 7))
+
+    def test_clear_to_background_color(self):
+        class BlueUI(OpenCVUI):
+            BACKGROUND = (0, 0, 255)
+
+        ui = BlueUI(height=10, width=20, show=False)
+        ui.new_gui()
+        ui.window[:] = 9
+        ui.clear()
+        self.assertTrue(np.all(ui.window == (255, 0, 0)))
+
+    def test_activity(self):
+        ui = OpenCVUI(height=100, width=100, show=False)
+        frames = []
+        ui.add_sink(lambda frame: frames.append(frame.copy()))
+        activity = cvgui.Activity(pose_input=None, frontend=ui)
+        scene = cvgui.Scene()
+        scene.frame_callback = lambda: len(frames) < 2 or \
+            setattr(ui, "running", False)
+        activity.add_scene(scene)
+        activity.update_ui(mp.Queue())
+        self.assertEqual(len(frames), 3)
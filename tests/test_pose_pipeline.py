@@ -0,0 +1,172 @@
+import functools
+from pathlib import Path
+import multiprocessing as mp
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+import cvgui
+from cvgui.activity.executor import CallbackExecutor
+from cvgui.pipeline import PosePipeline
+
+
+class CountingPoses:
+
+    def start(self, pose_queues):
+        process = mp.Process(target=self._generate, args=(pose_queues,))
+        process.start()
+        return [process]
+
+    def _generate(self, pose_queues):
+        count = 0
+        while True:
+            for queue in pose_queues:
+                queue.put(np.full((33, 4), count))
+            count += 1
+            time.sleep(0.01)
+
+    def get_pose(self):
+        return np.zeros((33, 4))
+
+
+class ReportingActivity(cvgui.Activity):
+
+    def __init__(self, name, results):
+        super().__init__(pose_input=None, frontend=cvgui.HeadlessPyGameUI(
+            100, 100, max_frames=20))
+        self.add_scene(cvgui.Scene())
+        self.name = name
+        self.results = results
+
+    def run_shared(self, history):
+        super().run_shared(history)
+        self.results.put((self.name, history.count))
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.02)
+
+
+class TestPosePipeline(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.pipeline = PosePipeline(CountingPoses(), save_time=0)
+
+    def tearDown(self) -> None:
+        self.pipeline.close()
+        self.directory.cleanup()
+
+    def test_start_once(self):
+        self.pipeline.start()
+        processes = list(self.pipeline.processes)
+        self.pipeline.start()
+        self.assertEqual(self.pipeline.processes, processes)
+
+    def test_attach_detach_sinks(self):
+        for session in range(2):
+            filepath = self.path / f"session_{session}.csv"
+            self.pipeline.attach([cvgui.CSVPoseLogger(
+                filepath, streaming=True, flush_interval=0.05)])
+            wait_for(filepath.exists)
+            self.pipeline.detach()
+            wait_for(lambda: len(filepath.read_text().splitlines()) > 1)
+        self.assertTrue(all(process.is_alive()
+                            for process in self.pipeline.processes))
+
+    def test_activities_reuse_pipeline(self):
+        processes = None
+        for _ in range(2):
+            activity = cvgui.Activity(
+                pose_input=None,
+                frontend=cvgui.HeadlessPyGameUI(100, 100, max_frames=3),
+                pipeline=self.pipeline)
+            activity.add_scene(cvgui.Scene())
+            activity.run()
+            self.assertIsNone(activity.pose_history)
+            if processes is None:
+                processes = list(self.pipeline.processes)
+        self.assertEqual(self.pipeline.processes, processes)
+        self.assertTrue(self.pipeline.running)
+
+    def test_activity_reruns_with_executor(self):
+        calls = []
+
+        def slow_callback():
+            calls.append(time.monotonic())
+            time.sleep(0.2)
+
+        activity = cvgui.Activity(
+            pose_input=None,
+            frontend=cvgui.HeadlessPyGameUI(100, 100, max_frames=3),
+            callback_executor=CallbackExecutor(max_workers=1),
+            pipeline=self.pipeline)
+        scene = cvgui.Scene()
+        scene.frame_callback = slow_callback
+        activity.add_scene(scene)
+        for run in range(2):
+            activity.run()
+            self.assertEqual(len(calls), run + 1)
+
+    def test_activity_group_shares_pose_input(self):
+        results = mp.Queue()
+        self.pipeline.start()
+        wait_for(lambda: self.pipeline.pose_history.count > 0)
+        group = cvgui.ActivityGroup(self.pipeline, [
+            ReportingActivity("console", results),
+            functools.partial(ReportingActivity, "display", results)])
+        group.run()
+        names = set()
+        for _ in range(2):
+            name, count = results.get(timeout=10)
+            names.add(name)
+            self.assertGreater(count, 0)
+        self.assertEqual(names, {"console", "display"})
+        # One pose input and one logging hub serve both activities
+        self.assertEqual(len(self.pipeline.processes), 2)
+        self.assertEqual(group.processes, [])
+
+    def test_shared_activity_reruns_with_executor(self):
+        calls = []
+
+        def slow_callback():
+            calls.append(time.monotonic())
+            time.sleep(0.2)
+
+        self.pipeline.start()
+        activity = ReportingActivity("console", mp.Queue())
+        activity.callback_executor = CallbackExecutor(max_workers=1)
+        activity._scenes[0].frame_callback = slow_callback
+        for run in range(2):
+            activity.run_shared(self.pipeline.pose_history)
+            self.assertEqual(len(calls), run + 1)
+            self.assertIsNone(activity.pose_history)
+
+    def test_closed_logger_does_not_block(self):
+        logger = cvgui.CSVPoseLogger(self.path / "poses.csv")
+        self.pipeline = PosePipeline(CountingPoses(), loggers=[logger],
+                                     logger_channel_capacity=8, save_time=0)
+        self.pipeline.start()
+        wait_for(lambda: self.pipeline.pose_history.count > 0)
+        logger.close()
+        # The pose input would block for good once the closed
+        # logger's channel filled up
+        wait_for(lambda: self.pipeline.pose_history.count > 40)
+
+    def test_activity_loggers_rejected(self):
+        activity = cvgui.Activity(pose_input=None, frontend=None,
+                                  pipeline=self.pipeline)
+        activity.pose_loggers = [cvgui.CSVPoseLogger(self.path / "x.csv")]
+        with self.assertRaises(ValueError):
+            activity.run()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import multiprocessing as mp
+import os
+import types
+import unittest
+from unittest import mock
+
+import cv2
+
+from cvgui.pipeline import LoggingHub, ProcessSettings
+from cvgui.pipeline import process_settings
+
+
+def report_settings(results):
+    results.put((sorted(os.sched_getaffinity(0)),
+                 os.getpriority(os.PRIO_PROCESS, 0),
+                 cv2.getNumThreads(),
+                 os.environ.get("OMP_NUM_THREADS")))
+
+
+class ReportingHub(LoggingHub):
+
+    def __init__(self, results, **kwargs):
+        super().__init__(**kwargs)
+        self.results = results
+
+    def _log_data(self, pose_queue, save_queue):
+        self.settings.apply()
+        report_settings(self.results)
+
+
+@unittest.skipUnless(hasattr(os, "sched_setaffinity"),
+                     "CPU affinity is not supported on this platform")
+class TestProcessSettings(unittest.TestCase):
+
+    def test_defaults_change_nothing(self):
+        cpus = os.sched_getaffinity(0)
+        threads = cv2.getNumThreads()
+        ProcessSettings().apply()
+        self.assertEqual(os.sched_getaffinity(0), cpus)
+        self.assertEqual(cv2.getNumThreads(), threads)
+
+    def test_applied_in_worker(self):
+        cpu = min(os.sched_getaffinity(0))
+        nice = os.getpriority(os.PRIO_PROCESS, 0) + 1
+        results = mp.Queue()
+        hub = ReportingHub(results, settings=ProcessSettings(
+            cpus=[cpu], nice=nice, threads=1))
+        for process in hub.start(mp.Queue()):
+            process.join(10)
+        self.assertEqual(results.get(timeout=10), ([cpu], nice, 1, "1"))
+        # The settings only apply to the worker
+        self.assertNotEqual(os.getpriority(os.PRIO_PROCESS, 0), nice)
+
+
+class FakeProcess:
+
+    settings = {}
+
+    def cpu_affinity(self, cpus):
+        self.settings["cpus"] = cpus
+
+    def nice(self, value):
+        self.settings["nice"] = value
+
+
+FAKE_PSUTIL = types.SimpleNamespace(
+    Process=FakeProcess, IDLE_PRIORITY_CLASS=64,
+    BELOW_NORMAL_PRIORITY_CLASS=16384, NORMAL_PRIORITY_CLASS=32,
+    ABOVE_NORMAL_PRIORITY_CLASS=32768, HIGH_PRIORITY_CLASS=128)
+
+
+class TestProcessSettingsWithoutOs(unittest.TestCase):
+    """Platforms like Windows without affinity or priority in `os`."""
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(
+            process_settings, "os", types.SimpleNamespace())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_applied_with_psutil(self):
+        with mock.patch.object(process_settings, "psutil", FAKE_PSUTIL):
+            ProcessSettings(cpus=(0,), nice=5).apply()
+        self.assertEqual(FakeProcess.settings, {
+            "cpus": [0], "nice": FAKE_PSUTIL.BELOW_NORMAL_PRIORITY_CLASS})
+
+    def test_skipped_without_psutil(self):
+        with mock.patch.object(process_settings, "psutil", None), \
+                self.assertLogs(level="WARNING") as logs:
+            ProcessSettings(cpus=(0,), nice=5).apply()
+        self.assertEqual(len(logs.output), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import multiprocessing as mp
+from pathlib import Path
+import tempfile
+import unittest
+
+import cvgui
+from cvgui.activity.profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.profiler = FrameProfiler(window=4)
+
+    def test_empty_percentiles(self):
+        percentiles = self.profiler.percentiles()
+        self.assertEqual(percentiles["total"]["p99"], 0)
+
+    def test_rolling_window(self):
+        for _ in range(10):
+            self.profiler.start_frame()
+            for stage in range(FrameProfiler.TOTAL):
+                self.profiler.lap(stage)
+            self.profiler.end_frame()
+        self.assertEqual(self.profiler.frame_count, 10)
+        percentiles = self.profiler.percentiles((50, 90))
+        self.assertEqual(set(percentiles), set(FrameProfiler.STAGE_NAMES))
+        self.assertEqual(set(percentiles["render"]), {"p50", "p90"})
+        self.assertEqual(len(self.profiler.summary()),
+                         len(FrameProfiler.STAGE_NAMES))
+
+    def test_activity_profiling_and_dump(self):
+        ui = cvgui.HeadlessPyGameUI(height=100, width=100, max_frames=5)
+        activity = cvgui.Activity(pose_input=None, frontend=ui,
+                                  profiler=self.profiler)
+        scene = cvgui.Scene()
+        scene.add_component(cvgui.PyGameProfilerOverlay(self.profiler))
+        activity.add_scene(scene)
+        activity.update_ui(mp.Queue())
+        self.assertEqual(self.profiler.frame_count, 5)
+
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = Path(directory) / "profile.json"
+            self.profiler.dump(filepath)
+            with open(filepath, encoding="utf-8") as file:
+                profile = json.load(file)
+        self.assertEqual(profile["frames"], 5)
+        self.assertIn("p95", profile["stages_ms"]["update"])
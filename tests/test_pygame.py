@@ -1,6 +1,8 @@
 import unittest
 
-from cvgui.user_interface.pygame_ui.pygame import PyGameButton
+import numpy as np
+
+from cvgui.user_interface.pygame_ui.pygame import PyGameButton, PyGameSkeleton
 
 
 class TestPygameButton(unittest.TestCase):
@@ -14,3 +16,32 @@ class TestPygameButton(unittest.TestCase):
 
     def test_is_clicked_too_far(self):
         self.assertFalse(self.button.is_clicked((100, 0)))
+
+
+class TestPygameSkeleton(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pose = np.zeros((33, 4))
+        self.pose[0] = (1, 2, 3, 0.5)
+        self.raw = self.pose.copy()
+
+    def test_update_does_not_modify_pose(self):
+        skeleton = PyGameSkeleton(pos=(100, 50), scale=10)
+        skeleton.update(self.pose)
+        np.testing.assert_array_equal(self.pose, self.raw)
+        np.testing.assert_array_equal(skeleton.skeleton_points[0],
+                                      (110, 70, 3, 0.5))
+
+    def test_views_are_independent(self):
+        normal = PyGameSkeleton(pos=(100, 50), scale=10)
+        mirrored = PyGameSkeleton(pos=(100, 50), scale=20, mirror=True)
+        normal.update(self.pose)
+        mirrored.update(self.pose)
+        self.assertEqual(tuple(normal.skeleton_points[0, :2]), (110, 70))
+        self.assertEqual(tuple(mirrored.skeleton_points[0, :2]), (80, 90))
+
+    def test_transform_follows_position(self):
+        skeleton = PyGameSkeleton(pos=(0, 0), scale=1)
+        skeleton.pos = (5, 5)
+        skeleton.update(self.pose)
+        self.assertEqual(tuple(skeleton.skeleton_points[0, :2]), (6, 7))
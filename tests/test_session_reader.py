@@ -0,0 +1,71 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+
+from cvgui.outputs.loggers import BinaryPoseLogger, CSVPoseLogger, \
+    SessionReader
+
+
+class TestSessionReader(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def binary_session(self, count=10):
+        logger = BinaryPoseLogger(self.path / "poses.bin", chunk_rows=4)
+        for i in range(count):
+            logger._append(np.full((33, 4), i))
+        # Use predictable timestamps
+        logger._records["timestamp"][:count] = np.arange(count)
+        logger._close_file()
+        return SessionReader(self.path / "poses.bin")
+
+    def test_query_time_range(self):
+        reader = self.binary_session()
+        timestamps, poses = reader.query(2.5, 6)
+        np.testing.assert_array_equal(timestamps, [3, 4, 5])
+        np.testing.assert_array_equal(poses[:, 0, 0], [3, 4, 5])
+        self.assertTrue(np.shares_memory(poses, reader.records))
+
+    def test_query_landmarks(self):
+        reader = self.binary_session()
+        _, poses = reader.query(landmarks=slice(11, 13))
+        self.assertEqual(poses.shape, (10, 2, 4))
+        self.assertTrue(np.shares_memory(poses, reader.records))
+        _, poses = reader.query(0, 2, landmarks=[16, 15])
+        self.assertEqual(poses.shape, (2, 2, 4))
+
+    def test_empty_range(self):
+        reader = self.binary_session()
+        timestamps, poses = reader.query(20, 30)
+        self.assertEqual(len(timestamps), 0)
+        self.assertEqual(len(poses), 0)
+
+    def test_chunks(self):
+        reader = self.binary_session()
+        chunks = list(reader.chunks(size=4, start=1))
+        self.assertEqual([len(timestamps) for timestamps, _ in chunks],
+                         [4, 4, 1])
+        np.testing.assert_array_equal(chunks[-1][1][:, 0, 0], [9])
+
+    def test_csv(self):
+        logger = CSVPoseLogger(self.path / "poses.csv")
+        for i in range(5):
+            logger._append(np.full((33, 4), i))
+        logger._save_to_csv()
+        reader = SessionReader(self.path / "poses.csv")
+        self.assertTrue(reader.binary_path.exists())
+        self.assertEqual(len(reader), 5)
+        np.testing.assert_array_equal(reader.poses[:, 32, 3], range(5))
+        # The binary copy is reused
+        self.assertEqual(len(SessionReader(self.path / "poses.csv")), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
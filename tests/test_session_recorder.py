@@ -0,0 +1,77 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from cvgui.outputs.recorders import SessionRecorder
+
+
+class TestSessionRecorder(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = Path(self.directory.name) / "session.avi"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_record(self):
+        recorder = SessionRecorder(self.filepath, max_pending=16)
+        process, = recorder.start()
+        for index in range(5):
+            frame = np.full((48, 64, 3), index * 40, dtype=np.uint8)
+            self.assertTrue(recorder.record(frame, index, 100.0 + index))
+        # Inference skipped the second frame
+        for pose_row, frame_index in enumerate([0, 2, 3, 4]):
+            recorder.mark_pose(frame_index, pose_row)
+        recorder.close()
+        process.join(timeout=10)
+        self.assertEqual(process.exitcode, 0)
+
+        video = cv2.VideoCapture(str(self.filepath))
+        self.assertEqual(video.get(cv2.CAP_PROP_FRAME_COUNT), 5)
+        video.release()
+        sidecar = np.loadtxt(recorder.sidecar_path, delimiter=",",
+                             skiprows=1)
+        np.testing.assert_array_equal(sidecar[:, 0], range(5))
+        np.testing.assert_array_equal(sidecar[:, 2], 100 + np.arange(5))
+        np.testing.assert_array_equal(sidecar[:, 3], [0, -1, 1, 2, 3])
+
+    def test_segments(self):
+        recorder = SessionRecorder(self.filepath)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        first, = recorder.start()
+        recorder.record(frame, 0, 0.0)
+        recorder.mark_pose(0, 0)
+        first_frames = recorder._frame_queue
+        recorder.new_segment()
+        second, = recorder.start()
+        recorder.record(frame, 1, 0.0)
+        recorder.mark_pose(1, 1)
+        # The first segment finishing late must not take the pose
+        # rows of the second
+        first_frames.put(None)
+        first.join(timeout=10)
+        recorder.close()
+        second.join(timeout=10)
+        self.assertTrue(self.filepath.with_name("session_0001.avi").exists())
+        self.assertEqual(
+            recorder.sidecar_path.read_text().splitlines()[1:],
+            ["0,0,0.000000,0"])
+        self.assertEqual(
+            self.filepath.with_name(
+                "session_0001.frames.csv").read_text().splitlines()[1:],
+            ["0,1,0.000000,1"])
+
+    def test_drops_when_full(self):
+        recorder = SessionRecorder(self.filepath, max_pending=2)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        results = [recorder.record(frame, index, 0.0) for index in range(4)]
+        self.assertFalse(all(results))
+        self.assertEqual(recorder.dropped, results.count(False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+from pathlib import Path
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from cvgui.outputs.streaming import PoseStreamClient, PoseStreamServer, \
+    decode_pose, encode_frame, FRAME_HEADER
+
+
+async def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        await asyncio.sleep(0.01)
+
+
+class TestFraming(unittest.TestCase):
+
+    def test_round_trip(self):
+        pose = np.arange(33 * 4).reshape(33, 4)
+        frame = encode_frame(pose, 12.5)
+        self.assertEqual(len(frame), FRAME_HEADER.size + 33 * 4 * 4)
+        timestamp, decoded = decode_pose(frame[:FRAME_HEADER.size],
+                                         frame[FRAME_HEADER.size:])
+        self.assertEqual(timestamp, 12.5)
+        np.testing.assert_array_equal(decoded, pose)
+
+
+class TestPoseStreamServer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = PoseStreamServer(port=0)
+
+    def tearDown(self) -> None:
+        self.server.finish()
+
+    def receive(self, clients, poses):
+        async def run():
+            async def read(client):
+                await client.connect()
+                await wait_for(lambda: self.server.subscribers == clients)
+                return [(await client.receive())[1][0, 0]
+                        for _ in range(poses)]
+
+            async def send():
+                await wait_for(lambda: self.server.subscribers == clients)
+                for i in range(poses):
+                    self.server.write(np.full((33, 4), i))
+
+            host, port = self.server.address
+            readers = [read(PoseStreamClient(host, port))
+                       for _ in range(clients)]
+            results = await asyncio.gather(send(), *readers)
+            return results[1:]
+        return asyncio.run(run())
+
+    def test_multiple_subscribers(self):
+        self.server.start_server()
+        for received in self.receive(clients=2, poses=5):
+            np.testing.assert_array_equal(received, range(5))
+
+    def test_slow_subscriber_drops_oldest(self):
+        server = PoseStreamServer(port=0, buffer_size=2)
+        server.start_server()
+
+        async def run():
+            host, port = server.address
+            async with PoseStreamClient(host, port):
+                await wait_for(lambda: server.subscribers == 1)
+                subscriber = next(iter(server._subscribers))
+                # Writing never waits on the subscriber
+                for i in range(10000):
+                    server.write(np.full((33, 4), i))
+                await wait_for(lambda: subscriber.dropped > 0)
+        try:
+            asyncio.run(run())
+        finally:
+            server.finish()
+
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "poses.sock"
+            server = PoseStreamServer(path=path)
+            server.start_server()
+
+            async def run():
+                async with PoseStreamClient(path=path) as client:
+                    await wait_for(lambda: server.subscribers == 1)
+                    server.write(np.ones((33, 4)))
+                    _, pose = await client.receive()
+                    return pose
+            try:
+                np.testing.assert_array_equal(asyncio.run(run()),
+                                              np.ones((33, 4)))
+            finally:
+                server.finish()
+            self.assertFalse(path.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import multiprocessing as mp
+import time
+import unittest
+
+import numpy as np
+
+import cvgui
+from cvgui.pipeline import Channel, ChannelPolicy, Heartbeat, Stage, \
+    Supervisor
+
+
+def beat_then_stall(heartbeat, beats):
+    for _ in range(beats):
+        heartbeat.beat()
+        time.sleep(0.01)
+    time.sleep(60)
+
+
+class StallingWorker:
+
+    def __init__(self):
+        self.heartbeat = Heartbeat()
+        self.process = None
+
+    def restart(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.join()
+        self.process = mp.Process(target=beat_then_stall,
+                                  args=(self.heartbeat, 20))
+        self.process.start()
+        return [self.process]
+
+
+class CameraFrames:
+    """Frames too big to fit in a pipe."""
+
+    def get_frame(self):
+        time.sleep(0.01)
+        return np.zeros((480, 640, 3), dtype=np.uint8)
+
+
+class StandingModel:
+
+    def get_pose(self, frame):
+        return np.ones((33, 4))
+
+
+class TestHeartbeat(unittest.TestCase):
+
+    def test_beat(self):
+        heartbeat = Heartbeat()
+        self.assertEqual(heartbeat.last_beat, 0)
+        heartbeat.beat()
+        heartbeat.beat(0)
+        self.assertEqual(heartbeat.count, 1)
+        self.assertAlmostEqual(heartbeat.last_beat, time.monotonic(),
+                               delta=1)
+
+
+class TestSupervisor(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.heartbeat = Heartbeat()
+        self.restarts = 0
+
+    def restart(self):
+        self.restarts += 1
+        return []
+
+    def supervisor(self, **kwargs):
+        return Supervisor([Stage("test", self.heartbeat, self.restart)],
+                          stall_timeout=1, startup_timeout=5, **kwargs)
+
+    def test_stall(self):
+        supervisor = self.supervisor()
+        self.heartbeat.beat()
+        now = time.monotonic()
+        self.assertEqual(supervisor.check(now), [])
+        self.assertEqual(supervisor.check(now + 2), ["test"])
+        self.assertEqual(supervisor.restarts, {"test": 1})
+
+    def test_startup_grace(self):
+        supervisor = self.supervisor()
+        now = time.monotonic()
+        self.assertEqual(supervisor.check(now + 4), [])
+        self.assertEqual(supervisor.check(now + 6), ["test"])
+
+    def test_throughput_collapse(self):
+        supervisor = self.supervisor(min_rate=10)
+        now = time.monotonic()
+        self.heartbeat.beat()
+        supervisor.check(now)
+        # Beating without doing any work
+        self.heartbeat.beat(0)
+        self.assertEqual(supervisor.check(time.monotonic() + 0.5), [])
+        self.heartbeat._last_beat.value = now + 1.5
+        self.assertEqual(supervisor.check(now + 1.5), ["test"])
+
+    def test_recovery_time(self):
+        supervisor = self.supervisor()
+        self.heartbeat.beat()
+        stalled = self.heartbeat.last_beat
+        supervisor.check(stalled + 2)
+        self.heartbeat._last_beat.value = stalled + 3
+        supervisor.check(stalled + 3)
+        self.assertEqual(supervisor.recovery_times, [("test", 3)])
+
+    def test_restarts_worker(self):
+        worker = StallingWorker()
+        worker.restart()
+        supervisor = Supervisor(
+            [Stage("worker", worker.heartbeat, worker.restart)],
+            stall_timeout=0.5, check_interval=0.05)
+        supervisor.start()
+        try:
+            deadline = time.monotonic() + 10
+            while not supervisor.recovery_times:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.05)
+        finally:
+            supervisor.stop()
+            worker.process.kill()
+        self.assertLess(supervisor.recovery_times[0][1], 2)
+
+
+class TestComputerVisionRestart(unittest.TestCase):
+
+    def test_stages_stop_without_being_killed(self):
+        poses = Channel(capacity=4, policy=ChannelPolicy.DROP_OLDEST)
+        pose_input = cvgui.ComputerVisionPose(
+            CameraFrames(), StandingModel(), show_video=False)
+        old = pose_input.start([poses])
+        try:
+            poses.get(timeout=10)
+            new = pose_input.restart()
+            # Stopped between frames, so the pose channel they
+            # shared with the pipeline is still usable
+            self.assertEqual([process.exitcode for process in old], [0, 0])
+            poses.get(timeout=10)
+        finally:
+            pose_input._stop_stages()
+        self.assertEqual([process.exitcode for process in new], [0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+
+import numpy as np
+
+import cvgui
+from cvgui.activity.gestures import GestureEngine, GestureType
+from cvgui.core.receiving import COCO_CONNECTIONS, COCO_LANDMARKS
+from cvgui.user_interface.opencv_ui.opencv import OpenCVUI
+
+
+class CocoModel:
+    """A stand in for a 17 keypoint model."""
+
+    NUM_LANDMARKS = COCO_LANDMARKS
+    CONNECTIONS = COCO_CONNECTIONS
+    LEFT_HAND = 9
+    LEFT_ELBOW = 7
+    LEFT_SHOULDER = 5
+    LEFT_HIP = 11
+    LEFT_KNEE = 13
+    LEFT_FOOT = 15
+    RIGHT_HAND = 10
+    RIGHT_ELBOW = 8
+    RIGHT_SHOULDER = 6
+    RIGHT_HIP = 12
+    RIGHT_KNEE = 14
+    RIGHT_FOOT = 16
+
+
+class TestTopology(unittest.TestCase):
+
+    def test_blazepose_topology(self):
+        self.assertEqual(cvgui.BlazePose.NUM_LANDMARKS, 33)
+        self.assertLess(cvgui.BlazePose.CONNECTIONS.max(), 33)
+        self.assertEqual(cvgui.BlazePose().pose_array.shape, (33, 4))
+
+    def test_default_skeleton_is_blazepose(self):
+        ui = cvgui.HeadlessPyGameUI(height=100, width=100)
+        skeleton = cvgui.skeleton(gui=ui, pos=(50, 50), scale=10)
+        self.assertEqual(skeleton.skeleton_points.shape, (33, 4))
+        np.testing.assert_array_equal(skeleton.connections,
+                                      cvgui.BlazePose.CONNECTIONS)
+
+    def test_skeletons_sized_from_model(self):
+        pose = np.random.default_rng(0).uniform(-1, 1, (17, 4))
+        pygame_ui = cvgui.HeadlessPyGameUI(height=100, width=100)
+        pygame_ui.new_gui()
+        opencv_ui = OpenCVUI(height=100, width=100, show=False)
+        opencv_ui.new_gui()
+        for ui in (pygame_ui, opencv_ui):
+            skeleton = cvgui.skeleton(gui=ui, pos=(50, 50), scale=10,
+                                      model=CocoModel)
+            skeleton.update(pose)
+            skeleton.render(ui.window)
+            self.assertEqual(skeleton.skeleton_points.shape, (17, 4))
+        self.assertGreater(opencv_ui.window.sum(), 0)
+
+    def test_skeletons_without_model_follow_poses(self):
+        pose = np.random.default_rng(0).uniform(-1, 1, (17, 4))
+        pygame_ui = cvgui.HeadlessPyGameUI(height=100, width=100)
+        pygame_ui.new_gui()
+        opencv_ui = OpenCVUI(height=100, width=100, show=False)
+        opencv_ui.new_gui()
+        for ui in (pygame_ui, opencv_ui):
+            skeleton = cvgui.skeleton(gui=ui, pos=(50, 50), scale=10,
+                                      visibility_threshold=0.5)
+            skeleton.update(pose)
+            skeleton.render(ui.window)
+            self.assertEqual(skeleton.skeleton_points.shape, (17, 4))
+            np.testing.assert_array_equal(skeleton.connections,
+                                          COCO_CONNECTIONS)
+            # Layouts that aren't known are drawn without limbs
+            skeleton.update(np.zeros((5, 4)))
+            skeleton.render(ui.window)
+            self.assertEqual(skeleton.connections.shape, (0, 2))
+        self.assertGreater(opencv_ui.window.sum(), 0)
+
+    def test_targets_missing_from_model_are_ignored(self):
+        ui = cvgui.HeadlessPyGameUI(height=100, width=100)
+        button = cvgui.button(gui=ui, pos=(10, 10),
+                              activation_distance=5, radius=5)
+        button.targets = [CocoModel.LEFT_HAND, 20]
+        button.callback = lambda: None
+        points = np.zeros((17, 4))
+        points[CocoModel.LEFT_HAND, :2] = (10, 10)
+        events = GestureEngine().update(points, 0.0, [button])
+        self.assertEqual([event.type for event in events],
+                         [GestureType.ENTER])
+
+    def test_activity_sized_from_model(self):
+        ui = cvgui.HeadlessPyGameUI(height=100, width=100, max_frames=2)
+        activity = cvgui.Activity(pose_input=None, frontend=ui,
+                                  model=CocoModel)
+        scene = cvgui.Scene()
+        scene.add_component(cvgui.skeleton(gui=ui, pos=(50, 50), scale=10,
+                                           model=CocoModel))
+        activity.add_scene(scene)
+        # No poses arrive, so the skeleton shows the empty pose
+        activity.update_ui(cvgui.PoseHistory(capacity=1).reader())
+        self.assertEqual(ui.frame_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+import multiprocessing as mp
+import queue
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import cvgui
+from cvgui.activity.gestures import GestureEngine
+from cvgui.core.receiving import detected, visible
+from cvgui.user_interface.opencv_ui.opencv import OpenCVUI
+from cvgui.user_interface.pygame_ui.pygame import PyGameSkeleton
+
+
+class NoPerson:
+
+    def process(self, frame):
+        return type("Result", (), {"pose_world_landmarks": None})()
+
+
+class BlankFrames:
+
+    def get_frame(self):
+        return np.zeros((4, 4, 3), dtype=np.uint8)
+
+
+class FlakyFrames:
+    """A frame input where every other read fails."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def get_frame(self):
+        self.reads += 1
+        time.sleep(0.01)
+        if self.reads % 2:
+            return np.zeros((0, 0, 3), dtype=np.uint8)
+        return np.full((4, 4, 3), self.reads, dtype=np.uint8)
+
+
+class MissingFrames(FlakyFrames):
+    """A frame input that returns no frame at all on failed reads."""
+
+    def get_frame(self):
+        frame = super().get_frame()
+        return frame if frame.size > 0 else None
+
+
+class FrameSizeModel:
+    """A model that reports the size of every frame it is given."""
+
+    def __init__(self, sizes):
+        self.sizes = sizes
+
+    def get_pose(self, frame):
+        self.sizes.put(frame.size)
+        return np.ones((33, 4))
+
+
+class EmptyModel:
+    """A model that never finds anyone."""
+
+    def get_pose(self, frame):
+        return np.zeros((33, 4))
+
+
+class OnePose:
+
+    def __init__(self, pose):
+        self.pose = pose
+
+    def empty(self):
+        return self.pose is None
+
+    def get(self):
+        pose, self.pose = self.pose, None
+        return pose
+
+
+def half_visible_pose():
+    pose = np.zeros((33, 4))
+    pose[:, 3] = 1
+    pose[16:, 3] = 0.2
+    return pose
+
+
+class TestVisibility(unittest.TestCase):
+
+    def test_detected(self):
+        self.assertFalse(detected(np.zeros((33, 4))))
+        self.assertTrue(detected(half_visible_pose()))
+        # Poses without a visibility column are always detected
+        self.assertTrue(detected(np.zeros((17, 3))))
+
+    def test_visible(self):
+        pose = half_visible_pose()
+        self.assertEqual(visible(pose, 0.5).sum(), 16)
+        self.assertTrue(visible(pose, None).all())
+
+    def test_blazepose_without_person(self):
+        model = cvgui.BlazePose()
+        model.pose_array[:] = 1
+        model.model = NoPerson()
+        # Stands in for a pose returned while someone was found
+        earlier = model.pose_array
+        pose = model.get_pose(np.zeros((4, 4, 3), dtype=np.uint8))
+        self.assertFalse(detected(pose))
+        self.assertTrue(detected(earlier))
+        np.testing.assert_array_equal(pose[:, :3], earlier[:, :3])
+
+    def test_empty_poses_sent_once(self):
+        poses = mp.Queue()
+        pose_input = cvgui.ComputerVisionPose(BlankFrames(), EmptyModel(),
+                                              show_video=False)
+        processes = pose_input.start([poses])
+        try:
+            self.assertFalse(detected(poses.get(timeout=10)))
+            with self.assertRaises(queue.Empty):
+                poses.get(timeout=0.5)
+            self.assertGreater(pose_input.inference_heartbeat.count, 1)
+        finally:
+            for process in processes:
+                process.kill()
+
+    def test_failed_reads_not_processed(self):
+        sizes = mp.Queue()
+        pose_input = cvgui.ComputerVisionPose(
+            FlakyFrames(), FrameSizeModel(sizes), show_video=False)
+        processes = pose_input.start([mp.Queue()])
+        try:
+            for _ in range(5):
+                self.assertGreater(sizes.get(timeout=10), 0)
+        finally:
+            for process in processes:
+                process.kill()
+        # Failed reads don't advance the frame index
+        self.assertLessEqual(pose_input._frame_index.value,
+                             pose_input.capture_heartbeat.count)
+
+    def test_failed_reads_not_shown(self):
+        for frames in (FlakyFrames(), MissingFrames()):
+            sizes = mp.Queue()
+            pose_input = cvgui.ComputerVisionPose(frames, EmptyModel(),
+                                                  show_video=True)
+            with mock.patch("cv2.imshow", lambda _, frame: sizes.put(
+                    frame.size)), mock.patch("cv2.waitKey"):
+                processes = pose_input.start([mp.Queue()])
+            try:
+                for _ in range(5):
+                    self.assertGreater(sizes.get(timeout=10), 0)
+            finally:
+                for process in processes:
+                    process.kill()
+
+    def test_skeleton_hides_occluded_landmarks(self):
+        ui = OpenCVUI(height=100, width=100, show=False)
+        ui.new_gui()
+        skeleton = cvgui.skeleton(gui=ui, pos=(50, 50), scale=10,
+                                  visibility_threshold=0.5)
+        skeleton.update(half_visible_pose())
+        self.assertEqual(skeleton.visible.sum(), 16)
+        connections = skeleton.connections
+        np.testing.assert_array_equal(skeleton.limbs_visible,
+                                      (connections < 16).all(axis=1))
+        skeleton.update(np.zeros((33, 4)))
+        self.assertFalse(skeleton.visible.any())
+        skeleton.render(ui.window)
+        self.assertEqual(ui.window.sum(), 0)
+
+        # Occluded landmarks are moved away from the visible ones
+        pose = half_visible_pose()
+        pose[16:, :2] = 3
+        for threshold, occluded_drawn in ((0.5, False), (None, True)):
+            pygame_ui = cvgui.HeadlessPyGameUI(height=100, width=100)
+            pygame_ui.new_gui()
+            skeleton = cvgui.skeleton(gui=pygame_ui, pos=(50, 50), scale=10,
+                                      visibility_threshold=threshold)
+            skeleton.update(pose)
+            skeleton.render(pygame_ui.window)
+            frame = pygame_ui.get_frame()
+            np.testing.assert_array_equal(frame[50, 50],
+                                          PyGameSkeleton.LANDMARK_COLOR)
+            self.assertEqual(
+                (frame[80, 80] == PyGameSkeleton.LANDMARK_COLOR).all(),
+                occluded_drawn)
+            # Limbs between visible and occluded landmarks are not drawn
+            self.assertEqual(
+                (frame[65, 65] == PyGameSkeleton.LIMB_COLOR).all(),
+                occluded_drawn)
+
+    def test_occluded_targets_do_not_click(self):
+        ui = cvgui.HeadlessPyGameUI(height=100, width=100)
+        for threshold, events in ((0.5, 0), (None, 1)):
+            skeleton = cvgui.skeleton(gui=ui, pos=(0, 0), scale=1,
+                                      visibility_threshold=threshold)
+            button = cvgui.button(gui=ui, pos=(0, 0),
+                                  activation_distance=5, radius=5)
+            button.targets = [20]
+            button.callback = lambda: None
+            button.view = skeleton
+            skeleton.update(half_visible_pose())
+            self.assertEqual(
+                len(GestureEngine().update(None, 0.0, [button])), events)
+
+    def test_missing_person_not_shown(self):
+        for pose, clicks in ((np.zeros((33, 4)), 0),
+                             (half_visible_pose(), 1)):
+            ui = cvgui.HeadlessPyGameUI(height=100, width=100, max_frames=2)
+            activity = cvgui.Activity(pose_input=None, frontend=ui)
+            scene = cvgui.Scene()
+            skeleton = cvgui.skeleton(gui=ui, pos=(50, 50), scale=10)
+            button = cvgui.button(gui=ui, pos=(50, 50),
+                                  activation_distance=5, radius=5)
+            button.targets = [0]
+            calls = []
+            button.callback = lambda calls=calls: calls.append(True)
+            scene.add_component(button)
+            scene.add_component(skeleton)
+            activity.add_scene(scene)
+            activity.update_ui(OnePose(pose))
+            self.assertEqual(len(calls), clicks)
+            # Skeletons of missing people are neither moved nor drawn
+            self.assertEqual(skeleton.skeleton_points.any(), bool(clicks))
+            self.assertEqual(
+                np.all(ui.get_frame() == PyGameSkeleton.LANDMARK_COLOR,
+                       axis=-1).any(), bool(clicks))
+
+
+if __name__ == "__main__":
+    unittest.main()